@@ -61,6 +61,14 @@ setup(
         "youtube": [
             "yt-dlp>=2023.11.16",
         ],
+        "langid": [
+            "pycld3>=0.22",
+        ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "orjson>=3.8.0",
+            "blake3>=0.3.0",
+        ],
         "all": [
             "openai-whisper>=20231117",
             "faster-whisper>=0.9.0",
@@ -6,14 +6,6 @@ __email__ = "your.email@example.com"
 __description__ = "Video speech recognition and subtitle generation with multiple Whisper engines"
 
 from .config.settings import settings
-from .core.transcriber import TranscriptionService
-from .engines import (
-    OpenAIWhisperEngine,
-    FasterWhisperEngine,
-    WhisperKitEngine,
-    WhisperCppEngine,
-    AlibabaASREngine,
-)
 
 __all__ = [
     "settings",
@@ -23,4 +15,24 @@ __all__ = [
     "WhisperKitEngine",
     "WhisperCppEngine",
     "AlibabaASREngine",
-]
\ No newline at end of file
+]
+
+_LAZY_EXPORTS = {
+    "TranscriptionService": ".core.transcription",
+    "OpenAIWhisperEngine": ".engines",
+    "FasterWhisperEngine": ".engines",
+    "WhisperKitEngine": ".engines",
+    "WhisperCppEngine": ".engines",
+    "AlibabaASREngine": ".engines",
+}
+
+
+def __getattr__(name):
+    # Engines pull in torch and friends, so only import them when asked for;
+    # this keeps ``import whisper_subtitle.cli`` cheap
+    if name in _LAZY_EXPORTS:
+        import importlib
+        
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
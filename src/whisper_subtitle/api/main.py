@@ -11,7 +11,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
 from ..config.settings import settings
-from ..core.service import TranscriptionService
+from ..core.service import get_transcription_service
 from ..tasks.scheduler import TaskScheduler
 from ..tasks.youtube_fetcher import YouTubeFetcher
 from .routes import transcription, upload, models, youtube
@@ -30,9 +30,16 @@ async def lifespan(app: FastAPI):
     Path("downloads").mkdir(parents=True, exist_ok=True)
     
     # Initialize transcription service
-    transcription_service = TranscriptionService(settings)
+    transcription_service = get_transcription_service(settings)
     app.state.transcription_service = transcription_service
     
+    # Load the default model now so the first request doesn't pay for it
+    if settings.preload_models:
+        try:
+            await transcription_service.preload(settings.default_engine, settings.default_model)
+        except Exception as e:
+            logger.warning(f"Failed to preload {settings.default_engine}/{settings.default_model}: {e}")
+    
     # Initialize task scheduler
     scheduler = TaskScheduler()
     await scheduler.start()
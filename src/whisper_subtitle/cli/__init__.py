@@ -1,6 +1,14 @@
 """Command-line interface module for the whisper subtitle generator."""
 
 from .main import main, cli
-from .commands import transcribe, server, youtube
 
-__all__ = ['main', 'cli', 'transcribe', 'server', 'youtube']
\ No newline at end of file
+__all__ = ['main', 'cli', 'transcribe', 'server', 'youtube']
+
+
+def __getattr__(name):
+    # Command modules load on first access, like the subcommands of ``cli``
+    if name in ('transcribe', 'server', 'youtube'):
+        import importlib
+        
+        return importlib.import_module(f".commands.{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,5 @@
 """CLI commands module."""
 
-from . import transcribe, server, youtube, translate, social
-
+# Submodules are imported on demand (``from .commands import youtube``) so that
+# loading one command does not pull in the dependencies of all the others.
 __all__ = ['transcribe', 'server', 'youtube', 'translate', 'social']
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""Event loop helper shared by the CLI commands."""
+
+import asyncio
+import sys
+
+
+def run(coro):
+    """Run a command coroutine, on uvloop when it is installed.
+    
+    The uvloop loop is created explicitly rather than by installing its
+    event loop policy, which would change the loop every later
+    ``asyncio.run`` in the process gets.
+    
+    Args:
+        coro: Coroutine to run to completion
+        
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    
+    # Same teardown as asyncio.run on the versions without loop_factory
+    loop = uvloop.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
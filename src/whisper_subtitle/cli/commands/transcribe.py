@@ -2,6 +2,7 @@
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
@@ -11,12 +12,27 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from rich.table import Table
 from rich.panel import Panel
 
-from ...core.service import TranscriptionService
+from ...config.settings import settings
+from ...core.engines.registry import registry
+from ...core.transcription import get_transcription_service
 from ...utils.subtitle import SubtitleProcessor
+from ._runner import run as _run
 
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _cached_engines() -> dict:
+    """Get engine status information, probing engines only once per process.
+    
+    Engine discovery is stable for the lifetime of a CLI run.
+    
+    Returns:
+        Mapping of engine names to engine status information
+    """
+    return registry.get_all_engines_info()
+
+
 @click.command()
 @click.argument('input_path', type=click.Path(exists=True, path_type=Path))
 @click.option(
@@ -99,14 +115,15 @@ def transcribe(
     """
     
     async def run_transcription():
+        nonlocal model, language, output
         service = None
         try:
             # Initialize transcription service
             console.print("[bold blue]Initializing transcription service...[/bold blue]")
-            service = TranscriptionService()
+            service = get_transcription_service(settings)
             
             # Check if engine is available
-            engines = await service.get_available_engines()
+            engines = _cached_engines()
             if engine not in engines:
                 console.print(f"[red]Engine '{engine}' is not available[/red]")
                 available = [name for name, info in engines.items() if info['ready']]
@@ -122,11 +139,8 @@ def transcribe(
             
             # Set default model if not specified
             if not model:
-                engine_instance = await service.get_engine(engine)
-                available_models = await engine_instance.get_available_models()
-                if available_models:
-                    model = available_models[0]  # Use first available model
-                    console.print(f"[dim]Using default model: {model}[/dim]")
+                model = service.settings.get_engine_config(engine).default_model
+                console.print(f"[dim]Using default model: {model}[/dim]")
             
             # Set default language if not specified
             if not language:
@@ -165,7 +179,8 @@ def transcribe(
                         engine=engine,
                         model=model,
                         language=language,
-                        output_format=format
+                        output_format=format,
+                        output_path=output
                     )
                     
                     progress.update(task, completed=100, total=100)
@@ -179,45 +194,25 @@ def transcribe(
                 console.print(f"[red]Transcription failed: {result.error}[/red]")
                 return False
             
-            # Post-process segments if requested
-            segments = result.segments
-            
-            if filter_segments:
-                console.print("[dim]Filtering segments...[/dim]")
-                segments = SubtitleProcessor.filter_segments(
-                    segments,
-                    min_duration=min_duration,
-                    min_chars=1
-                )
-            
-            if merge_short:
-                console.print("[dim]Merging short segments...[/dim]")
-                segments = SubtitleProcessor.merge_short_segments(
-                    segments,
-                    max_duration=max_duration
-                )
-            
-            if split_long:
-                console.print("[dim]Splitting long segments...[/dim]")
-                segments = SubtitleProcessor.split_long_segments(
-                    segments,
-                    max_duration=max_duration,
-                    max_chars=max_chars
-                )
-            
-            # Save output
-            console.print(f"[dim]Saving to {output}...[/dim]")
+            # The engine has written the output; rewrite it only when the
+            # segments are post-processed
+            segments = result.segments or []
             
             try:
-                if format == 'srt':
-                    content = SubtitleProcessor.segments_to_srt(segments)
-                elif format == 'vtt':
-                    content = SubtitleProcessor.segments_to_vtt(segments)
-                else:  # txt
-                    content = SubtitleProcessor.segments_to_text(segments)
-                
-                with open(output, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                if filter_segments or merge_short or split_long:
+                    console.print("[dim]Post-processing segments...[/dim]")
+                    segments = SubtitleProcessor.postprocess(
+                        segments,
+                        filter=filter_segments,
+                        merge=merge_short,
+                        split=split_long,
+                        min_duration=min_duration,
+                        max_duration=max_duration,
+                        max_chars=max_chars
+                    )
+                    
+                    console.print(f"[dim]Saving to {output}...[/dim]")
+                    SubtitleProcessor.save_subtitle_file(segments, output, format)
                 
                 console.print(f"[green]✓ Transcription completed successfully![/green]")
                 console.print(f"[green]Output saved to: {output}[/green]")
@@ -247,7 +242,7 @@ def transcribe(
                 await service.cleanup()
     
     # Run the async function
-    success = asyncio.run(run_transcription())
+    success = _run(run_transcription())
     if not success:
         sys.exit(1)
 
@@ -314,6 +309,7 @@ def batch(
     """
     
     async def run_batch_transcription():
+        nonlocal output_dir
         service = None
         try:
             # Find files to process
@@ -352,7 +348,7 @@ def batch(
             console.print(f"[bold blue]Found {len(files)} files to transcribe[/bold blue]")
             
             # Initialize service
-            service = TranscriptionService()
+            service = get_transcription_service(settings)
             
             # Process files with progress
             with Progress(
@@ -376,22 +372,12 @@ def batch(
                                 file_path=str(file_path),
                                 engine=engine,
                                 model=model,
-                                language=language,
-                                output_format=format
+                                language=language or 'auto',
+                                output_format=format,
+                                output_path=output_path
                             )
                             
                             if result.success:
-                                # Save output
-                                if format == 'srt':
-                                    content = result.to_srt()
-                                elif format == 'vtt':
-                                    content = result.to_vtt()
-                                else:
-                                    content = result.to_text()
-                                
-                                with open(output_path, 'w', encoding='utf-8') as f:
-                                    f.write(content)
-                                
                                 console.print(f"[green]✓ {file_path.name}[/green]")
                                 return True
                             else:
@@ -431,6 +417,6 @@ def batch(
                 await service.cleanup()
     
     # Run the async function
-    success = asyncio.run(run_batch_transcription())
+    success = _run(run_batch_transcription())
     if not success:
         sys.exit(1)
\ No newline at end of file
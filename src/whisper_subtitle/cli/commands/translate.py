@@ -1,17 +1,143 @@
 """Translation CLI commands."""
 
 import asyncio
+import atexit
 import click
+import fnmatch
 import logging
+import os
+import re
+import sys
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
 
-from ...services.translation import TranslationService, TranslationConfig
 from ...config.settings import get_settings
+from ...services.translation_common import (
+    DEFAULT_BUFFER_SIZE,
+    SUPPORTED_LANGUAGES,
+    TEMP_SUFFIX,
+    copy_subtitle_file,
+    is_same_language,
+)
+from ._runner import run as _run
+
+if TYPE_CHECKING:
+    from ...services.translation import TranslationService
 
 logger = logging.getLogger(__name__)
 
 
+# Services built so far, keyed on their options; closed at exit
+_services: Dict[tuple, "TranslationService"] = {}
+
+
+def _close_services() -> None:
+    """Close the cached services and their translation caches."""
+    while _services:
+        _, service = _services.popitem()
+        service.close()
+
+
+def _make_service(access_key_id: Optional[str], access_key_secret: Optional[str],
+                  endpoint: str, region_id: str, max_connections: int = 10,
+                  use_cache: bool = True):
+    """Build a translation service, reusing it for repeated option sets.
+    
+    Only available services are reused, so a client that failed to
+    initialise is tried again on the next call.
+    
+    Args:
+        access_key_id: Alibaba Cloud Access Key ID, or None to use settings
+        access_key_secret: Alibaba Cloud Access Key Secret, or None to use settings
+        endpoint: Alibaba Cloud endpoint
+        region_id: Alibaba Cloud region ID
+        max_connections: Maximum number of concurrent translation requests
+        use_cache: Whether to consult the local translation cache
+        
+    Returns:
+        TranslationService instance, or None if no credentials are configured
+    """
+    key = (access_key_id, access_key_secret, endpoint, region_id, max_connections, use_cache)
+    service = _services.get(key)
+    if service is not None:
+        return service
+    
+    # Imported here so that unrelated commands don't pay for the translation SDK
+    from ...services.translation import TranslationService, TranslationConfig, TranslationCache
+    
+    settings = get_settings()
+    
+    # Use provided credentials or fall back to settings
+    config = TranslationConfig(
+        access_key_id=access_key_id or getattr(settings, 'ALIBABA_ACCESS_KEY_ID', None),
+        access_key_secret=access_key_secret or getattr(settings, 'ALIBABA_ACCESS_KEY_SECRET', None),
+        endpoint=endpoint,
+        region_id=region_id
+    )
+    
+    if not config.access_key_id or not config.access_key_secret:
+        return None
+    
+    cache = TranslationCache() if use_cache else None
+    service = TranslationService(config, max_connections=max_connections, cache=cache)
+    if not service.is_available():
+        # Callers stop at the availability check; don't hold the cache open
+        service.close()
+        return service
+    
+    if not _services:
+        atexit.register(_close_services)
+    _services[key] = service
+    return service
+
+
+def _is_up_to_date(input_file: Path, output_file: Path) -> bool:
+    """Check whether an output file is a complete translation of its input.
+    
+    The batch translates in strict mode, so it never writes an output in
+    which some cues fell back to the original text.
+    
+    Args:
+        input_file: Path to the source subtitle file
+        output_file: Path to the translated subtitle file
+        
+    Returns:
+        True if the output exists, is non-empty and is not older than the input
+    """
+    try:
+        output_stat = output_file.stat()
+    except FileNotFoundError:
+        return False
+    
+    return output_stat.st_size > 0 and output_stat.st_mtime >= input_file.stat().st_mtime
+
+
+def _iter_matching_files(directory: Path, pattern: str) -> Iterator[Path]:
+    """Yield files in a directory whose name matches a glob pattern.
+    
+    The pattern is compiled once and matched against names from a single
+    os.scandir pass. Patterns spanning directories fall back to Path.glob.
+    
+    Args:
+        directory: Directory to scan
+        pattern: Glob pattern to match
+        
+    Yields:
+        Paths of matching files
+    """
+    if '/' in pattern or os.sep in pattern:
+        yield from directory.glob(pattern)
+        return
+    
+    match = re.compile(fnmatch.translate(pattern)).match
+    
+    with os.scandir(directory) as it:
+        for entry in it:
+            if match(entry.name) and entry.is_file():
+                yield Path(entry.path)
+
+
 @click.group()
 def translate():
     """Translation commands for subtitle files."""
@@ -27,56 +153,58 @@ def translate():
 @click.option('--access-key-secret', help='Alibaba Cloud Access Key Secret')
 @click.option('--endpoint', default='mt.cn-hangzhou.aliyuncs.com', help='Alibaba Cloud endpoint')
 @click.option('--region-id', default='cn-hangzhou', help='Alibaba Cloud region ID')
+@click.option('--no-cache', is_flag=True, help='Do not use the local translation cache')
+@click.option('--buffer-size', type=click.IntRange(min=1), help='Read/write buffer size in bytes (default: 1 MiB)')
 def file(input_file: Path, output_file: Path, source_lang: str, target_lang: str,
          access_key_id: Optional[str], access_key_secret: Optional[str],
-         endpoint: str, region_id: str):
+         endpoint: str, region_id: str, no_cache: bool, buffer_size: Optional[int]):
     """Translate a subtitle file.
     
     INPUT_FILE: Path to the input SRT file
     OUTPUT_FILE: Path to save the translated SRT file
     """
+    buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+    
+    if is_same_language(source_lang, target_lang):
+        copy_subtitle_file(str(input_file), str(output_file))
+        click.echo(f"✅ Source and target language are the same, copied to: {output_file}")
+        return
+    
     async def _translate_file():
         try:
-            # Get configuration
-            settings = get_settings()
-            
-            # Use provided credentials or fall back to settings
-            config = TranslationConfig(
-                access_key_id=access_key_id or getattr(settings, 'ALIBABA_ACCESS_KEY_ID', None),
-                access_key_secret=access_key_secret or getattr(settings, 'ALIBABA_ACCESS_KEY_SECRET', None),
-                endpoint=endpoint,
-                region_id=region_id
+            translation_service = _make_service(
+                access_key_id, access_key_secret, endpoint, region_id, 10, not no_cache
             )
             
-            if not config.access_key_id or not config.access_key_secret:
+            if translation_service is None:
                 click.echo("Error: Alibaba Cloud credentials not provided. Use --access-key-id and --access-key-secret options or set environment variables.", err=True)
                 return
             
             # Initialize translation service
-            translation_service = TranslationService(config)
-            
-            if not translation_service.is_available():
-                click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
-                return
-            
-            click.echo(f"Translating {input_file} from {source_lang} to {target_lang}...")
-            
-            # Translate file
-            success = await translation_service.translate_subtitle_file_path(
-                str(input_file), str(output_file), source_lang, target_lang
-            )
-            
-            if success:
-                click.echo(f"✅ Translation completed successfully: {output_file}")
-            else:
-                click.echo("❌ Translation failed. Check logs for details.", err=True)
+            async with translation_service:
+                if not translation_service.is_available():
+                    click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
+                    return
+                
+                click.echo(f"Translating {input_file} from {source_lang} to {target_lang}...")
+                
+                # Translate file
+                success = await translation_service.translate_subtitle_file_path(
+                    str(input_file), str(output_file), source_lang, target_lang,
+                    buffer_size=buffer_size
+                )
+                
+                if success:
+                    click.echo(f"✅ Translation completed successfully: {output_file}")
+                else:
+                    click.echo("❌ Translation failed. Check logs for details.", err=True)
                 
         except Exception as e:
             click.echo(f"❌ Translation error: {e}", err=True)
             logger.error(f"Translation error: {e}")
     
     # Run async function
-    asyncio.run(_translate_file())
+    _run(_translate_file())
 
 
 @translate.command()
@@ -87,63 +215,58 @@ def file(input_file: Path, output_file: Path, source_lang: str, target_lang: str
 @click.option('--access-key-secret', help='Alibaba Cloud Access Key Secret')
 @click.option('--endpoint', default='mt.cn-hangzhou.aliyuncs.com', help='Alibaba Cloud endpoint')
 @click.option('--region-id', default='cn-hangzhou', help='Alibaba Cloud region ID')
+@click.option('--no-cache', is_flag=True, help='Do not use the local translation cache')
 def text(text: str, source_lang: str, target_lang: str,
          access_key_id: Optional[str], access_key_secret: Optional[str],
-         endpoint: str, region_id: str):
+         endpoint: str, region_id: str, no_cache: bool):
     """Translate a single text.
     
     TEXT: Text to translate
     """
+    if is_same_language(source_lang, target_lang):
+        click.echo(f"\n📝 Original: {text}")
+        click.echo(f"🌐 Translated: {text}")
+        return
+    
     async def _translate_text():
         try:
-            # Get configuration
-            settings = get_settings()
-            
-            # Use provided credentials or fall back to settings
-            config = TranslationConfig(
-                access_key_id=access_key_id or getattr(settings, 'ALIBABA_ACCESS_KEY_ID', None),
-                access_key_secret=access_key_secret or getattr(settings, 'ALIBABA_ACCESS_KEY_SECRET', None),
-                endpoint=endpoint,
-                region_id=region_id
+            translation_service = _make_service(
+                access_key_id, access_key_secret, endpoint, region_id, 10, not no_cache
             )
             
-            if not config.access_key_id or not config.access_key_secret:
+            if translation_service is None:
                 click.echo("Error: Alibaba Cloud credentials not provided. Use --access-key-id and --access-key-secret options or set environment variables.", err=True)
                 return
             
             # Initialize translation service
-            translation_service = TranslationService(config)
-            
-            if not translation_service.is_available():
-                click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
-                return
-            
-            click.echo(f"Translating text from {source_lang} to {target_lang}...")
-            
-            # Translate text
-            translated_text = await translation_service.translate_text(text, source_lang, target_lang)
-            
-            click.echo(f"\n📝 Original: {text}")
-            click.echo(f"🌐 Translated: {translated_text}")
+            async with translation_service:
+                if not translation_service.is_available():
+                    click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
+                    return
+                
+                click.echo(f"Translating text from {source_lang} to {target_lang}...")
+                
+                # Translate text
+                translated_text = await translation_service.translate_text(text, source_lang, target_lang)
+                
+                click.echo(f"\n📝 Original: {text}")
+                click.echo(f"🌐 Translated: {translated_text}")
                 
         except Exception as e:
             click.echo(f"❌ Translation error: {e}", err=True)
             logger.error(f"Translation error: {e}")
     
     # Run async function
-    asyncio.run(_translate_text())
+    _run(_translate_text())
 
 
 @translate.command()
 def languages():
     """List supported languages."""
-    translation_service = TranslationService()
-    supported_languages = translation_service.get_supported_languages()
-    
     click.echo("\n🌐 Supported Languages:")
     click.echo("=" * 40)
     
-    for code, name in supported_languages.items():
+    for code, name in SUPPORTED_LANGUAGES.items():
         click.echo(f"{code:8} - {name}")
     
     click.echo("\n💡 Use 'auto' for automatic language detection")
@@ -155,84 +278,234 @@ def languages():
 @click.option('--source-lang', '-s', default='auto', help='Source language code (auto for auto-detection)')
 @click.option('--target-lang', '-t', default='en', help='Target language code')
 @click.option('--pattern', default='*.srt', help='File pattern to match (default: *.srt)')
+@click.option('--concurrency', '-j', default=8, type=click.IntRange(min=1), help='Maximum number of files translated at once')
 @click.option('--access-key-id', help='Alibaba Cloud Access Key ID')
 @click.option('--access-key-secret', help='Alibaba Cloud Access Key Secret')
 @click.option('--endpoint', default='mt.cn-hangzhou.aliyuncs.com', help='Alibaba Cloud endpoint')
 @click.option('--region-id', default='cn-hangzhou', help='Alibaba Cloud region ID')
+@click.option('--no-cache', is_flag=True, help='Do not use the local translation cache')
+@click.option('--buffer-size', type=click.IntRange(min=1), help='Read/write buffer size in bytes (default: 1 MiB)')
+@click.option('--force/--no-force', default=False, help='Retranslate files whose output is already up to date')
 def batch(input_dir: Path, output_dir: Path, source_lang: str, target_lang: str,
-          pattern: str, access_key_id: Optional[str], access_key_secret: Optional[str],
-          endpoint: str, region_id: str):
+          pattern: str, concurrency: int, access_key_id: Optional[str],
+          access_key_secret: Optional[str], endpoint: str, region_id: str, no_cache: bool,
+          buffer_size: Optional[int], force: bool):
     """Translate multiple subtitle files in a directory.
     
+    Files whose output already exists, is non-empty and is newer than the
+    input are skipped unless --force is given, so an interrupted batch can
+    simply be run again to resume.
+    
     INPUT_DIR: Directory containing subtitle files
     OUTPUT_DIR: Directory to save translated files
     """
+    buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+    same_language = is_same_language(source_lang, target_lang)
+    
     async def _translate_batch():
         try:
-            # Get configuration
-            settings = get_settings()
-            
-            # Use provided credentials or fall back to settings
-            config = TranslationConfig(
-                access_key_id=access_key_id or getattr(settings, 'ALIBABA_ACCESS_KEY_ID', None),
-                access_key_secret=access_key_secret or getattr(settings, 'ALIBABA_ACCESS_KEY_SECRET', None),
-                endpoint=endpoint,
-                region_id=region_id
-            )
+            if same_language:
+                # Files are only copied, which needs no credentials or API;
+                # imported here so that unrelated commands don't pay for the
+                # translation SDK
+                from ...services.translation import TranslationService
+                translation_service = TranslationService()
+            else:
+                translation_service = _make_service(
+                    access_key_id, access_key_secret, endpoint, region_id, concurrency, not no_cache
+                )
             
-            if not config.access_key_id or not config.access_key_secret:
+            if translation_service is None:
                 click.echo("Error: Alibaba Cloud credentials not provided. Use --access-key-id and --access-key-secret options or set environment variables.", err=True)
                 return
             
-            # Initialize translation service
-            translation_service = TranslationService(config)
-            
-            if not translation_service.is_available():
-                click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
-                return
-            
-            # Find subtitle files
-            subtitle_files = list(input_dir.glob(pattern))
+            # Initialize translation service; the context shares one request pool
+            # and cache across every file in the batch
+            async with translation_service:
+                if not same_language and not translation_service.is_available():
+                    click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
+                    return
+                
+                # Discover files lazily; workers start translating as soon as
+                # the first match is queued
+                subtitle_files = _iter_matching_files(input_dir, pattern)
+                queue = asyncio.Queue(maxsize=concurrency * 2)
+                counts = Counter()
+                
+                async def _produce():
+                    try:
+                        for subtitle_file in subtitle_files:
+                            if not counts["found"]:
+                                # Create output directory
+                                output_dir.mkdir(parents=True, exist_ok=True)
+                                click.echo(f"Translating files from {source_lang} to {target_lang}")
+                            
+                            counts["found"] += 1
+                            output_file = output_dir / f"{subtitle_file.stem}_{target_lang}{subtitle_file.suffix}"
+                            
+                            if not force and _is_up_to_date(subtitle_file, output_file):
+                                click.echo(f"  ⏭  Skipped (up to date): {subtitle_file.name}")
+                                counts["skipped"] += 1
+                                continue
+                            
+                            # Remove the partial output an interrupted run left
+                            # for this file; other temp files are not ours
+                            Path(f"{output_file}{TEMP_SUFFIX}").unlink(missing_ok=True)
+                            await queue.put((subtitle_file, output_file))
+                    finally:
+                        # One sentinel per worker so none is left waiting
+                        for _ in range(concurrency):
+                            await queue.put(None)
+                
+                async def _worker():
+                    while True:
+                        job = await queue.get()
+                        if job is None:
+                            return
+                        
+                        subtitle_file, output_file = job
+                        
+                        try:
+                            # A cue left untranslated would make the output look
+                            # up to date to the next run, so fail the file instead
+                            success = await translation_service.translate_subtitle_file_path(
+                                str(subtitle_file), str(output_file), source_lang, target_lang,
+                                buffer_size=buffer_size, strict=True
+                            )
+                        except Exception as e:
+                            logger.error(f"Failed to translate {subtitle_file}: {e}")
+                            success = False
+                        
+                        if success:
+                            click.echo(f"  ✅ {subtitle_file.name} -> {output_file.name}")
+                            counts["successful"] += 1
+                        else:
+                            click.echo(f"  ❌ Failed: {subtitle_file.name}")
+                            counts["failed"] += 1
+                
+                await asyncio.gather(_produce(), *(_worker() for _ in range(concurrency)))
+                
+                if not counts["found"]:
+                    click.echo(f"No files found matching pattern '{pattern}' in {input_dir}")
+                    return
+                
+                click.echo(f"\n📊 Batch translation completed:")
+                click.echo(f"  📁 Files: {counts['found']}")
+                click.echo(f"  ✅ Successful: {counts['successful']}")
+                click.echo(f"  ⏭  Skipped: {counts['skipped']}")
+                click.echo(f"  ❌ Failed: {counts['failed']}")
+                
+        except Exception as e:
+            click.echo(f"❌ Batch translation error: {e}", err=True)
+            logger.error(f"Batch translation error: {e}")
+    
+    # Run async function
+    _run(_translate_batch())
+
+
+@translate.command()
+@click.option('--source-lang', '-s', default='auto', help='Default source language when a line omits it')
+@click.option('--target-lang', '-t', default='en', help='Default target language when a line omits it')
+@click.option('--concurrency', '-j', default=8, type=click.IntRange(min=1), help='Maximum number of files translated at once')
+@click.option('--access-key-id', help='Alibaba Cloud Access Key ID')
+@click.option('--access-key-secret', help='Alibaba Cloud Access Key Secret')
+@click.option('--endpoint', default='mt.cn-hangzhou.aliyuncs.com', help='Alibaba Cloud endpoint')
+@click.option('--region-id', default='cn-hangzhou', help='Alibaba Cloud region ID')
+@click.option('--no-cache', is_flag=True, help='Do not use the local translation cache')
+@click.option('--buffer-size', type=click.IntRange(min=1), help='Read/write buffer size in bytes (default: 1 MiB)')
+def daemon(source_lang: str, target_lang: str, concurrency: int, access_key_id: Optional[str],
+           access_key_secret: Optional[str], endpoint: str, region_id: str, no_cache: bool,
+           buffer_size: Optional[int]):
+    """Translate subtitle files listed on stdin with one long-lived service.
+    
+    Each input line is tab separated: INPUT<TAB>OUTPUT[<TAB>SRC[<TAB>TGT]].
+    Missing languages fall back to --source-lang/--target-lang. One result
+    line (OK or FAIL) is written to stdout per job, in completion order.
+    """
+    # Imported here so that unrelated commands don't pay for the translation SDK
+    from ...services.translation import TranslationService
+    
+    buffer_size = buffer_size or DEFAULT_BUFFER_SIZE
+    same_language = is_same_language(source_lang, target_lang)
+    
+    async def _translate_daemon():
+        try:
+            translation_service = _make_service(
+                access_key_id, access_key_secret, endpoint, region_id, concurrency, not no_cache
+            )
             
-            if not subtitle_files:
-                click.echo(f"No files found matching pattern '{pattern}' in {input_dir}")
+            # Without a service only jobs whose languages match, which are
+            # copied, can run; that is fine if the defaults match
+            if translation_service is None and not same_language:
+                click.echo("Error: Alibaba Cloud credentials not provided. Use --access-key-id and --access-key-secret options or set environment variables.", err=True)
                 return
             
-            # Create output directory
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            click.echo(f"Found {len(subtitle_files)} files to translate from {source_lang} to {target_lang}")
+            if translation_service is not None and not translation_service.is_available():
+                if not same_language:
+                    click.echo("Error: Translation service is not available. Please check your Alibaba Cloud configuration.", err=True)
+                    return
+                translation_service = None
             
-            # Translate each file
-            successful = 0
-            failed = 0
+            # Copies same-language jobs without calling the API
+            copier = TranslationService()
             
-            for subtitle_file in subtitle_files:
-                output_file = output_dir / f"{subtitle_file.stem}_{target_lang}{subtitle_file.suffix}"
+            # One service for the daemon's lifetime keeps the request pool and
+            # cache warm across jobs
+            async with translation_service or copier:
+                loop = asyncio.get_event_loop()
+                semaphore = asyncio.Semaphore(concurrency)
+                pending = set()
                 
-                click.echo(f"\n📄 Translating: {subtitle_file.name}")
+                async def _translate_job(input_path: str, output_path: str, src: str, tgt: str):
+                    try:
+                        service = copier if is_same_language(src, tgt) else translation_service
+                        if service is None:
+                            raise RuntimeError("translation service not available")
+                        success = await service.translate_subtitle_file_path(
+                            input_path, output_path, src, tgt, buffer_size=buffer_size
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to translate {input_path}: {e}")
+                        success = False
+                    finally:
+                        semaphore.release()
+                    
+                    status = "OK" if success else "FAIL"
+                    click.echo(f"{status}\t{input_path}\t{output_path}")
                 
-                success = await translation_service.translate_subtitle_file_path(
-                    str(subtitle_file), str(output_file), source_lang, target_lang
-                )
+                while True:
+                    # stdin reads block, so keep them off the event loop
+                    line = await loop.run_in_executor(None, sys.stdin.readline)
+                    if not line:
+                        break
+                    
+                    line = line.rstrip("\r\n")
+                    if not line.strip():
+                        continue
+                    
+                    fields = line.split("\t")
+                    if len(fields) < 2 or len(fields) > 4:
+                        click.echo(f"ERROR\tmalformed line: {line}", err=True)
+                        continue
+                    
+                    input_path, output_path = fields[0], fields[1]
+                    src = fields[2] if len(fields) > 2 and fields[2] else source_lang
+                    tgt = fields[3] if len(fields) > 3 and fields[3] else target_lang
+                    
+                    await semaphore.acquire()
+                    task = asyncio.ensure_future(_translate_job(input_path, output_path, src, tgt))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
                 
-                if success:
-                    click.echo(f"  ✅ Saved: {output_file.name}")
-                    successful += 1
-                else:
-                    click.echo(f"  ❌ Failed: {subtitle_file.name}")
-                    failed += 1
-            
-            click.echo(f"\n📊 Batch translation completed:")
-            click.echo(f"  ✅ Successful: {successful}")
-            click.echo(f"  ❌ Failed: {failed}")
+                if pending:
+                    await asyncio.gather(*pending)
                 
         except Exception as e:
-            click.echo(f"❌ Batch translation error: {e}", err=True)
-            logger.error(f"Batch translation error: {e}")
+            click.echo(f"❌ Translation daemon error: {e}", err=True)
+            logger.error(f"Translation daemon error: {e}")
     
     # Run async function
-    asyncio.run(_translate_batch())
+    _run(_translate_daemon())
 
 
 if __name__ == '__main__':
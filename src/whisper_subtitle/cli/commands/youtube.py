@@ -1,23 +1,277 @@
 """YouTube monitoring CLI commands."""
 
-import asyncio
+import atexit
+import shutil
 import sys
-from typing import Optional, Dict, Any
+from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from importlib.util import find_spec
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 
 import click
-import httpx
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+if TYPE_CHECKING:
+    import asyncio
+    import httpx
 
 console = Console()
 
+# Event loop shared by every coroutine this module runs, created on first use
+_loop: Optional["asyncio.AbstractEventLoop"] = None
+
+# Spinner display shared by every command, created on first use and only
+# running while a spinner is shown
+_progress: Optional[Progress] = None
+
+# Option validators shared by every command that accepts them
+_ENGINE_CHOICE = click.Choice(['openai_whisper', 'faster_whisper', 'whisperkit', 'whispercpp', 'alibaba_asr'])
+_FORMAT_CHOICE = click.Choice(['srt', 'vtt', 'txt'])
+_FORMAT_CHOICE_WITH_JSON = click.Choice(['srt', 'vtt', 'txt', 'json'])
+_STATUS_CHOICE = click.Choice(['pending', 'running', 'completed', 'failed', 'cancelled'])
+
+# Prebuilt message prefixes; messages are appended as plain Text so API
+# error details are never parsed as markup
+_ERR_PREFIX = Text("✗ ", style="red")
+_OK_PREFIX = Text("✓ ", style="green")
+
+# Prebuilt status cells, so table rendering doesn't run the markup parser
+_STATUS_ENABLED = Text("Enabled", style="green")
+_STATUS_DISABLED = Text("Disabled", style="red")
+_STATUS_MAP = {
+    'completed': Text("Completed", style="green"),
+    'running': Text("Running", style="blue"),
+    'failed': Text("Failed", style="red"),
+    'cancelled': Text("Cancelled", style="yellow"),
+}
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' natively since Python 3.11
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=32)
+def _status_title(status: str) -> Text:
+    """Build the display cell for a task status without a dedicated style."""
+    return Text(status.title())
+
+
+def _run(coro):
+    """Run a coroutine on the module's persistent event loop.
+    
+    Reusing one loop avoids setting up and tearing down a loop, selector and
+    default executor for every call. The loop is closed at interpreter exit.
+    
+    Args:
+        coro: Coroutine to run to completion
+        
+    Returns:
+        The coroutine's result
+    """
+    global _loop
+    if _loop is None:
+        import asyncio
+        
+        _loop = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+    return _loop.run_until_complete(coro)
+
+
+def _close_loop() -> None:
+    """Tear down the persistent loop the way asyncio.run does."""
+    import asyncio
+    
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        pending = asyncio.all_tasks(loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        if sys.version_info >= (3, 9):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
 
-def get_client(host: str, port: int, timeout: int) -> httpx.Client:
-    """Get HTTP client for API requests."""
+
+def _get_progress() -> Progress:
+    """Get the shared spinner display, creating it on first use.
+    
+    The object is reused so its columns are only built once; it is started
+    and stopped by _spinner, so nothing renders between spinners.
+    """
+    global _progress
+    if _progress is None:
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        )
+    return _progress
+
+
+@contextmanager
+def _spinner(description: str):
+    """Show a spinner with the given description while the block runs."""
+    progress = _get_progress()
+    # The first spinner starts the display and the last one to finish stops
+    # it, so output printed afterwards is not redrawn over
+    if not progress.tasks:
+        progress.start()
+    task = progress.add_task(description, total=None)
+    try:
+        yield
+    finally:
+        progress.remove_task(task)
+        if not progress.tasks:
+            progress.stop()
+
+
+def _json(response: "httpx.Response") -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    return _loads(response.content)
+
+
+def _error_msg(response: "httpx.Response") -> str:
+    """Extract an error message from a failed API response.
+    
+    Args:
+        response: Response with a non-success status code
+        
+    Returns:
+        The JSON 'detail' field when present, otherwise the HTTP status
+    """
+    fallback = f"HTTP {response.status_code}"
+    if response.headers.get('content-type', '').startswith('application/json'):
+        try:
+            data = _json(response)
+        except ValueError:
+            return fallback
+        if isinstance(data, dict):
+            return data.get('detail', fallback)
+    return fallback
+
+
+def _api_command(error_label: str):
+    """Decorate a command with the shared API error handling.
+    
+    Connection failures and unexpected errors are reported on the console and
+    turn into exit status 1; the traceback is shown in verbose mode.
+    
+    Args:
+        error_label: Message prefix for unexpected errors, e.g. "Error adding channel"
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(ctx, *args, **kwargs):
+            try:
+                return func(ctx, *args, **kwargs)
+            except click.ClickException:
+                raise
+            except _httpx().ConnectError:
+                host, port = kwargs.get('host'), kwargs.get('port')
+                console.print(_ERR_PREFIX + Text(f"Cannot connect to API server at {host}:{port}", style="red"))
+                console.print("[dim]Make sure the server is running[/dim]")
+                sys.exit(1)
+            except Exception as e:
+                console.print(_ERR_PREFIX + Text(f"{error_label}: {e}", style="red"))
+                if ctx.obj and ctx.obj.get('verbose'):
+                    console.print_exception()
+                sys.exit(1)
+        
+        return wrapper
+    
+    return decorator
+
+
+def _key_value_text(rows) -> Text:
+    """Render label/value pairs as aligned lines of a single Text.
+    
+    Args:
+        rows: Sequence of (label, value) tuples
+        
+    Returns:
+        Text with one bold, padded label and its value per line
+    """
+    width = max(len(label) for label, _ in rows)
+    return Text("\n").join(
+        Text.assemble((label.ljust(width + 1), "bold"), str(value))
+        for label, value in rows
+    )
+
+
+def _timestamp_formatter():
+    """Create a formatter that parses and formats each timestamp only once.
+    
+    API listings often repeat timestamps (e.g. rows from the same poll cycle),
+    so results are memoized per (value, pattern) for the formatter's lifetime.
+    
+    Returns:
+        Function taking (value, pattern, default) and returning the formatted
+        timestamp, or default if the value cannot be parsed
+    """
+    cache = {}
+    
+    def fmt(value: str, pattern: str, default: str) -> str:
+        key = (value, pattern)
+        result = cache.get(key)
+        if result is None:
+            try:
+                result = _parse_iso(value).strftime(pattern)
+            except (TypeError, ValueError):
+                result = None
+            cache[key] = result
+        return default if result is None else result
+    
+    return fmt
+
+
+def _httpx():
+    """Import httpx on first use, since only commands that call the API need it."""
+    import httpx
+    return httpx
+
+
+@lru_cache(maxsize=8)
+def get_client(host: str, port: int, timeout: int) -> "httpx.Client":
+    """Get HTTP client for API requests.
+    
+    Clients are cached per server and timeout so that commands run in the same
+    process reuse pooled connections. They are closed at interpreter exit.
+    """
+    httpx = _httpx()
     base_url = f"http://{host}:{port}"
-    return httpx.Client(base_url=base_url, timeout=timeout)
+    
+    # Keep idle connections around long enough to span interactive use, and
+    # negotiate HTTP/2 when the h2 package is installed
+    transport = httpx.HTTPTransport(
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=30.0),
+        http2=find_spec("h2") is not None,
+        retries=1
+    )
+    client = httpx.Client(base_url=base_url, timeout=timeout, transport=transport)
+    atexit.register(client.close)
+    return client
 
 
 @click.group()
@@ -31,7 +285,7 @@ def youtube():
 @click.argument('channel_name')
 @click.option(
     '--engine', '-e',
-    type=click.Choice(['openai_whisper', 'faster_whisper', 'whisperkit', 'whispercpp', 'alibaba_asr']),
+    type=_ENGINE_CHOICE,
     default='openai_whisper',
     help='Speech recognition engine to use'
 )
@@ -46,7 +300,7 @@ def youtube():
 )
 @click.option(
     '--format', '-f',
-    type=click.Choice(['srt', 'vtt', 'txt']),
+    type=_FORMAT_CHOICE,
     default='srt',
     help='Output format for transcriptions'
 )
@@ -68,6 +322,7 @@ def youtube():
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error adding channel")
 def add(
     ctx,
     channel_id: str,
@@ -101,48 +356,31 @@ def add(
         "transcription_config": transcription_config
     }
     
-    try:
-        with get_client(host, port, timeout) as client:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Adding YouTube channel...", total=None)
-                
-                response = client.post("/api/v1/youtube/channels", json=request_data)
-                
-                progress.stop()
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    console.print(f"[green]✓ {data['message']}[/green]")
-                    
-                    # Show configuration
-                    config_table = Table(show_header=False, box=None)
-                    config_table.add_row("[bold]Channel ID:[/bold]", channel_id)
-                    config_table.add_row("[bold]Channel Name:[/bold]", channel_name)
-                    config_table.add_row("[bold]Engine:[/bold]", engine)
-                    config_table.add_row("[bold]Model:[/bold]", model or "default")
-                    config_table.add_row("[bold]Language:[/bold]", language)
-                    config_table.add_row("[bold]Format:[/bold]", format)
-                    
-                    console.print(Panel(config_table, title="Channel Configuration", border_style="green"))
-                    
-                else:
-                    error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                    error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                    console.print(f"[red]✗ Failed to add channel: {error_msg}[/red]")
-                    sys.exit(1)
-                    
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error adding channel: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+    from rich.panel import Panel
+    
+    client = get_client(host, port, timeout)
+    with _spinner("Adding YouTube channel..."):
+        response = client.post("/api/v1/youtube/channels", json=request_data)
+    
+    if response.status_code == 200:
+        data = _json(response)
+        console.print(_OK_PREFIX + Text(data['message'], style="green"))
+        
+        # Show configuration
+        config_text = _key_value_text([
+            ("Channel ID:", channel_id),
+            ("Channel Name:", channel_name),
+            ("Engine:", engine),
+            ("Model:", model or "default"),
+            ("Language:", language),
+            ("Format:", format),
+        ])
+        
+        console.print(Panel(config_text, title="Channel Configuration", border_style="green"))
+        
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to add channel: {error_msg}", style="red"))
         sys.exit(1)
 
 
@@ -165,6 +403,7 @@ def add(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error listing channels")
 def list(
     ctx,
     host: str,
@@ -173,67 +412,57 @@ def list(
 ):
     """List all monitored YouTube channels."""
     
-    try:
-        with get_client(host, port, timeout) as client:
-            response = client.get("/api/v1/youtube/channels")
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    client = get_client(host, port, timeout)
+    response = client.get("/api/v1/youtube/channels")
+    
+    if response.status_code == 200:
+        channels = _json(response)
+        
+        if not channels:
+            console.print("[yellow]No YouTube channels are being monitored[/yellow]")
+            return
+        
+        # Create table
+        table = Table()
+        table.add_column("Channel ID", style="bold")
+        table.add_column("Name")
+        table.add_column("Status")
+        table.add_column("Last Check")
+        table.add_column("Engine")
+        table.add_column("Language")
+        
+        fmt = _timestamp_formatter()
+        add_row = table.add_row
+        
+        for channel in channels:
+            status = _STATUS_ENABLED if channel['enabled'] else _STATUS_DISABLED
+            last_check = channel['last_check'] or "Never"
+            if last_check != "Never":
+                # Format datetime
+                last_check = fmt(last_check, '%Y-%m-%d %H:%M', last_check)
             
-            if response.status_code == 200:
-                channels = response.json()
-                
-                if not channels:
-                    console.print("[yellow]No YouTube channels are being monitored[/yellow]")
-                    return
-                
-                # Create table
-                table = Table()
-                table.add_column("Channel ID", style="bold")
-                table.add_column("Name")
-                table.add_column("Status")
-                table.add_column("Last Check")
-                table.add_column("Engine")
-                table.add_column("Language")
-                
-                for channel in channels:
-                    status = "[green]Enabled[/green]" if channel['enabled'] else "[red]Disabled[/red]"
-                    last_check = channel['last_check'] or "Never"
-                    if last_check != "Never":
-                        # Format datetime
-                        from datetime import datetime
-                        try:
-                            dt = datetime.fromisoformat(last_check.replace('Z', '+00:00'))
-                            last_check = dt.strftime('%Y-%m-%d %H:%M')
-                        except:
-                            pass
-                    
-                    config = channel.get('transcription_config', {})
-                    engine = config.get('engine', 'Unknown')
-                    language = config.get('language', 'Unknown')
-                    
-                    table.add_row(
-                        channel['channel_id'],
-                        channel['channel_name'],
-                        status,
-                        last_check,
-                        engine,
-                        language
-                    )
-                
-                console.print(Panel(table, title="Monitored YouTube Channels", border_style="blue"))
-                
-            else:
-                error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                console.print(f"[red]✗ Failed to list channels: {error_msg}[/red]")
-                sys.exit(1)
-                
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error listing channels: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+            config = channel.get('transcription_config', {})
+            engine = config.get('engine', 'Unknown')
+            language = config.get('language', 'Unknown')
+            
+            # Data cells are plain Text so names can't be mistaken for markup
+            add_row(
+                Text(channel['channel_id']),
+                Text(channel['channel_name']),
+                status,
+                Text(last_check),
+                Text(engine),
+                Text(language)
+            )
+        
+        console.print(Panel(table, title="Monitored YouTube Channels", border_style="blue"))
+        
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to list channels: {error_msg}", style="red"))
         sys.exit(1)
 
 
@@ -257,6 +486,7 @@ def list(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error removing channel")
 def remove(
     ctx,
     channel_id: str,
@@ -269,36 +499,16 @@ def remove(
     CHANNEL_ID: YouTube channel ID to remove
     """
     
-    try:
-        with get_client(host, port, timeout) as client:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Removing YouTube channel...", total=None)
-                
-                response = client.delete(f"/api/v1/youtube/channels/{channel_id}")
-                
-                progress.stop()
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    console.print(f"[green]✓ {data['message']}[/green]")
-                else:
-                    error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                    error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                    console.print(f"[red]✗ Failed to remove channel: {error_msg}[/red]")
-                    sys.exit(1)
-                    
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error removing channel: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+    client = get_client(host, port, timeout)
+    with _spinner("Removing YouTube channel..."):
+        response = client.delete(f"/api/v1/youtube/channels/{channel_id}")
+    
+    if response.status_code == 200:
+        data = _json(response)
+        console.print(_OK_PREFIX + Text(data['message'], style="green"))
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to remove channel: {error_msg}", style="red"))
         sys.exit(1)
 
 
@@ -327,6 +537,7 @@ def remove(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error updating channel")
 def enable(
     ctx,
     channel_id: str,
@@ -340,41 +551,21 @@ def enable(
     CHANNEL_ID: YouTube channel ID to enable/disable
     """
     
-    try:
-        with get_client(host, port, timeout) as client:
-            action = "Enabling" if enable else "Disabling"
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"{action} YouTube channel...", total=None)
-                
-                response = client.put(
-                    f"/api/v1/youtube/channels/{channel_id}/enable",
-                    params={"enabled": enable}
-                )
-                
-                progress.stop()
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    console.print(f"[green]✓ {data['message']}[/green]")
-                else:
-                    error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                    error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                    console.print(f"[red]✗ Failed to update channel: {error_msg}[/red]")
-                    sys.exit(1)
-                    
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error updating channel: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+    client = get_client(host, port, timeout)
+    action = "Enabling" if enable else "Disabling"
+    
+    with _spinner(f"{action} YouTube channel..."):
+        response = client.put(
+            f"/api/v1/youtube/channels/{channel_id}/enable",
+            params={"enabled": enable}
+        )
+    
+    if response.status_code == 200:
+        data = _json(response)
+        console.print(_OK_PREFIX + Text(data['message'], style="green"))
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to update channel: {error_msg}", style="red"))
         sys.exit(1)
 
 
@@ -397,6 +588,7 @@ def enable(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error checking channels")
 def check(
     ctx,
     host: str,
@@ -405,59 +597,43 @@ def check(
 ):
     """Manually check all channels for new videos."""
     
-    try:
-        with get_client(host, port, timeout) as client:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Checking channels for new videos...", total=None)
-                
-                response = client.post("/api/v1/youtube/channels/check")
-                
-                progress.stop()
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    console.print(f"[green]✓ {data['message']}[/green]")
-                    
-                    results = data.get('results', [])
-                    if results:
-                        # Show results
-                        for result in results:
-                            videos = result.get('videos_found', [])
-                            if videos:
-                                console.print(f"\n[bold]{result['channel_name']}:[/bold]")
-                                for video in videos:
-                                    console.print(f"  • {video['title']}")
-                                    console.print(f"    [dim]URL: {video['url']}[/dim]")
-                            else:
-                                console.print(f"\n[dim]{result['channel_name']}: No new videos[/dim]")
-                    else:
-                        console.print("[dim]No new videos found in any channel[/dim]")
-                        
+    client = get_client(host, port, timeout)
+    with _spinner("Checking channels for new videos..."):
+        response = client.post("/api/v1/youtube/channels/check")
+    
+    if response.status_code == 200:
+        data = _json(response)
+        console.print(_OK_PREFIX + Text(data['message'], style="green"))
+        
+        results = data.get('results', [])
+        if results:
+            # Show results, buffered into a single print
+            buf = Text()
+            append = buf.append
+            for result in results:
+                videos = result.get('videos_found', [])
+                if videos:
+                    append(f"\n{result['channel_name']}:\n", style="bold")
+                    for video in videos:
+                        append(f"  • {video['title']}\n")
+                        append(f"    URL: {video['url']}\n", style="dim")
                 else:
-                    error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                    error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                    console.print(f"[red]✗ Failed to check channels: {error_msg}[/red]")
-                    sys.exit(1)
-                    
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error checking channels: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+                    append(f"\n{result['channel_name']}: No new videos\n", style="dim")
+            buf.rstrip()
+            console.print(buf)
+        else:
+            console.print("[dim]No new videos found in any channel[/dim]")
+            
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to check channels: {error_msg}", style="red"))
         sys.exit(1)
 
 
 @youtube.command()
 @click.option(
     '--status',
-    type=click.Choice(['pending', 'running', 'completed', 'failed', 'cancelled']),
+    type=_STATUS_CHOICE,
     help='Filter tasks by status'
 )
 @click.option(
@@ -484,6 +660,7 @@ def check(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error listing tasks")
 def tasks(
     ctx,
     status: Optional[str],
@@ -494,91 +671,78 @@ def tasks(
 ):
     """List YouTube-related tasks."""
     
-    try:
-        with get_client(host, port, timeout) as client:
-            params = {'limit': limit}
-            if status:
-                params['status'] = status
-                
-            response = client.get("/api/v1/youtube/tasks", params=params)
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    client = get_client(host, port, timeout)
+    params = {'limit': limit}
+    if status:
+        params['status'] = status
+        
+    response = client.get("/api/v1/youtube/tasks", params=params)
+    
+    if response.status_code == 200:
+        tasks = _json(response)
+        
+        if not tasks:
+            filter_msg = f" with status '{status}'" if status else ""
+            console.print(f"[yellow]No YouTube tasks found{filter_msg}[/yellow]")
+            return
+        
+        # Create table
+        table = Table()
+        table.add_column("ID", style="dim")
+        table.add_column("Name")
+        table.add_column("Status")
+        table.add_column("Created")
+        table.add_column("Duration")
+        
+        fmt = _timestamp_formatter()
+        durations = {}
+        add_row = table.add_row
+        
+        for task in tasks:
+            # Format status with color
+            task_status = task['status']
+            status_display = _STATUS_MAP.get(task_status)
+            if status_display is None:
+                status_display = _status_title(task_status)
+            
+            # Format timestamps
+            created = fmt(task.get('created_at'), '%m-%d %H:%M', "Unknown")
             
-            if response.status_code == 200:
-                tasks = response.json()
-                
-                if not tasks:
-                    filter_msg = f" with status '{status}'" if status else ""
-                    console.print(f"[yellow]No YouTube tasks found{filter_msg}[/yellow]")
-                    return
-                
-                # Create table
-                table = Table()
-                table.add_column("ID", style="dim")
-                table.add_column("Name")
-                table.add_column("Status")
-                table.add_column("Created")
-                table.add_column("Duration")
-                
-                for task in tasks:
-                    # Format status with color
-                    task_status = task['status']
-                    if task_status == 'completed':
-                        status_display = "[green]Completed[/green]"
-                    elif task_status == 'running':
-                        status_display = "[blue]Running[/blue]"
-                    elif task_status == 'failed':
-                        status_display = "[red]Failed[/red]"
-                    elif task_status == 'cancelled':
-                        status_display = "[yellow]Cancelled[/yellow]"
-                    else:
-                        status_display = task_status.title()
-                    
-                    # Format timestamps
-                    from datetime import datetime
+            # Calculate duration
+            duration = "—"
+            if task.get('started_at') and task.get('completed_at'):
+                key = (task['started_at'], task['completed_at'])
+                duration = durations.get(key)
+                if duration is None:
                     try:
-                        created_dt = datetime.fromisoformat(task['created_at'].replace('Z', '+00:00'))
-                        created = created_dt.strftime('%m-%d %H:%M')
-                    except:
-                        created = "Unknown"
-                    
-                    # Calculate duration
-                    duration = "—"
-                    if task.get('started_at') and task.get('completed_at'):
-                        try:
-                            start_dt = datetime.fromisoformat(task['started_at'].replace('Z', '+00:00'))
-                            end_dt = datetime.fromisoformat(task['completed_at'].replace('Z', '+00:00'))
-                            duration_seconds = (end_dt - start_dt).total_seconds()
-                            duration = f"{duration_seconds:.1f}s"
-                        except:
-                            pass
-                    
-                    table.add_row(
-                        task['id'][:8] + "...",  # Truncate ID
-                        task['name'],
-                        status_display,
-                        created,
-                        duration
-                    )
-                
-                title = "YouTube Tasks"
-                if status:
-                    title += f" ({status.title()})"
-                
-                console.print(Panel(table, title=title, border_style="blue"))
-                
-            else:
-                error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                console.print(f"[red]✗ Failed to list tasks: {error_msg}[/red]")
-                sys.exit(1)
-                
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error listing tasks: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+                        start_dt = _parse_iso(task['started_at'])
+                        end_dt = _parse_iso(task['completed_at'])
+                        duration_seconds = (end_dt - start_dt).total_seconds()
+                        duration = f"{duration_seconds:.1f}s"
+                    except (TypeError, ValueError):
+                        duration = "—"
+                    durations[key] = duration
+            
+            add_row(
+                Text(task['id'][:8] + "..."),  # Truncate ID
+                Text(task['name']),
+                status_display,
+                Text(created),
+                Text(duration)
+            )
+        
+        title = "YouTube Tasks"
+        if status:
+            title += f" ({status.title()})"
+        
+        console.print(Panel(table, title=title, border_style="blue"))
+        
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to list tasks: {error_msg}", style="red"))
         sys.exit(1)
 
 
@@ -601,6 +765,7 @@ def tasks(
     help='Request timeout in seconds'
 )
 @click.pass_context
+@_api_command("Error getting status")
 def status(
     ctx,
     host: str,
@@ -609,45 +774,36 @@ def status(
 ):
     """Show YouTube monitoring status."""
     
-    try:
-        with get_client(host, port, timeout) as client:
-            response = client.get("/api/v1/youtube/status")
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Show status
-                status_table = Table(show_header=False, box=None)
-                status_table.add_row("[bold]Monitored Channels:[/bold]", str(data['channels']))
-                status_table.add_row("[bold]Processed Videos:[/bold]", str(data['processed_videos']))
-                status_table.add_row("[bold]Active Tasks:[/bold]", str(data['active_tasks']))
-                status_table.add_row("[bold]Completed Tasks:[/bold]", str(data['completed_tasks']))
-                status_table.add_row("[bold]Failed Tasks:[/bold]", str(data['failed_tasks']))
-                
-                console.print(Panel(status_table, title="YouTube Monitoring Status", border_style="blue"))
-                
-            else:
-                error_data = response.json() if response.headers.get('content-type', '').startswith('application/json') else {}
-                error_msg = error_data.get('detail', f"HTTP {response.status_code}")
-                console.print(f"[red]✗ Failed to get status: {error_msg}[/red]")
-                sys.exit(1)
-                
-    except httpx.ConnectError:
-        console.print(f"[red]✗ Cannot connect to API server at {host}:{port}[/red]")
-        console.print("[dim]Make sure the server is running[/dim]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Error getting status: {e}[/red]")
-        if ctx.obj.get('verbose'):
-            console.print_exception()
+    from rich.panel import Panel
+    
+    client = get_client(host, port, timeout)
+    response = client.get("/api/v1/youtube/status")
+    
+    if response.status_code == 200:
+        data = _json(response)
+        
+        # Show status
+        status_text = _key_value_text([
+            ("Monitored Channels:", data['channels']),
+            ("Processed Videos:", data['processed_videos']),
+            ("Active Tasks:", data['active_tasks']),
+            ("Completed Tasks:", data['completed_tasks']),
+            ("Failed Tasks:", data['failed_tasks']),
+        ])
+        
+        console.print(Panel(status_text, title="YouTube Monitoring Status", border_style="blue"))
+        
+    else:
+        error_msg = _error_msg(response)
+        console.print(_ERR_PREFIX + Text(f"Failed to get status: {error_msg}", style="red"))
         sys.exit(1)
 
 
 @youtube.command()
-@click.argument('url')
+@click.argument('urls', nargs=-1, required=True)
 @click.option(
     '--engine', '-e',
-    type=click.Choice(['openai_whisper', 'faster_whisper', 'whisperkit', 'whispercpp', 'alibaba_asr']),
+    type=_ENGINE_CHOICE,
     default='openai_whisper',
     help='Speech recognition engine to use'
 )
@@ -661,106 +817,111 @@ def status(
 )
 @click.option(
     '--format', '-f',
-    type=click.Choice(['srt', 'vtt', 'txt', 'json']),
+    type=_FORMAT_CHOICE_WITH_JSON,
     default='srt',
     help='Output format for transcription'
 )
 @click.option(
     '--output', '-o',
-    help='Output file path (auto-generated if not specified)'
+    help='Output file path (auto-generated if not specified; single URL only)'
 )
 @click.pass_context
+@_api_command("Transcription failed")
 def transcribe(
     ctx,
-    url: str,
+    urls: Tuple[str, ...],
     engine: str,
     model: Optional[str],
     language: Optional[str],
     format: str,
     output: Optional[str]
 ):
-    """Transcribe a YouTube video directly.
+    """Transcribe YouTube videos directly.
     
-    URL: YouTube video URL to transcribe
+    URLS: One or more YouTube video URLs to transcribe. Multiple videos are
+    downloaded and transcribed concurrently.
     """
     
-    try:
-        from ...core.transcriber import TranscriptionService
-        from pathlib import Path
-        import time
-        
-        console.print(f"[blue]Starting YouTube transcription...[/blue]")
+    if output and len(urls) > 1:
+        raise click.UsageError("--output can only be used with a single URL")
+    
+    from ...config.settings import settings
+    from ...core.transcription import get_transcription_service
+    from pathlib import Path
+    import asyncio
+    import time
+    
+    console.print(f"[blue]Starting YouTube transcription...[/blue]")
+    for url in urls:
         console.print(f"[dim]URL: {url}[/dim]")
-        console.print(f"[dim]Engine: {engine}[/dim]")
-        console.print(f"[dim]Model: {model or 'default'}[/dim]")
-        console.print(f"[dim]Language: {language or 'auto-detect'}[/dim]")
-        console.print(f"[dim]Format: {format}[/dim]")
-        console.print()
-        
-        # Initialize transcription service
-        service = TranscriptionService()
-        
-        # Prepare transcription parameters
-        transcribe_kwargs = {}
-        if model:
-            transcribe_kwargs['model_name'] = model
-        if language:
-            transcribe_kwargs['language'] = language
-        
-        # Start transcription with progress
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Downloading and transcribing...", total=None)
-            
-            start_time = time.time()
-            
-            # Run transcription
-            result = asyncio.run(
-                service.transcribe_youtube(
-                    url=url,
-                    engine_name=engine,
-                    output_format=format,
-                    **transcribe_kwargs
-                )
-            )
-            
-            progress.stop()
-            
-            end_time = time.time()
-            duration = end_time - start_time
+    console.print(f"[dim]Engine: {engine}[/dim]")
+    console.print(f"[dim]Model: {model or 'default'}[/dim]")
+    console.print(f"[dim]Language: {language or 'auto-detect'}[/dim]")
+    console.print(f"[dim]Format: {format}[/dim]")
+    console.print()
+    
+    # Initialize transcription service
+    service = get_transcription_service(settings)
+    
+    # Fail before downloading anything if the engine cannot run here
+    registry = service.engine_registry
+    if not registry.is_engine_available(engine):
+        available = [name for name in registry.list_engines() if registry.is_engine_available(name)]
+        console.print(_ERR_PREFIX + Text(f"Engine '{engine}' is not available", style="red"))
+        if available:
+            console.print(f"Available engines: {', '.join(available)}")
+        sys.exit(1)
+    
+    async def _transcribe_url(url: str):
+        result = await service.transcribe_youtube(
+            url,
+            engine_name=engine,
+            model_name=model,
+            language=language,
+            output_format=format
+        )
+        if not result.success:
+            raise RuntimeError(f"YouTube transcription failed: {result.error}")
+        return result
+    
+    # Start transcription with progress
+    with _spinner("Downloading and transcribing..."):
+        start_time = time.time()
         
-        # Handle output file
-        if output:
-            output_path = Path(output)
-            if result.output_path != output_path:
-                # Move/copy to specified output path
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                import shutil
-                shutil.move(str(result.output_path), str(output_path))
-                result.output_path = output_path
+        # Run transcriptions; downloads of several videos overlap
+        async def _transcribe_all():
+            return await asyncio.gather(*[_transcribe_url(url) for url in urls])
         
+        results = _run(_transcribe_all())
+    
+    end_time = time.time()
+    duration = end_time - start_time
+    
+    # Handle output file
+    if output:
+        result = results[0]
+        output_path = Path(output)
+        if result.output_path != output_path:
+            # Move/copy to specified output path
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(result.output_path), str(output_path))
+            result.output_path = output_path
+    
+    for result in results:
         # Show success message
-        console.print(f"[green]✓ Transcription completed: {result.output_path}[/green]")
-        console.print(f"[dim]Processing time: {duration:.2f} seconds[/dim]")
+        console.print(_OK_PREFIX + Text(f"Transcription completed: {result.output_path}", style="green"))
         
         # Show preview of transcription
         if result.output_path.exists():
             console.print("\n[bold]First few lines of transcription:[/bold]")
-            with open(result.output_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[:6]  # Show first 6 lines
-                preview = ''.join(lines).strip()
-                if preview:
-                    console.print(f"[dim]{preview}[/dim]")
-                    if len(lines) == 6:
-                        console.print("[dim]...[/dim]")
-        
-        console.print(f"\n[green]🎉 YouTube transcription completed successfully![/green]")
-        
-    except Exception as e:
-        console.print(f"[red]✗ Transcription failed: {e}[/red]")
-        if ctx.obj and ctx.obj.get('verbose'):
-            console.print_exception()
-        sys.exit(1)
\ No newline at end of file
+            with open(result.output_path, 'r', encoding='utf-8', buffering=4096) as f:
+                lines = list(islice(f, 6))  # Show first 6 lines
+            preview = ''.join(lines).strip()
+            if preview:
+                console.print(f"[dim]{preview}[/dim]")
+                if len(lines) == 6:
+                    console.print("[dim]...[/dim]")
+        console.print()
+    
+    console.print(f"[dim]Processing time: {duration:.2f} seconds[/dim]")
+    console.print(f"\n[green]🎉 YouTube transcription completed successfully![/green]")
\ No newline at end of file
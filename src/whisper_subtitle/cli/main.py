@@ -1,19 +1,75 @@
 """Main CLI entry point for the whisper subtitle generator."""
 
-import asyncio
+import atexit
+import importlib
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional
 
 import click
 from rich.console import Console
-from rich.logging import RichHandler
 
 from ..config.settings import settings
-from .commands import transcribe, server, youtube, translate, social
 
 console = Console()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that hands records to the listener unformatted.
+    
+    The stock ``prepare`` pre-renders the message and drops ``exc_info``,
+    which would lose Rich's traceback rendering on the listener side.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
+_NOISY_LIBRARIES = ("httpx", "urllib3", "yt_dlp")
+_NOISY_PREFIXES = tuple(f"{name}." for name in _NOISY_LIBRARIES)
+
+
+def _quiet_libraries_filter(record: logging.LogRecord) -> bool:
+    """Drop below-WARNING records from noisy third-party libraries."""
+    if record.levelno >= logging.WARNING:
+        return True
+    name = record.name
+    return name not in _NOISY_LIBRARIES and not name.startswith(_NOISY_PREFIXES)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+    
+    Subcommands are declared as ``"module:attr"`` strings, so ``--help`` and
+    the built-in commands never load the yt-dlp, engine or social media trees.
+    """
+    
+    _lazy_subcommands: Dict[str, str] = {
+        "transcribe": "whisper_subtitle.cli.commands.transcribe:transcribe",
+        "server": "whisper_subtitle.cli.commands.server:server",
+        "youtube": "whisper_subtitle.cli.commands.youtube:youtube",
+        "translate": "whisper_subtitle.cli.commands.translate:translate",
+        "social": "whisper_subtitle.cli.commands.social:social",
+    }
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | self._lazy_subcommands.keys())
+    
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self._lazy_subcommands:
+            return command
+        
+        module_name, attr = self._lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        # Cache on the group so repeated lookups skip the import machinery
+        self.add_command(command, cmd_name)
+        return command
 
 
 def setup_logging(verbose: bool = False):
@@ -22,30 +78,52 @@ def setup_logging(verbose: bool = False):
     Args:
         verbose: Enable verbose logging
     """
+    global _log_listener
+    from rich.logging import RichHandler
+    
     level = logging.DEBUG if verbose else logging.INFO
     
-    # Configure rich logging
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                show_path=verbose
-            )
-        ]
+    # Rich formatting runs on the listener thread so log calls made from the
+    # event loop only enqueue the record
+    rich_handler = RichHandler(
+        console=console,
+        rich_tracebacks=True,
+        show_path=verbose
     )
+    rich_handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    
+    log_queue = queue.SimpleQueue()
+    if _log_listener is not None:
+        _log_listener.stop()
+    else:
+        atexit.register(lambda: _log_listener.stop())
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, rich_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    
+    queue_handler = _RecordQueueHandler(log_queue)
     
-    # Reduce noise from external libraries
+    # Reduce noise from external libraries. Libraries that are already
+    # loaded get their logger level raised; the rest usually never load
+    # (subcommands are imported lazily), so instead of creating their
+    # loggers up front a handler filter drops their records if they do
     if not verbose:
-        logging.getLogger("httpx").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("yt_dlp").setLevel(logging.WARNING)
+        for name in _NOISY_LIBRARIES:
+            if name in sys.modules:
+                logging.getLogger(name).setLevel(logging.WARNING)
+        queue_handler.addFilter(_quiet_libraries_filter)
+    
+    # force replaces the queue handler from an earlier call, which would
+    # otherwise keep feeding the stopped listener
+    logging.basicConfig(
+        level=level,
+        handlers=[queue_handler],
+        force=True
+    )
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.option(
     "--verbose", "-v", 
     is_flag=True, 
@@ -82,28 +160,34 @@ def cli(ctx, verbose: bool, config: Optional[Path]):
     # Store configuration in context
     ctx.obj['verbose'] = verbose
     ctx.obj['config'] = config
-    
-    # Ensure required directories exist
-    try:
-        settings.ensure_directories()
-    except Exception as e:
-        console.print(f"[red]Error creating directories: {e}[/red]")
-        sys.exit(1)
 
 
-# Add command groups
-cli.add_command(transcribe.transcribe)
-cli.add_command(server.server)
-cli.add_command(youtube.youtube)
-cli.add_command(translate.translate)
-cli.add_command(social.social)
+async def _gather_engines_info() -> Dict[str, Dict]:
+    """Probe all registered engines concurrently.
+    
+    Availability checks are blocking (binary lookups, library imports,
+    CUDA probes), so each one runs in the default executor and the total
+    time is that of the slowest engine rather than the sum.
+    
+    Returns:
+        Dict mapping engine names to their info
+    """
+    import asyncio
+    from ..core.engines.registry import registry
+    
+    loop = asyncio.get_running_loop()
+    names = registry.get_all_engines()
+    infos = await asyncio.gather(
+        *(loop.run_in_executor(None, registry.get_engine_info, name) for name in names)
+    )
+    return {name: engine_info for name, engine_info in zip(names, infos) if engine_info}
 
 
 @cli.command()
 @click.pass_context
 def info(ctx):
     """Show system information and configuration."""
-    from ..core.service import TranscriptionService
+    import asyncio
     
     console.print("[bold blue]Whisper Subtitle Generator[/bold blue]")
     console.print("[dim]A powerful tool for generating subtitles from audio and video files[/dim]\n")
@@ -120,9 +204,7 @@ def info(ctx):
     # Show available engines
     async def show_engines():
         try:
-            service = TranscriptionService(settings)
-            from ..core.engines.registry import registry
-            engines_info = registry.get_all_engines_info()
+            engines_info = await _gather_engines_info()
             
             console.print("[bold]Available Engines:[/bold]")
             for engine_name, engine_info in engines_info.items():
@@ -150,29 +232,32 @@ def info(ctx):
 @click.pass_context
 def check(ctx, engine: Optional[str]):
     """Check engine availability and models."""
-    from ..core.service import TranscriptionService
+    import asyncio
     
     async def check_engines():
         try:
-            service = TranscriptionService(settings)
-            
             if engine:
                 # Check specific engine
+                from ..core.engines.registry import registry
+                
                 console.print(f"[bold]Checking engine: {engine}[/bold]")
                 
                 try:
-                    engine_instance = await service.get_engine(engine)
+                    loop = asyncio.get_running_loop()
+                    engine_info = await loop.run_in_executor(None, registry.get_engine_info, engine)
                     
-                    if await engine_instance.is_ready():
+                    if engine_info is None:
+                        console.print(f"[red]✗ {engine} is not registered[/red]")
+                    elif engine_info.get('ready', False):
                         console.print(f"[green]✓ {engine} is ready[/green]")
                         
                         # Show models
-                        models = await engine_instance.get_available_models()
+                        models = engine_info.get('models')
                         if models:
                             console.print(f"Available models: {', '.join(models)}")
                         
                         # Show languages
-                        languages = await engine_instance.get_supported_languages()
+                        languages = engine_info.get('languages')
                         if languages:
                             console.print(f"Supported languages: {', '.join(languages[:10])}{'...' if len(languages) > 10 else ''}")
                     else:
@@ -182,8 +267,7 @@ def check(ctx, engine: Optional[str]):
                     console.print(f"[red]✗ Error checking {engine}: {e}[/red]")
             else:
                 # Check all engines
-                from ..core.engines.registry import registry
-                engines_info = registry.get_all_engines_info()
+                engines_info = await _gather_engines_info()
                 
                 console.print("[bold]Engine Status:[/bold]")
                 for engine_name, engine_info in engines_info.items():
@@ -200,6 +284,40 @@ def check(ctx, engine: Optional[str]):
     asyncio.run(check_engines())
 
 
+def _iter_files(root: str, prune_after: Optional[float] = None) -> Iterator["os.DirEntry"]:
+    """Yield the regular files below root without building Path objects.
+    
+    Args:
+        root: Directory to walk
+        prune_after: If given, skip subdirectories whose mtime and ctime are
+            both at or after this timestamp. Their contents are assumed to
+            be at least as new, which does not hold for files moved in
+            with their original mtime.
+        
+    Yields:
+        Directory entries for files; symlinks are not followed
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if prune_after is not None:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        if st.st_mtime >= prune_after and st.st_ctime >= prune_after:
+                            continue
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
 @cli.command()
 @click.option(
     "--days", "-d",
@@ -212,13 +330,20 @@ def check(ctx, engine: Optional[str]):
     is_flag=True,
     help="Show what would be deleted without actually deleting"
 )
+@click.option(
+    "--skip-recent-dirs",
+    is_flag=True,
+    help="Do not descend into subdirectories created and modified within the "
+         "retention window (faster on large trees, but misses old files moved into them)"
+)
 @click.pass_context
-def cleanup(ctx, days: int, dry_run: bool):
+def cleanup(ctx, days: int, dry_run: bool, skip_recent_dirs: bool):
     """Clean up old temporary and output files."""
+    from contextlib import nullcontext
     from datetime import datetime, timedelta
-    import os
     
-    cutoff_time = datetime.now() - timedelta(days=days)
+    verbose = ctx.obj.get('verbose', False)
+    cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
     
     directories_to_clean = [
         settings.temp_dir,
@@ -228,33 +353,73 @@ def cleanup(ctx, days: int, dry_run: bool):
     
     total_size = 0
     total_files = 0
+    candidates = []
     
-    for directory in directories_to_clean:
-        dir_path = Path(directory)
-        if not dir_path.exists():
-            continue
-        
-        console.print(f"[bold]Checking directory: {directory}[/bold]")
+    # Per-file lines are only printed in verbose mode; otherwise a single
+    # counter is updated so large trees are not dominated by Rich output
+    if verbose:
+        progress = nullcontext()
+    else:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         
-        for file_path in dir_path.rglob('*'):
-            if file_path.is_file():
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.completed} files"),
+            console=console,
+            transient=True
+        )
+        task = progress.add_task("Would delete" if dry_run else "Deleting", total=None)
+    
+    with progress:
+        for directory in directories_to_clean:
+            dir_path = Path(directory)
+            if not dir_path.exists():
+                continue
+            
+            console.print(f"[bold]Checking directory: {directory}[/bold]")
+            
+            for entry in _iter_files(str(dir_path), cutoff_ts if skip_recent_dirs else None):
                 try:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_time:
-                        file_size = file_path.stat().st_size
+                    st = entry.stat()
+                    if st.st_mtime < cutoff_ts:
+                        file_size = st.st_size
                         total_size += file_size
                         total_files += 1
                         
-                        size_str = f"{file_size / 1024 / 1024:.1f}MB" if file_size > 1024*1024 else f"{file_size / 1024:.1f}KB"
-                        
-                        if dry_run:
-                            console.print(f"  [yellow]Would delete:[/yellow] {file_path.name} ({size_str})")
+                        if verbose:
+                            size_str = f"{file_size / 1024 / 1024:.1f}MB" if file_size > 1024*1024 else f"{file_size / 1024:.1f}KB"
+                            if dry_run:
+                                console.print(f"  [yellow]Would delete:[/yellow] {entry.name} ({size_str})")
+                            else:
+                                console.print(f"  [red]Deleting:[/red] {entry.name} ({size_str})")
                         else:
-                            console.print(f"  [red]Deleting:[/red] {file_path.name} ({size_str})")
-                            file_path.unlink()
+                            progress.update(task, advance=1)
+                        
+                        if not dry_run:
+                            candidates.append((entry.path, file_size))
                             
                 except Exception as e:
-                    console.print(f"  [red]Error processing {file_path}: {e}[/red]")
+                    console.print(f"  [red]Error processing {entry.path}: {e}[/red]")
+        
+        if candidates:
+            # unlink is I/O bound, so keep several in flight at once; this
+            # mostly pays off on network or otherwise slow filesystems
+            from concurrent.futures import ThreadPoolExecutor
+            
+            def unlink(candidate):
+                try:
+                    os.unlink(candidate[0])
+                except OSError as e:
+                    return e
+                return None
+            
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+                for (path, file_size), error in zip(candidates, pool.map(unlink, candidates, chunksize=64)):
+                    if error is not None:
+                        total_files -= 1
+                        total_size -= file_size
+                        console.print(f"  [red]Error deleting {path}: {error}[/red]")
     
     total_size_str = f"{total_size / 1024 / 1024:.1f}MB" if total_size > 1024*1024 else f"{total_size / 1024:.1f}KB"
     
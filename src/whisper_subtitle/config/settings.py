@@ -1,13 +1,57 @@
 """Application settings and configuration."""
 
+import hashlib
 import os
+import sys
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings
 
 
+# The host platform cannot change while the process runs, so probe it once;
+# ``platform`` is only imported on macOS where the CPU check is needed
+_IS_MACOS = sys.platform == "darwin"
+if _IS_MACOS:
+    import platform
+    
+    _IS_APPLE_SILICON = platform.machine().lower() in {"arm64", "aarch64"}
+else:
+    _IS_APPLE_SILICON = False
+
+
+_DEFAULT_ENGINE_LANGUAGES = ("auto", "en", "zh", "ja", "ko", "es", "fr", "de", "it", "pt", "ru")
+
+
+class EngineConfig(BaseModel):
+    """Configuration for a single speech recognition engine."""
+    
+    # Engine specific keys not listed here are kept as extra attributes
+    model_config = ConfigDict(frozen=True, extra="allow")
+    
+    enabled: bool = False
+    models: Tuple[str, ...] = ()
+    default_model: str = "base"
+    languages: Tuple[str, ...] = ()
+    device: str = "auto"
+    compute_type: str = "auto"
+    access_key_id: str = ""
+    access_key_secret: str = ""
+    region: str = ""
+
+
+# Returned for unknown engines: disabled, no models or languages
+_EMPTY_ENGINE_CONFIG = EngineConfig()
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory (``$XDG_CACHE_HOME/whisper-subtitle``)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "whisper-subtitle"
+
+
 class Settings(BaseSettings):
     """Application settings."""
     
@@ -29,6 +73,7 @@ class Settings(BaseSettings):
     temp_dir: Path = Field(default_factory=lambda: Path.cwd() / "temp", description="Temporary directory")
     upload_dir: Path = Field(default_factory=lambda: Path.cwd() / "uploads", description="Upload directory")
     download_dir: Path = Field(default_factory=lambda: Path.cwd() / "downloads", description="Download directory")
+    cache_dir: Path = Field(default_factory=lambda: _user_cache_dir() / "results", description="Transcription result cache directory")
     model_dir: Path = Field(default=Path("./models"), env="MODEL_DIR")
     
     # WhisperKit Configuration (macOS only)
@@ -107,52 +152,60 @@ class Settings(BaseSettings):
     default_model: str = Field(default="base", description="Default model")
     default_language: str = Field(default="auto", description="Default language")
     default_output_format: str = Field(default="srt", description="Default output format")
+    max_loaded_models: int = Field(default=2, description="Maximum engine/model pairs kept loaded")
+    preload_models: bool = Field(default=True, description="Load the default model when the API starts")
     
     # Engine configurations
-    engines: Dict[str, Dict[str, Any]] = Field(
+    engines: Dict[str, EngineConfig] = Field(
         default_factory=lambda: {
-            "openai_whisper": {
-                "enabled": True,
-                "models": ["tiny", "base", "small", "medium", "large"],
-                "default_model": "base",
-                "languages": ["auto", "en", "zh", "ja", "ko", "es", "fr", "de", "it", "pt", "ru"],
-                "device": "auto",  # auto, cpu, cuda
-            },
-            "faster_whisper": {
-                "enabled": True,
-                "models": ["tiny", "base", "small", "medium", "large-v2", "large-v3"],
-                "default_model": "base",
-                "languages": ["auto", "en", "zh", "ja", "ko", "es", "fr", "de", "it", "pt", "ru"],
-                "device": "auto",  # auto, cpu, cuda
-                "compute_type": "auto",  # auto, int8, int16, float16, float32
-            },
-            "whisperkit": {
-                "enabled": False,  # Only available on macOS with Apple Silicon
-                "models": ["large-v2"],
-                "default_model": "large-v2",
-                "languages": ["auto", "en", "zh", "ja", "ko", "es", "fr", "de", "it", "pt", "ru"],
-            },
-            "whispercpp": {
-                "enabled": False,
-                "models": ["base", "small", "medium", "large-v2"],
-                "default_model": "base",
-                "languages": ["auto", "en", "zh", "ja", "ko", "es", "fr", "de", "it", "pt", "ru"],
-            },
-            "alibaba_asr": {
-                "enabled": False,
-                "models": ["general"],
-                "default_model": "general",
-                "languages": ["zh", "en"],
-                "access_key_id": "",
-                "access_key_secret": "",
-                "region": "cn-shanghai",
-            }
+            "openai_whisper": EngineConfig(
+                enabled=True,
+                models=("tiny", "base", "small", "medium", "large"),
+                default_model="base",
+                languages=_DEFAULT_ENGINE_LANGUAGES,
+                device="auto",  # auto, cpu, cuda
+            ),
+            "faster_whisper": EngineConfig(
+                enabled=True,
+                models=("tiny", "base", "small", "medium", "large-v2", "large-v3"),
+                default_model="base",
+                languages=_DEFAULT_ENGINE_LANGUAGES,
+                device="auto",  # auto, cpu, cuda
+                compute_type="auto",  # auto, int8, int16, float16, float32
+            ),
+            "whisperkit": EngineConfig(
+                enabled=False,  # Only available on macOS with Apple Silicon
+                models=("large-v2",),
+                default_model="large-v2",
+                languages=_DEFAULT_ENGINE_LANGUAGES,
+            ),
+            "whispercpp": EngineConfig(
+                enabled=False,
+                models=("base", "small", "medium", "large-v2"),
+                default_model="base",
+                languages=_DEFAULT_ENGINE_LANGUAGES,
+            ),
+            "alibaba_asr": EngineConfig(
+                enabled=False,
+                models=("general",),
+                default_model="general",
+                languages=("zh", "en"),
+                access_key_id="",
+                access_key_secret="",
+                region="cn-shanghai",
+            ),
         },
         description="Engine configurations"
     )
     
     # Task settings
     max_concurrent_tasks: int = Field(default=3, description="Maximum concurrent tasks")
+    batch_max_size: int = Field(default=8, description="Maximum requests coalesced into one engine batch")
+    batch_max_wait_ms: int = Field(default=10, description="Time to wait for more requests before running a batch")
+    result_cache_enabled: bool = Field(default=True, description="Reuse results for identical input files")
+    result_cache_max_bytes: int = Field(default=64 * 1024 * 1024, description="Memory budget for cached results in bytes")
+    result_cache_persist: bool = Field(default=True, description="Also keep cached results in cache_dir")
+    result_cache_max_disk_bytes: int = Field(default=512 * 1024 * 1024, description="Disk budget for persisted cached results in bytes")
     task_timeout: int = Field(default=3600, description="Task timeout in seconds")
     cleanup_interval: int = Field(default=3600, description="Cleanup interval in seconds")
     max_task_age: int = Field(default=86400 * 7, description="Maximum task age in seconds (7 days)")
@@ -181,9 +234,27 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignore extra fields
         
     def __init__(self, **kwargs):
-        """Initialize settings and create directories."""
+        """Initialize settings and create directories.
+        
+        Directory creation can be skipped by setting
+        ``WHISPER_SUBTITLE_SKIP_DIR_CREATE=1``; ``ensure_directories`` still
+        creates them on demand.
+        """
         super().__init__(**kwargs)
-        self._create_directories()
+        self._post_init()
+    
+    def _post_init(self):
+        """Per-process setup, also run for instances loaded from the cache."""
+        # Paths already created in this process (not a pydantic field)
+        object.__setattr__(self, "_dirs_created", set())
+        if os.environ.get("WHISPER_SUBTITLE_SKIP_DIR_CREATE") != "1":
+            self._create_directories()
+    
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Created directories are process state; don't carry them in pickles
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k != "_dirs_created"}
+        return state
         
     def _create_directories(self):
         """Create necessary directories."""
@@ -193,40 +264,50 @@ class Settings(BaseSettings):
             self.upload_dir,
             self.download_dir,
             self.model_dir,
+            # Ensure log file directory exists
+            self.log_file.parent,
         ]
         
         for directory in directories:
+            if directory in self._dirs_created:
+                continue
             directory.mkdir(parents=True, exist_ok=True)
-        
-        # Ensure log file directory exists
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(directory)
     
     def ensure_directories(self):
         """Ensure all necessary directories exist."""
         self._create_directories()
     
-    def get_engine_config(self, engine_name: str) -> Dict[str, Any]:
+    @cached_property
+    def allowed_extensions_set(self) -> FrozenSet[str]:
+        """Lower-cased allowed extensions for O(1) membership checks."""
+        return frozenset(ext.lower() for ext in self.allowed_extensions)
+    
+    def get_engine_config(self, engine_name: str) -> EngineConfig:
         """Get configuration for a specific engine."""
-        return self.engines.get(engine_name, {})
+        engine_config = self.engines.get(engine_name)
+        return engine_config if engine_config is not None else _EMPTY_ENGINE_CONFIG
     
     def is_engine_enabled(self, engine_name: str) -> bool:
         """Check if an engine is enabled."""
-        engine_config = self.get_engine_config(engine_name)
-        return engine_config.get("enabled", False)
+        return self.get_engine_config(engine_name).enabled
+    
+    @cached_property
+    def enabled_engines(self) -> Tuple[str, ...]:
+        """Names of enabled engines, computed once."""
+        return tuple(name for name, config in self.engines.items() if config.enabled)
     
     def get_enabled_engines(self) -> List[str]:
         """Get list of enabled engines."""
-        return [name for name, config in self.engines.items() if config.get("enabled", False)]
+        return list(self.enabled_engines)
     
     def get_engine_models(self, engine_name: str) -> List[str]:
         """Get available models for an engine."""
-        engine_config = self.get_engine_config(engine_name)
-        return engine_config.get("models", [])
+        return list(self.get_engine_config(engine_name).models)
     
     def get_engine_languages(self, engine_name: str) -> List[str]:
         """Get supported languages for an engine."""
-        engine_config = self.get_engine_config(engine_name)
-        return engine_config.get("languages", [])
+        return list(self.get_engine_config(engine_name).languages)
     
     # Compatibility properties for backward compatibility
     @property
@@ -257,22 +338,94 @@ class Settings(BaseSettings):
     @property
     def is_macos(self) -> bool:
         """Check if running on macOS."""
-        return os.uname().sysname == "Darwin"
+        return _IS_MACOS
     
     @property
     def is_apple_silicon(self) -> bool:
         """Check if running on Apple Silicon (M1/M2)."""
-        if not self.is_macos:
-            return False
-        try:
-            import platform
-            return platform.processor() == "arm" or "arm64" in platform.machine().lower()
-        except Exception:
-            return False
+        return _IS_APPLE_SILICON
+
+
+def _settings_cache_path() -> Path:
+    """Location of the pickled settings cache for the current user."""
+    return _user_cache_dir() / "settings.pkl"
+
+
+def _settings_cache_key() -> tuple:
+    """Everything the resolved settings depend on.
+    
+    Covers the working directory (path defaults), the ``.env`` file, the
+    prefixed environment variables and this module itself.
+    """
+    try:
+        env_mtime = Path(".env").stat().st_mtime_ns
+    except OSError:
+        env_mtime = None
+    
+    prefix = Settings.model_config.get("env_prefix", "").upper()
+    env = tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.upper().startswith(prefix)
+    ))
+    # Only a digest of the variables is stored; they may hold credentials
+    env_digest = hashlib.sha256(repr(env).encode("utf-8")).hexdigest()
+    return (str(Path.cwd()), env_mtime, Path(__file__).stat().st_mtime_ns, env_digest)
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Whether a cache file is owned by this user and closed to others."""
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o077
+
+
+def _load_settings() -> Settings:
+    """Load settings, reusing the last resolved values when nothing changed.
+    
+    Parsing ``.env`` and validating every field costs a noticeable part of
+    CLI start-up, so the validated instance is pickled and reused while
+    its cache key matches. The cache holds credentials from ``.env`` and
+    is unpickled, so it is written 0600 and ignored unless it is private
+    to the current user. Any problem with the cache falls back to a
+    normal ``Settings()``.
+    
+    Returns:
+        Settings instance
+    """
+    import pickle
+    
+    cache_path = _settings_cache_path()
+    try:
+        key = _settings_cache_key()
+    except OSError:
+        return Settings()
+    
+    try:
+        with open(cache_path, "rb") as f:
+            if not _is_private(os.fstat(f.fileno())):
+                raise PermissionError(f"{cache_path} is accessible to other users")
+            cached_key, cached = pickle.load(f)
+        if cached_key == key and isinstance(cached, Settings):
+            cached._post_init()
+            return cached
+    except Exception:
+        pass
+    
+    result = Settings()
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as f:
+            pickle.dump((key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+    return result
 
 
 # Global settings instance
-settings = Settings()
+settings = _load_settings()
 
 
 def get_settings() -> Settings:
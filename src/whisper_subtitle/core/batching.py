@@ -0,0 +1,142 @@
+"""Coalescing of concurrent transcription requests into engine batches."""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .engines.base import BaseEngine, TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+
+class BatchQueue:
+    """Queue that groups transcription requests for engines that batch.
+    
+    Requests submitted within ``max_wait_ms`` of each other that share an
+    engine, model, language and output format are handed to the engine's
+    ``transcribe_batch`` together, so the model is set up once per batch
+    instead of once per file.
+    """
+    
+    def __init__(
+        self,
+        get_engine: Callable[[str, str], Awaitable[BaseEngine]],
+        max_batch: int = 8,
+        max_wait_ms: float = 10
+    ):
+        """Initialize the queue.
+        
+        Args:
+            get_engine: Coroutine function returning a ready engine for
+                (engine name, model)
+            max_batch: Maximum number of requests per batch
+            max_wait_ms: How long to wait for more requests after the first
+        """
+        self._get_engine = get_engine
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max(0.0, max_wait_ms / 1000)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Running groups; the loop only keeps weak references to tasks
+        self._groups: Set[asyncio.Task] = set()
+    
+    async def submit(
+        self,
+        file_path: Path,
+        engine: str,
+        model: str,
+        language: str = "auto",
+        output_format: str = "srt",
+        output_path: Optional[Path] = None
+    ) -> TranscriptionResult:
+        """Queue a file and wait for its transcription.
+        
+        Args:
+            file_path: Path to the input file
+            engine: Engine name
+            model: Model name
+            language: Language code
+            output_format: Output format (srt, vtt, txt)
+            output_path: Output file path (optional)
+            
+        Returns:
+            TranscriptionResult for the file
+        """
+        loop = asyncio.get_running_loop()
+        # The queue and worker belong to one event loop; start fresh if
+        # we're now running on another
+        if self._loop is not loop:
+            self._stop_worker()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        key = (engine, model, language, output_format)
+        self._queue.put_nowait((key, file_path, output_path, future))
+        return await future
+    
+    async def _run(self) -> None:
+        """Collect queued requests into batches and run them."""
+        while True:
+            batch = [await self._queue.get()]
+            if self._max_wait:
+                await asyncio.sleep(self._max_wait)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            groups: Dict[Tuple[str, str, str, str], List[tuple]] = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            
+            # Groups use different models or options, so one slow group
+            # shouldn't hold up the others
+            for key, items in groups.items():
+                task = asyncio.ensure_future(self._run_group(key, items))
+                self._groups.add(task)
+                task.add_done_callback(self._groups.discard)
+    
+    def _stop_worker(self) -> None:
+        """Cancel the worker started on a previous event loop."""
+        worker, loop = self._worker, self._loop
+        if worker is None or worker.done() or loop is None or loop.is_closed():
+            return
+        # The old loop may still be running in another thread
+        loop.call_soon_threadsafe(worker.cancel)
+    
+    async def _run_group(self, key: Tuple[str, str, str, str], items: List[tuple]) -> None:
+        """Transcribe one group of compatible requests.
+        
+        Args:
+            key: (engine, model, language, output_format)
+            items: Queued (key, file_path, output_path, future) tuples
+        """
+        engine_name, model, language, output_format = key
+        logger.info(f"Transcribing batch of {len(items)} with {engine_name}/{model}")
+        
+        done = 0
+        try:
+            engine = await self._get_engine(engine_name, model)
+            results = engine.transcribe_batch(
+                [item[1] for item in items],
+                model=model,
+                language=language,
+                output_format=output_format,
+                output_paths=[item[2] for item in items]
+            )
+            async for result in results:
+                future = items[done][3]
+                if not future.done():
+                    future.set_result(result)
+                done += 1
+        except asyncio.CancelledError:
+            for item in items[done:]:
+                item[3].cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            for item in items[done:]:
+                if not item[3].done():
+                    item[3].set_exception(e)
@@ -3,23 +3,10 @@
 from .registry import EngineRegistry, register_engine
 from .base import BaseEngine, TranscriptionResult
 
-# Import and register engines
-try:
-    from .openai_whisper import OpenAIWhisperEngine
-    register_engine("openai_whisper", OpenAIWhisperEngine)
-except ImportError:
-    pass
-
-try:
-    from .faster_whisper import FasterWhisperEngine
-    register_engine("faster_whisper", FasterWhisperEngine)
-except ImportError:
-    pass
-
-try:
-    from .whisperkit import WhisperKitEngine
-    register_engine("whisperkit", WhisperKitEngine)
-except ImportError:
-    pass
+# Register engines by import path; each backend module (and the libraries it
+# needs) is only imported when the engine is first requested
+register_engine("openai_whisper", "whisper_subtitle.core.engines.openai_whisper:OpenAIWhisperEngine")
+register_engine("faster_whisper", "whisper_subtitle.core.engines.faster_whisper:FasterWhisperEngine")
+register_engine("whisperkit", "whisper_subtitle.core.engines.whisperkit:WhisperKitEngine")
 
 __all__ = ["EngineRegistry", "BaseEngine", "TranscriptionResult", "register_engine"]
\ No newline at end of file
@@ -1,13 +1,28 @@
 """Base engine class for speech recognition."""
 
 import abc
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import aiofiles
+import aiofiles.os
 
-@dataclass
+# Bytes gathered before each async write, so long outputs aren't held in
+# memory whole and short cues don't each cost a thread hop
+_ASYNC_WRITE_CHUNK = 64 * 1024
+
+# Results are created per file in batch jobs; slots drop the per-instance
+# __dict__ where the running Python supports it (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TranscriptionResult:
     """Result of a transcription operation."""
     success: bool
@@ -21,16 +36,22 @@ class TranscriptionResult:
     model: Optional[str] = None
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
-    created_at: datetime = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+_executor_lock = threading.Lock()
 
 
 class BaseEngine(abc.ABC):
     """Base class for speech recognition engines."""
     
+    # Engines that implement transcribe_batch(files, model, language,
+    # output_format, output_paths=...) set this so requests can be coalesced
+    supports_batching = False
+    
+    # Worker pool for blocking model work, one per engine class
+    _executor: Optional[ThreadPoolExecutor] = None
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize the engine with configuration."""
         self.config = config
@@ -59,9 +80,21 @@ class BaseEngine(abc.ABC):
         """
         pass
     
+    @classmethod
     @abc.abstractmethod
-    def is_available(self) -> bool:
-        """Check if the engine is available and ready to use."""
+    def is_available(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Check if the engine is available and ready to use.
+        
+        A classmethod so the registry can probe engines without
+        constructing them.
+        
+        Args:
+            config: Engine configuration, for engines whose availability
+                depends on it
+            
+        Returns:
+            True if the engine can be used
+        """
         pass
     
     @abc.abstractmethod
@@ -74,11 +107,72 @@ class BaseEngine(abc.ABC):
         """Get list of supported languages."""
         pass
     
+    async def load_model(self, model: str) -> None:
+        """Load a model ahead of the first transcription that needs it.
+        
+        Engines that keep models in memory override this; the default does
+        nothing.
+        
+        Args:
+            model: Model name
+        """
+    
+    def unload_model(self, model: str) -> None:
+        """Release a model kept in memory by this engine, if any.
+        
+        Args:
+            model: Model name
+        """
+    
+    @staticmethod
+    def _resolve_input(file_path: Path) -> Path:
+        """Resolve an input file once, failing if it doesn't exist.
+        
+        A single strict resolve replaces a separate exists() check, and
+        the resolved path is what gets handed to the decoder.
+        
+        Args:
+            file_path: Path to the input file
+            
+        Returns:
+            Absolute, resolved path
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        try:
+            return file_path.resolve(strict=True)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Input file not found: {file_path}") from None
+    
+    def _get_executor(self, default_workers: int = 1) -> ThreadPoolExecutor:
+        """Return the bounded worker pool shared by all instances of this engine.
+        
+        Requests beyond ``max_concurrency`` queue up instead of competing for
+        the same GPU or CPU cores. The pool is sized by the first instance
+        that needs it.
+        
+        Args:
+            default_workers: Pool size when ``max_concurrency`` isn't configured
+            
+        Returns:
+            Thread pool executor
+        """
+        cls = type(self)
+        if cls.__dict__.get("_executor") is None:
+            with _executor_lock:
+                if cls.__dict__.get("_executor") is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=max(1, int(self.config.get("max_concurrency", default_workers))),
+                        thread_name_prefix=f"{self.name}-engine"
+                    )
+        return cls._executor
+    
     def get_info(self) -> Dict[str, Any]:
         """Get engine information."""
         return {
             "name": self.name,
-            "ready": self.is_available(),
+            "ready": self.is_available(self.config),
             "models": self.get_models(),
             "languages": self.get_languages(),
             "config": self.config
@@ -98,6 +192,7 @@ class BaseEngine(abc.ABC):
             output_path: Path to save the output
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        segments = self._normalize_segments(segments)
         
         if output_format.lower() == "srt":
             self._write_srt(segments, output_path)
@@ -108,53 +203,193 @@ class BaseEngine(abc.ABC):
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
     
+    @staticmethod
+    def _normalize_segments(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return segments with float times and stripped text.
+        
+        Done once per output so the writers can use the values as-is.
+        
+        Args:
+            segments: Raw transcription segments
+            
+        Returns:
+            List of {'start', 'end', 'text'} dicts
+        """
+        return list(_iter_normalized(segments))
+    
+    def _stream_output(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        output_format: str,
+        output_path: Path
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Write segments to the output file as they are produced.
+        
+        Used by engines that decode lazily, so each cue is written as soon as
+        its segment is available instead of after the whole file.
+        
+        Args:
+            segments: Iterable of transcription segments
+            output_format: Output format (srt, vtt, txt)
+            output_path: Path to save the output
+            
+        Returns:
+            Tuple of (normalized segments, full text joined with spaces)
+        """
+        try:
+            header, format_cue = _CUE_FORMATTERS[output_format.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported output format: {output_format}") from None
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        segment_list = []
+        text_buf = io.StringIO()
+        
+        try:
+            # Binary mode, so output is byte-identical to _write_cues
+            with open(output_path, 'wb') as f:
+                f.write(header.encode('utf-8'))
+                for i, segment in enumerate(_iter_normalized(segments), 1):
+                    segment_list.append(segment)
+                    f.write(format_cue(i, segment).encode('utf-8'))
+                    if i > 1:
+                        text_buf.write(" ")
+                    text_buf.write(segment['text'])
+        except BaseException:
+            # Don't leave a truncated subtitle file behind
+            if output_path.exists():
+                output_path.unlink()
+            raise
+        
+        return segment_list, text_buf.getvalue()
+    
+    async def _write_output_async(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        output_format: str,
+        output_path: Path
+    ) -> None:
+        """Write segments to the output file without blocking the event loop.
+        
+        Produces the same bytes as _format_output, flushed in chunks as the
+        cues are formatted.
+        
+        Args:
+            segments: Iterable of transcription segments
+            output_format: Output format (srt, vtt, txt)
+            output_path: Path to save the output
+        """
+        try:
+            header, format_cue = _CUE_FORMATTERS[output_format.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported output format: {output_format}") from None
+        
+        await aiofiles.os.makedirs(output_path.parent, exist_ok=True)
+        
+        try:
+            async with aiofiles.open(output_path, 'wb') as f:
+                buf = bytearray(header.encode('utf-8'))
+                for i, segment in enumerate(_iter_normalized(segments), 1):
+                    buf += format_cue(i, segment).encode('utf-8')
+                    if len(buf) >= _ASYNC_WRITE_CHUNK:
+                        await f.write(bytes(buf))
+                        buf.clear()
+                await f.write(bytes(buf))
+        except BaseException:
+            # Don't leave a truncated subtitle file behind
+            if output_path.exists():
+                output_path.unlink()
+            raise
+    
     def _write_srt(self, segments: List[Dict[str, Any]], output_path: Path) -> None:
         """Write SRT format."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(segments, 1):
-                start_time = self._format_time_srt(segment.get('start', 0))
-                end_time = self._format_time_srt(segment.get('end', 0))
-                text = segment.get('text', '').strip()
-                
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+        _write_cues(segments, output_path, *_CUE_FORMATTERS["srt"])
     
     def _write_vtt(self, segments: List[Dict[str, Any]], output_path: Path) -> None:
         """Write VTT format."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("WEBVTT\n\n")
-            
-            for segment in segments:
-                start_time = self._format_time_vtt(segment.get('start', 0))
-                end_time = self._format_time_vtt(segment.get('end', 0))
-                text = segment.get('text', '').strip()
-                
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+        _write_cues(segments, output_path, *_CUE_FORMATTERS["vtt"])
     
     def _write_txt(self, segments: List[Dict[str, Any]], output_path: Path) -> None:
         """Write plain text format."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for segment in segments:
-                text = segment.get('text', '').strip()
-                if text:
-                    f.write(f"{text}\n")
+        _write_cues(segments, output_path, *_CUE_FORMATTERS["txt"])
     
     def _format_time_srt(self, seconds: float) -> str:
         """Format time for SRT format (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        return _format_time_srt(seconds)
     
     def _format_time_vtt(self, seconds: float) -> str:
         """Format time for VTT format (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
\ No newline at end of file
+        return _format_time_vtt(seconds)
+
+
+def _split_ms(seconds: float):
+    """Split seconds into (hours, minutes, seconds, milliseconds) integers.
+    
+    Rounds to the nearest millisecond once and then works on integers, so
+    values like 1.001 don't come out as 1,000 through float error.
+    """
+    ms = int(seconds * 1000 + 0.5)
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return hours, minutes, secs, ms
+
+
+def _format_time_srt(seconds: float) -> str:
+    """Format time for SRT format (HH:MM:SS,mmm)."""
+    return "%02d:%02d:%02d,%03d" % _split_ms(seconds)
+
+
+def _format_time_vtt(seconds: float) -> str:
+    """Format time for VTT format (HH:MM:SS.mmm)."""
+    return "%02d:%02d:%02d.%03d" % _split_ms(seconds)
+
+
+def _iter_normalized(segments: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield {'start', 'end', 'text'} dicts with float times and stripped text."""
+    for segment in segments:
+        yield {
+            'start': float(segment.get('start', 0)),
+            'end': float(segment.get('end', 0)),
+            'text': segment.get('text', '').strip(),
+        }
+
+
+def _srt_cue(index: int, segment: Dict[str, Any]) -> str:
+    """Format one normalized segment as an SRT cue."""
+    return f"{index}\n{_format_time_srt(segment['start'])} --> {_format_time_srt(segment['end'])}\n{segment['text']}\n\n"
+
+
+def _vtt_cue(index: int, segment: Dict[str, Any]) -> str:
+    """Format one normalized segment as a VTT cue."""
+    return f"{_format_time_vtt(segment['start'])} --> {_format_time_vtt(segment['end'])}\n{segment['text']}\n\n"
+
+
+def _txt_cue(index: int, segment: Dict[str, Any]) -> str:
+    """Format one normalized segment as a plain text line (empty text is skipped)."""
+    return f"{segment['text']}\n" if segment['text'] else ""
+
+
+# Output format -> (file header, cue formatter)
+_CUE_FORMATTERS = {
+    "srt": ("", _srt_cue),
+    "vtt": ("WEBVTT\n\n", _vtt_cue),
+    "txt": ("", _txt_cue),
+}
+
+def _write_cues(segments: List[Dict[str, Any]], output_path: Path, header: str, format_cue) -> None:
+    """Encode every cue into one buffer and write it with a single call.
+    
+    Writing bytes skips the text layer's per-write encoding and newline
+    translation, so files use LF line endings on every platform.
+    
+    Args:
+        segments: Normalized segments
+        output_path: Path to save the output
+        header: Text written before the first cue
+        format_cue: Function turning (index, segment) into cue text
+    """
+    buf = bytearray(header.encode('utf-8'))
+    for i, segment in enumerate(segments, 1):
+        buf += format_cue(i, segment).encode('utf-8')
+    output_path.write_bytes(buf)
@@ -1,18 +1,47 @@
 """Faster Whisper engine implementation."""
 
+import asyncio
+import gc
+import importlib.util
 import logging
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List
 
 from .base import BaseEngine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Supported models and languages, shared by every engine instance
+_MODELS = (
+    "tiny", "tiny.en", "base", "base.en", 
+    "small", "small.en", "medium", "medium.en",
+    "large-v1", "large-v2", "large-v3", "large"
+)
+_MODELS_SET = frozenset(_MODELS)
+
+_LANGUAGES = (
+    "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
+    "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
+    "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt",
+    "la", "mi", "ml", "cy", "sk", "te", "fa", "lv", "bn", "sr", "az", "sl",
+    "kn", "et", "mk", "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq",
+    "sw", "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc", "ka",
+    "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo", "ht", "ps", "tk",
+    "nn", "mt", "sa", "lb", "my", "bo", "tl", "mg", "as", "tt", "haw", "ln",
+    "ha", "ba", "jw", "su"
+)
+
 
 class FasterWhisperEngine(BaseEngine):
     """Faster Whisper engine for speech recognition."""
     
+    _import_ok = False
+    supports_batching = True
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize Faster Whisper engine.
         
@@ -20,40 +49,37 @@ class FasterWhisperEngine(BaseEngine):
             config: Engine configuration
         """
         super().__init__(config)
-        self._model = None
-        self._available_models = [
-            "tiny", "tiny.en", "base", "base.en", 
-            "small", "small.en", "medium", "medium.en",
-            "large-v1", "large-v2", "large-v3", "large"
-        ]
-        self._available_languages = [
-            "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
-            "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
-            "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt",
-            "la", "mi", "ml", "cy", "sk", "te", "fa", "lv", "bn", "sr", "az", "sl",
-            "kn", "et", "mk", "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq",
-            "sw", "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc", "ka",
-            "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo", "ht", "ps", "tk",
-            "nn", "mt", "sa", "lb", "my", "bo", "tl", "mg", "as", "tt", "haw", "ln",
-            "ha", "ba", "jw", "su"
-        ]
-    
-    def _load_model(self, model_name: str):
+        # Loaded models keyed by (model_name, device, compute_type), least
+        # recently used first
+        self._models: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._model_cache_size = max(1, int(config.get("model_cache_size", 2)))
+        # Transcriptions run in executor threads; serialize cache updates
+        # so two calls don't load the same model twice
+        self._models_lock = threading.Lock()
+        self._device = None
+        self._compute_type = None
+        self._vad_options = None
+        # Tokenized initial prompts per loaded model; entries go away with
+        # the model when it's evicted
+        self._prompt_tokens: "weakref.WeakKeyDictionary[Any, Dict[str, List[int]]]" = weakref.WeakKeyDictionary()
+    
+    def _load_model(self, model_name: str, device: str, compute_type: str):
         """Load Faster Whisper model.
         
         Args:
             model_name: Name of the model to load
+            device: Device to load the model on
+            compute_type: CTranslate2 compute type
+            
+        Returns:
+            Loaded WhisperModel
         """
         try:
             from faster_whisper import WhisperModel
             
-            # Get device and compute type from config
-            device = self.config.get("device", "auto")
-            compute_type = self.config.get("compute_type", "default")
+            logger.info(f"Loading Faster Whisper model: {model_name} on {device} ({compute_type})")
             
-            logger.info(f"Loading Faster Whisper model: {model_name} on {device}")
-            
-            self._model = WhisperModel(
+            model = WhisperModel(
                 model_name,
                 device=device,
                 compute_type=compute_type,
@@ -62,6 +88,7 @@ class FasterWhisperEngine(BaseEngine):
             )
             
             logger.info(f"Faster Whisper model {model_name} loaded successfully")
+            return model
             
         except ImportError:
             logger.error("Faster Whisper not installed. Install with: pip install faster-whisper")
@@ -70,21 +97,245 @@ class FasterWhisperEngine(BaseEngine):
             logger.error(f"Failed to load Faster Whisper model {model_name}: {e}")
             raise
     
-    def is_available(self) -> bool:
-        """Check if Faster Whisper is available."""
+    def _get_model(self, model_name: str):
+        """Return a loaded model, loading it and evicting the LRU one if needed.
+        
+        Args:
+            model_name: Name of the model
+            
+        Returns:
+            Loaded WhisperModel
+        """
+        with self._models_lock:
+            if self._compute_type is None:
+                self._device, self._compute_type = self._resolve_device_and_compute_type()
+            
+            key = (model_name, self._device, self._compute_type)
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+            
+            model = self._load_model(model_name, self._device, self._compute_type)
+            self._models[key] = model
+            while len(self._models) > self._model_cache_size:
+                evicted, _ = self._models.popitem(last=False)
+                logger.info(f"Unloaded Faster Whisper model: {evicted[0]}")
+            return model
+    
+    def _get_vad_options(self):
+        """Build the VAD options from config once and reuse them.
+        
+        Returns:
+            VadOptions instance, or None to use faster-whisper's defaults
+        """
+        if self._vad_options is None:
+            params = self.config.get("vad_parameters")
+            if params is None:
+                return None
+            if isinstance(params, dict):
+                from faster_whisper.vad import VadOptions
+                params = VadOptions(**params)
+            self._vad_options = params
+        return self._vad_options
+    
+    async def load_model(self, model: str) -> None:
+        """Load a model into the cache without transcribing anything."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(self.config.get("num_workers", 1))
+        await loop.run_in_executor(executor, self._get_model, model)
+    
+    def unload_model(self, model: str) -> None:
+        """Drop every cached variant of a model."""
+        with self._models_lock:
+            for key in [key for key in self._models if key[0] == model]:
+                del self._models[key]
+    
+    def unload(self) -> None:
+        """Drop all loaded models and release their memory."""
+        with self._models_lock:
+            self._models.clear()
+        gc.collect()
         try:
-            from faster_whisper import WhisperModel
-            return True
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
         except ImportError:
-            return False
+            pass
+    
+    def _resolve_device_and_compute_type(self):
+        """Pick the device and CTranslate2 compute type to load models with.
+        
+        Unless configured explicitly, weights are quantized to int8 at load
+        time (int8_float16 on CUDA), which roughly halves memory bandwidth
+        and uses CTranslate2's int8 GEMM kernels.
+        
+        Returns:
+            Tuple of (device, compute_type)
+        """
+        device = self.config.get("device", "auto")
+        compute_type = self.config.get("compute_type")
+        
+        if compute_type in (None, "", "auto"):
+            if device == "auto":
+                try:
+                    import ctranslate2
+                    use_cuda = ctranslate2.get_cuda_device_count() > 0
+                except Exception:
+                    use_cuda = False
+            else:
+                use_cuda = device == "cuda"
+            compute_type = "int8_float16" if use_cuda else "int8"
+        
+        return device, compute_type
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Get engine information, including the resolved compute type."""
+        info = super().get_info()
+        info["compute_type"] = self._compute_type or self.config.get("compute_type", "auto")
+        return info
+    
+    @classmethod
+    def is_available(cls, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Check if Faster Whisper is available."""
+        # Locate the package without importing it; the heavy import happens
+        # when a model is first loaded. A hit can't go away in this process,
+        # so only that is remembered
+        if not cls._import_ok:
+            cls._import_ok = importlib.util.find_spec("faster_whisper") is not None
+        return cls._import_ok
     
     def get_models(self) -> List[str]:
         """Get list of available models."""
-        return self._available_models.copy()
+        return list(_MODELS)
     
     def get_languages(self) -> List[str]:
         """Get list of supported languages."""
-        return self._available_languages.copy()
+        return list(_LANGUAGES)
+    
+    def _get_prompt_tokens(self, whisper_model, prompt: str) -> List[int]:
+        """Return the token ids for an initial prompt, encoding it once per model.
+        
+        faster-whisper accepts pre-tokenized prompts, so requests sharing a
+        prompt skip re-encoding it on every call.
+        
+        Args:
+            whisper_model: Loaded WhisperModel
+            prompt: Initial prompt text
+            
+        Returns:
+            Token ids as faster-whisper would encode the prompt
+        """
+        cache = self._prompt_tokens.setdefault(whisper_model, {})
+        tokens = cache.get(prompt)
+        if tokens is None:
+            tokens = whisper_model.hf_tokenizer.encode(
+                " " + prompt.strip(), add_special_tokens=False
+            ).ids
+            cache[prompt] = tokens
+        return tokens
+    
+    def _decode(self, whisper_model, file_path: Path, language_code: Optional[str]):
+        """Start decoding a file with a loaded model.
+        
+        Args:
+            whisper_model: Loaded WhisperModel
+            file_path: Path to the input file
+            language_code: Language code, or None for auto-detection
+            
+        Returns:
+            Tuple of (lazy segment dicts, transcription info, options used)
+        """
+        vad_filter = self.config.get("vad_filter", True)
+        
+        options = {
+            "beam_size": self.config.get("beam_size", 5),
+            "best_of": self.config.get("best_of", 5),
+            "temperature": self.config.get("temperature", 0.0),
+            # None means auto: decided once the audio length is known
+            "condition_on_previous_text": self.config.get("condition_on_previous_text"),
+        }
+        
+        initial_prompt = self.config.get("initial_prompt")
+        
+        audio = str(file_path)
+        if options["condition_on_previous_text"] is None:
+            options["condition_on_previous_text"] = True
+            if self._compute_type.startswith("int8"):
+                # Conditioning on the previous window serializes
+                # decoding and compounds quantization drift; on long
+                # files the throughput win outweighs the WER cost.
+                # Decode up front (transcribe would anyway) to learn
+                # the length without a separate probe.
+                from faster_whisper.audio import decode_audio
+                sampling_rate = whisper_model.feature_extractor.sampling_rate
+                audio = decode_audio(audio, sampling_rate=sampling_rate)
+                if audio.shape[0] / sampling_rate > self.config.get("ctx_threshold_s", 600):
+                    options["condition_on_previous_text"] = False
+        
+        segments, info = whisper_model.transcribe(
+            audio,
+            language=language_code,
+            vad_filter=vad_filter,
+            vad_parameters=self._get_vad_options() if vad_filter else None,
+            initial_prompt=self._get_prompt_tokens(whisper_model, initial_prompt) if initial_prompt else None,
+            **options
+        )
+        options["initial_prompt"] = initial_prompt
+        options["device"] = self._device
+        options["compute_type"] = self._compute_type
+        
+        segment_dicts = (
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        )
+        return segment_dicts, info, options
+    
+    def _build_result(
+        self,
+        output_path: Path,
+        segment_list: List[Dict[str, Any]],
+        full_text: str,
+        info,
+        options: Dict[str, Any],
+        model: str,
+        start_time: float
+    ) -> TranscriptionResult:
+        """Build a successful TranscriptionResult from decoder output."""
+        metadata = {
+            "language_probability": info.language_probability,
+            "duration": info.duration,
+            "duration_after_vad": getattr(info, "duration_after_vad", None),
+            "options": options
+        }
+        # Per-language probabilities are bulky and only useful for debugging
+        if self.config.get("include_raw_metadata", False):
+            metadata["all_language_probs"] = getattr(info, "all_language_probs", None)
+        
+        return TranscriptionResult(
+            success=True,
+            output_path=output_path,
+            text=full_text,
+            segments=segment_list,
+            language=info.language,
+            duration=info.duration,
+            processing_time=time.time() - start_time,
+            engine=self.name,
+            model=model,
+            metadata=metadata
+        )
+    
+    def _failed_result(self, error: Exception, model: str, start_time: float) -> TranscriptionResult:
+        """Build a failed TranscriptionResult."""
+        logger.error(f"Faster Whisper transcription failed: {error}")
+        
+        return TranscriptionResult(
+            success=False,
+            error=str(error),
+            processing_time=time.time() - start_time,
+            engine=self.name,
+            model=model
+        )
     
     async def transcribe(
         self,
@@ -110,97 +361,121 @@ class FasterWhisperEngine(BaseEngine):
         
         try:
             # Validate inputs
-            if not file_path.exists():
-                raise FileNotFoundError(f"Input file not found: {file_path}")
+            input_path = self._resolve_input(file_path)
             
-            if model not in self._available_models:
+            if model not in _MODELS_SET:
                 logger.warning(f"Unknown model {model}, using 'base'")
                 model = "base"
             
-            # Load model if needed
-            if self._model is None:
-                self._load_model(model)
-            
             # Generate output path if not provided
             if output_path is None:
                 output_path = file_path.parent / f"{file_path.stem}.{output_format}"
             
-            # Prepare transcription options
             language_code = None if language == "auto" else language
             
-            # Get additional options from config
-            beam_size = self.config.get("beam_size", 5)
-            best_of = self.config.get("best_of", 5)
-            temperature = self.config.get("temperature", 0.0)
-            condition_on_previous_text = self.config.get("condition_on_previous_text", True)
-            
-            logger.info(f"Transcribing {file_path} with Faster Whisper")
-            
-            # Perform transcription
-            segments, info = self._model.transcribe(
-                str(file_path),
-                language=language_code,
-                beam_size=beam_size,
-                best_of=best_of,
-                temperature=temperature,
-                condition_on_previous_text=condition_on_previous_text,
-                vad_filter=self.config.get("vad_filter", True),
-                vad_parameters=self.config.get("vad_parameters", None)
-            )
+            logger.info("Transcribing %s with Faster Whisper", file_path)
+            
+            def run():
+                # Load model if needed
+                whisper_model = self._get_model(model)
+                segments, info, options = self._decode(whisper_model, input_path, language_code)
+                
+                # Segments are decoded lazily; write each cue as it arrives
+                segment_list, full_text = self._stream_output(segments, output_format, output_path)
+                return segment_list, full_text, info, options
+            
+            # Model loading and decoding are blocking native work, so keep
+            # them off the event loop; CTranslate2 runs num_workers
+            # transcriptions in parallel, so size the pool to match
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor(self.config.get("num_workers", 1))
+            segment_list, full_text, info, options = await loop.run_in_executor(executor, run)
             
-            # Convert segments to list and extract text
-            segment_list = []
-            full_text_parts = []
-            
-            for segment in segments:
-                segment_dict = {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip()
-                }
-                segment_list.append(segment_dict)
-                full_text_parts.append(segment.text.strip())
-            
-            # Format and save output
-            self._format_output(segment_list, output_format, output_path)
-            
-            # Get full text
-            full_text = " ".join(full_text_parts)
-            
-            processing_time = time.time() - start_time
-            
-            return TranscriptionResult(
-                success=True,
-                output_path=output_path,
-                text=full_text,
-                segments=segment_list,
-                language=info.language,
-                duration=info.duration,
-                processing_time=processing_time,
-                engine=self.name,
-                model=model,
-                metadata={
-                    "language_probability": info.language_probability,
-                    "duration": info.duration,
-                    "duration_after_vad": getattr(info, "duration_after_vad", None),
-                    "all_language_probs": getattr(info, "all_language_probs", None),
-                    "options": {
-                        "beam_size": beam_size,
-                        "best_of": best_of,
-                        "temperature": temperature,
-                        "condition_on_previous_text": condition_on_previous_text
-                    }
-                }
+            return self._build_result(
+                output_path, segment_list, full_text, info, options, model, start_time
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Faster Whisper transcription failed: {e}")
-            
-            return TranscriptionResult(
-                success=False,
-                error=str(e),
-                processing_time=processing_time,
-                engine=self.name,
-                model=model
-            )
\ No newline at end of file
+            return self._failed_result(e, model, start_time)
+    
+    async def transcribe_batch(
+        self,
+        files: List[Path],
+        model: str = "base",
+        language: str = "auto",
+        output_format: str = "srt",
+        output_dir: Optional[Path] = None,
+        output_paths: Optional[List[Optional[Path]]] = None
+    ) -> AsyncIterator[TranscriptionResult]:
+        """Transcribe several files with a single model, yielding results in order.
+        
+        The model is loaded once for the whole batch, and each file's
+        subtitle is written on a separate thread while the next file is
+        decoding.
+        
+        Args:
+            files: Input files
+            model: Whisper model to use
+            language: Language code (auto for auto-detection)
+            output_format: Output format (srt, vtt, txt)
+            output_dir: Directory for output files (defaults to each input's directory)
+            output_paths: Explicit output path per file; None entries fall
+                back to output_dir
+            
+        Yields:
+            TranscriptionResult for each file, in input order
+        """
+        if model not in _MODELS_SET:
+            logger.warning(f"Unknown model {model}, using 'base'")
+            model = "base"
+        
+        language_code = None if language == "auto" else language
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor(self.config.get("num_workers", 1))
+        
+        def decode(file_path):
+            input_path = self._resolve_input(file_path)
+            segments, info, options = self._decode(whisper_model, input_path, language_code)
+            return list(segments), info, options
+        
+        def write(file_path, output_path, segments, info, options, start_time):
+            try:
+                if output_path is None:
+                    output_path = (output_dir or file_path.parent) / f"{file_path.stem}.{output_format}"
+                segment_list, full_text = self._stream_output(segments, output_format, output_path)
+                return self._build_result(
+                    output_path, segment_list, full_text, info, options, model, start_time
+                )
+            except Exception as e:
+                return self._failed_result(e, model, start_time)
+        
+        batch_start = time.time()
+        try:
+            whisper_model = await loop.run_in_executor(executor, self._get_model, model)
+        except Exception as e:
+            for _ in files:
+                yield self._failed_result(e, model, batch_start)
+            return
+        
+        # Future for the previous file's output, written while the next decodes
+        pending = None
+        for index, file_path in enumerate(files):
+            output_path = output_paths[index] if output_paths else None
+            start_time = time.time()
+            logger.info("Transcribing %s with Faster Whisper (batch)", file_path)
+            decoding = loop.run_in_executor(executor, decode, file_path)
+            if pending is not None:
+                yield await pending
+            
+            try:
+                segments, info, options = await decoding
+            except Exception as e:
+                pending = loop.create_future()
+                pending.set_result(self._failed_result(e, model, start_time))
+                continue
+            pending = loop.run_in_executor(
+                None, write, file_path, output_path, segments, info, options, start_time
+            )
+        
+        if pending is not None:
+            yield await pending
@@ -1,7 +1,11 @@
 """OpenAI Whisper engine implementation."""
 
+import asyncio
+import importlib.util
 import logging
+import threading
 import time
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -9,10 +13,32 @@ from .base import BaseEngine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# Supported models and languages, shared by every engine instance
+_MODELS = (
+    "tiny", "tiny.en", "base", "base.en", 
+    "small", "small.en", "medium", "medium.en",
+    "large", "large-v1", "large-v2", "large-v3"
+)
+_MODELS_SET = frozenset(_MODELS)
+
+_LANGUAGES = (
+    "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
+    "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
+    "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt",
+    "la", "mi", "ml", "cy", "sk", "te", "fa", "lv", "bn", "sr", "az", "sl",
+    "kn", "et", "mk", "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq",
+    "sw", "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc", "ka",
+    "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo", "ht", "ps", "tk",
+    "nn", "mt", "sa", "lb", "my", "bo", "tl", "mg", "as", "tt", "haw", "ln",
+    "ha", "ba", "jw", "su"
+)
+
 
 class OpenAIWhisperEngine(BaseEngine):
     """OpenAI Whisper engine for speech recognition."""
     
+    _import_ok = False
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize OpenAI Whisper engine.
         
@@ -21,22 +47,9 @@ class OpenAIWhisperEngine(BaseEngine):
         """
         super().__init__(config)
         self._whisper = None
-        self._available_models = [
-            "tiny", "tiny.en", "base", "base.en", 
-            "small", "small.en", "medium", "medium.en",
-            "large", "large-v1", "large-v2", "large-v3"
-        ]
-        self._available_languages = [
-            "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
-            "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
-            "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt",
-            "la", "mi", "ml", "cy", "sk", "te", "fa", "lv", "bn", "sr", "az", "sl",
-            "kn", "et", "mk", "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq",
-            "sw", "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc", "ka",
-            "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo", "ht", "ps", "tk",
-            "nn", "mt", "sa", "lb", "my", "bo", "tl", "mg", "as", "tt", "haw", "ln",
-            "ha", "ba", "jw", "su"
-        ]
+        # Loaded models by name; loading reads and moves GBs of weights
+        self._loaded_models: Dict[str, Any] = {}
+        self._models_lock = threading.Lock()
     
     def _load_whisper(self):
         """Load Whisper model lazily."""
@@ -49,21 +62,59 @@ class OpenAIWhisperEngine(BaseEngine):
                 logger.error("OpenAI Whisper not installed. Install with: pip install openai-whisper")
                 raise
     
-    def is_available(self) -> bool:
+    def _get_model(self, model_name: str):
+        """Return the loaded model for model_name, loading it on first use.
+        
+        Args:
+            model_name: Name of the model
+            
+        Returns:
+            Loaded Whisper model
+        """
+        # Called from executor threads; don't load the same model twice
+        with self._models_lock:
+            whisper_model = self._loaded_models.get(model_name)
+            if whisper_model is None:
+                device = self.config.get("device", "auto")
+                logger.info(f"Loading Whisper model: {model_name}")
+                whisper_model = self._whisper.load_model(
+                    model_name,
+                    device=None if device == "auto" else device
+                )
+                self._loaded_models[model_name] = whisper_model
+            return whisper_model
+    
+    async def load_model(self, model: str) -> None:
+        """Load a model without transcribing anything."""
+        def load():
+            self._load_whisper()
+            self._get_model(model)
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_executor(), load)
+    
+    def unload_model(self, model: str) -> None:
+        """Drop a loaded model."""
+        with self._models_lock:
+            self._loaded_models.pop(model, None)
+    
+    @classmethod
+    def is_available(cls, config: Optional[Dict[str, Any]] = None) -> bool:
         """Check if OpenAI Whisper is available."""
-        try:
-            import whisper
-            return True
-        except ImportError:
-            return False
+        # Locate the package without importing it; the heavy import happens
+        # when a model is first loaded. A hit can't go away in this process,
+        # so only that is remembered
+        if not cls._import_ok:
+            cls._import_ok = importlib.util.find_spec("whisper") is not None
+        return cls._import_ok
     
     def get_models(self) -> List[str]:
         """Get list of available models."""
-        return self._available_models.copy()
+        return list(_MODELS)
     
     def get_languages(self) -> List[str]:
         """Get list of supported languages."""
-        return self._available_languages.copy()
+        return list(_LANGUAGES)
     
     async def transcribe(
         self,
@@ -92,10 +143,9 @@ class OpenAIWhisperEngine(BaseEngine):
             self._load_whisper()
             
             # Validate inputs
-            if not file_path.exists():
-                raise FileNotFoundError(f"Input file not found: {file_path}")
+            input_path = self._resolve_input(file_path)
             
-            if model not in self._available_models:
+            if model not in _MODELS_SET:
                 logger.warning(f"Unknown model {model}, using 'base'")
                 model = "base"
             
@@ -103,8 +153,11 @@ class OpenAIWhisperEngine(BaseEngine):
             if output_path is None:
                 output_path = file_path.parent / f"{file_path.stem}.{output_format}"
             
-            logger.info(f"Loading Whisper model: {model}")
-            whisper_model = self._whisper.load_model(model)
+            # Loading and decoding are blocking native work, so keep them off
+            # the event loop
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            whisper_model = await loop.run_in_executor(executor, self._get_model, model)
             
             # Prepare transcription options
             options = {
@@ -113,6 +166,13 @@ class OpenAIWhisperEngine(BaseEngine):
                 "verbose": False
             }
             
+            # Half precision on CUDA uses tensor cores at half the bandwidth;
+            # Whisper only warns and falls back to fp32 on CPU
+            fp16 = self.config.get("fp16")
+            if fp16 is None:
+                fp16 = getattr(getattr(whisper_model, "device", None), "type", None) == "cuda"
+            options["fp16"] = fp16
+            
             # Add config options
             if "temperature" in self.config:
                 options["temperature"] = self.config["temperature"]
@@ -121,10 +181,12 @@ class OpenAIWhisperEngine(BaseEngine):
             if "best_of" in self.config:
                 options["best_of"] = self.config["best_of"]
             
-            logger.info(f"Transcribing {file_path} with options: {options}")
+            logger.info("Transcribing %s with options: %s", file_path, options)
             
             # Perform transcription
-            result = whisper_model.transcribe(str(file_path), **options)
+            result = await loop.run_in_executor(
+                executor, partial(whisper_model.transcribe, str(input_path), **options)
+            )
             
             # Extract segments
             segments = []
@@ -136,7 +198,7 @@ class OpenAIWhisperEngine(BaseEngine):
                 })
             
             # Format and save output
-            self._format_output(segments, output_format, output_path)
+            await self._write_output_async(segments, output_format, output_path)
             
             # Get full text
             full_text = result.get("text", "")
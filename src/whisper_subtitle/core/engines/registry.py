@@ -1,7 +1,11 @@
 """Engine registry for managing speech recognition engines."""
 
+import copy
+import importlib
 import logging
-from typing import Dict, List, Optional, Type
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Type, Union
 from .base import BaseEngine
 
 logger = logging.getLogger(__name__)
@@ -10,23 +14,68 @@ logger = logging.getLogger(__name__)
 class EngineRegistry:
     """Registry for managing speech recognition engines."""
     
-    def __init__(self):
-        self._engines: Dict[str, Type[BaseEngine]] = {}
+    def __init__(self, availability_ttl: float = 60.0):
+        """Initialize the registry.
+        
+        Args:
+            availability_ttl: Seconds to reuse an engine's is_available()
+                result before probing it again
+        """
+        self._engines: Dict[str, Union[str, Type[BaseEngine]]] = {}
         self._instances: Dict[str, BaseEngine] = {}
+        # Bumped on every registration so cached engine info is invalidated
+        self._generation = 0
+        # name -> (monotonic timestamp, available)
+        self._availability_cache: Dict[str, Tuple[float, bool]] = {}
+        self._availability_ttl = availability_ttl
+        # ((generation, availability snapshot), info) from the last build
+        self._info_cache: Optional[Tuple[tuple, Dict[str, Dict]]] = None
+        # Engines are looked up from executor threads (e.g. the CLI's info
+        # fan-out); guards importing classes and creating instances so each
+        # happens once. Reentrant because get_engine resolves under it
+        self._lock = threading.RLock()
     
-    def register(self, name: str, engine_class: Type[BaseEngine]) -> None:
+    def register(self, name: str, engine_class: Union[str, Type[BaseEngine]]) -> None:
         """Register an engine class.
         
         Args:
             name: Engine name
-            engine_class: Engine class
+            engine_class: Engine class, or a ``"module:attr"`` string that is
+                imported the first time the engine is requested
         """
-        if not issubclass(engine_class, BaseEngine):
+        if not isinstance(engine_class, str) and not issubclass(engine_class, BaseEngine):
             raise ValueError(f"Engine class must inherit from BaseEngine")
         
-        self._engines[name] = engine_class
+        with self._lock:
+            self._engines[name] = engine_class
+            self._generation += 1
+            self.invalidate(name)
         logger.info(f"Registered engine: {name}")
     
+    def _resolve(self, name: str) -> Type[BaseEngine]:
+        """Return the engine class for name, importing it if still lazy.
+        
+        Args:
+            name: Engine name
+            
+        Returns:
+            Engine class
+        """
+        engine_class = self._engines[name]
+        if not isinstance(engine_class, str):
+            return engine_class
+        
+        with self._lock:
+            # Another thread may have imported it while we waited
+            engine_class = self._engines[name]
+            if isinstance(engine_class, str):
+                module_name, attr = engine_class.split(":")
+                engine_class = getattr(importlib.import_module(module_name), attr)
+                if not issubclass(engine_class, BaseEngine):
+                    raise ValueError(f"Engine class must inherit from BaseEngine")
+                self._engines[name] = engine_class
+            return engine_class
+    
     def get_engine(self, name: str, config: Optional[Dict] = None) -> Optional[BaseEngine]:
         """Get an engine instance.
         
@@ -42,18 +91,66 @@ class EngineRegistry:
             return None
         
         # Return cached instance if available and no new config
-        if name in self._instances and config is None:
-            return self._instances[name]
+        instance = self._instances.get(name)
+        if instance is not None and config is None:
+            return instance
+        
+        with self._lock:
+            # Another thread may have created it while we waited
+            instance = self._instances.get(name)
+            if instance is not None and config is None:
+                return instance
+            
+            # Create new instance
+            try:
+                engine_class = self._resolve(name)
+                instance = engine_class(config or {})
+                self._instances[name] = instance
+                return instance
+            except Exception as e:
+                logger.error(f"Failed to create engine {name}: {e}")
+                return None
+    
+    def _check_available(self, name: str) -> bool:
+        """Return whether an engine is available, reusing recent probes.
+        
+        Probes can import large libraries or run external binaries, so the
+        result is cached for ``availability_ttl`` seconds.
+        
+        Args:
+            name: Engine name
+            
+        Returns:
+            True if engine is available, False otherwise
+        """
+        now = time.monotonic()
+        cached = self._availability_cache.get(name)
+        if cached is not None and now - cached[0] < self._availability_ttl:
+            return cached[1]
         
-        # Create new instance
+        # Probe the class itself; only a configured instance that already
+        # exists contributes its config
         try:
-            engine_class = self._engines[name]
-            instance = engine_class(config or {})
-            self._instances[name] = instance
-            return instance
+            engine_class = self._resolve(name)
         except Exception as e:
-            logger.error(f"Failed to create engine {name}: {e}")
-            return None
+            logger.error(f"Failed to load engine {name}: {e}")
+            available = False
+        else:
+            instance = self._instances.get(name)
+            available = engine_class.is_available(instance.config if instance else None)
+        self._availability_cache[name] = (now, available)
+        return available
+    
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget cached availability results.
+        
+        Args:
+            name: Engine name, or None to clear every engine
+        """
+        if name is None:
+            self._availability_cache.clear()
+        else:
+            self._availability_cache.pop(name, None)
     
     def get_available_engines(self) -> List[str]:
         """Get list of available engine names.
@@ -61,12 +158,7 @@ class EngineRegistry:
         Returns:
             List of engine names that are ready to use
         """
-        available = []
-        for name in self._engines:
-            engine = self.get_engine(name)
-            if engine and engine.is_available():
-                available.append(name)
-        return available
+        return [name for name in self._engines if self._check_available(name)]
     
     def get_all_engines(self) -> List[str]:
         """Get list of all registered engine names.
@@ -85,8 +177,9 @@ class EngineRegistry:
         Returns:
             True if engine is available, False otherwise
         """
-        engine = self.get_engine(name)
-        return engine is not None and engine.is_available()
+        if name not in self._engines:
+            return False
+        return self._check_available(name)
     
     def get_engine_info(self, name: str) -> Optional[Dict]:
         """Get engine information.
@@ -102,16 +195,24 @@ class EngineRegistry:
     
     def get_all_engines_info(self) -> Dict[str, Dict]:
         """Get information for all engines.
-
+        
+        The info is rebuilt only when an engine is registered or a (TTL
+        cached) availability probe changes its answer.
+        
         Returns:
             Dict mapping engine names to their info
         """
-        info = {}
-        for name in self._engines:
-            engine_info = self.get_engine_info(name)
-            if engine_info:
-                info[name] = engine_info
-        return info
+        availability = tuple((name, self._check_available(name)) for name in self._engines)
+        key = (self._generation, availability)
+        if self._info_cache is None or self._info_cache[0] != key:
+            info = {}
+            for name, available in availability:
+                engine_info = self.get_engine_info(name)
+                if engine_info:
+                    info[name] = dict(engine_info, ready=available)
+            self._info_cache = (key, info)
+        # Callers may modify what they get back
+        return copy.deepcopy(self._info_cache[1])
     
     def list_engines(self) -> List[str]:
         """List all registered engines.
@@ -126,12 +227,12 @@ class EngineRegistry:
 registry = EngineRegistry()
 
 
-def register_engine(name: str, engine_class: Type[BaseEngine]) -> None:
+def register_engine(name: str, engine_class: Union[str, Type[BaseEngine]]) -> None:
     """Register an engine in the global registry.
     
     Args:
         name: Engine name
-        engine_class: Engine class
+        engine_class: Engine class or ``"module:attr"`` string
     """
     registry.register(name, engine_class)
 
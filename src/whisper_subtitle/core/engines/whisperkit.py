@@ -1,16 +1,39 @@
 """WhisperKit engine implementation for Apple Silicon."""
 
+import asyncio
+import io
 import logging
+import os
+import shutil
+import tempfile
 import time
 import subprocess
-import json
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 from .base import BaseEngine, TranscriptionResult
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
+# Supported models and languages, shared by every engine instance
+_MODELS = (
+    "tiny", "tiny.en", "base", "base.en", 
+    "small", "small.en", "medium", "medium.en",
+    "large-v3"
+)
+_MODELS_SET = frozenset(_MODELS)
+
+_LANGUAGES = (
+    "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
+    "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
+    "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt"
+)
+
 
 class WhisperKitEngine(BaseEngine):
     """WhisperKit engine for Apple Silicon devices."""
@@ -23,37 +46,22 @@ class WhisperKitEngine(BaseEngine):
         """
         super().__init__(config)
         self._cli_path = self.config.get("cli_path", "whisperkit-cli")
-        self._available_models = [
-            "tiny", "tiny.en", "base", "base.en", 
-            "small", "small.en", "medium", "medium.en",
-            "large-v3"
-        ]
-        self._available_languages = [
-            "auto", "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr", "pl",
-            "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi", "he", "uk", "el",
-            "ms", "cs", "ro", "da", "hu", "ta", "no", "th", "ur", "hr", "bg", "lt"
-        ]
+        self._cached_version: Optional[str] = None
     
-    def is_available(self) -> bool:
+    @classmethod
+    def is_available(cls, config: Optional[Dict[str, Any]] = None) -> bool:
         """Check if WhisperKit CLI is available."""
-        try:
-            result = subprocess.run(
-                [self._cli_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            return False
+        # A PATH lookup instead of spawning the CLI on every status check
+        cli_path = (config or {}).get("cli_path", "whisperkit-cli")
+        return shutil.which(cli_path) is not None
     
     def get_models(self) -> List[str]:
         """Get list of available models."""
-        return self._available_models.copy()
+        return list(_MODELS)
     
     def get_languages(self) -> List[str]:
         """Get list of supported languages."""
-        return self._available_languages.copy()
+        return list(_LANGUAGES)
     
     async def transcribe(
         self,
@@ -76,13 +84,13 @@ class WhisperKitEngine(BaseEngine):
             TranscriptionResult with transcription details
         """
         start_time = time.time()
+        work_dir = None
         
         try:
             # Validate inputs
-            if not file_path.exists():
-                raise FileNotFoundError(f"Input file not found: {file_path}")
+            input_path = self._resolve_input(file_path)
             
-            if model not in self._available_models:
+            if model not in _MODELS_SET:
                 logger.warning(f"Unknown model {model}, using 'base'")
                 model = "base"
             
@@ -90,14 +98,21 @@ class WhisperKitEngine(BaseEngine):
             if output_path is None:
                 output_path = file_path.parent / f"{file_path.stem}.{output_format}"
             
+            # The CLI has no option to name its output file, so let it write
+            # into a private directory: its JSON is then the only file there,
+            # with no glob over a shared output directory and no clash with
+            # concurrent runs on files with the same stem
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            work_dir = Path(tempfile.mkdtemp(prefix=".whisperkit-", dir=output_path.parent))
+            
             # Prepare WhisperKit command
             cmd = [
                 self._cli_path,
                 "transcribe",
-                str(file_path),
+                str(input_path),
                 "--model", model,
                 "--output-format", "json",  # Always get JSON for processing
-                "--output-dir", str(output_path.parent)
+                "--output-dir", str(work_dir)
             ]
             
             # Add language if specified
@@ -114,37 +129,53 @@ class WhisperKitEngine(BaseEngine):
             if "beam_size" in self.config:
                 cmd.extend(["--beam-size", str(self.config["beam_size"])])
             
-            logger.info(f"Running WhisperKit command: {' '.join(cmd)}")
+            # Per-request logging is formatted lazily; the join only runs if
+            # the message will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running WhisperKit command: %s", " ".join(cmd))
             
-            # Run WhisperKit CLI
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.get("timeout", 3600)  # 1 hour default timeout
+            # Run WhisperKit CLI without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=self.config.get("timeout", 3600)  # 1 hour default timeout
+                )
+            except asyncio.TimeoutError:
+                # Don't leave the CLI running; reap it before reporting
+                process.kill()
+                await process.communicate()
+                raise
+            except asyncio.CancelledError:
+                if process.returncode is None:
+                    process.kill()
+                raise
             
-            if result.returncode != 0:
-                raise RuntimeError(f"WhisperKit CLI failed: {result.stderr}")
+            if process.returncode != 0:
+                raise RuntimeError(f"WhisperKit CLI failed: {stderr.decode('utf-8', errors='replace')}")
             
             # Parse JSON output
-            json_output_path = output_path.parent / f"{file_path.stem}.json"
+            json_output_path = work_dir / f"{file_path.stem}.json"
             
             if not json_output_path.exists():
-                # Try to find the JSON file with different naming
-                json_files = list(output_path.parent.glob(f"{file_path.stem}*.json"))
+                # Different naming; anything the CLI wrote here is ours
+                with os.scandir(work_dir) as entries:
+                    json_files = [entry.path for entry in entries if entry.name.endswith(".json")]
                 if json_files:
-                    json_output_path = json_files[0]
+                    json_output_path = Path(json_files[0])
                 else:
                     raise FileNotFoundError("WhisperKit JSON output not found")
             
-            # Load transcription result
-            with open(json_output_path, 'r', encoding='utf-8') as f:
-                whisperkit_result = json.load(f)
+            # Load transcription result (orjson parses bytes directly when installed)
+            whisperkit_result = _loads(json_output_path.read_bytes())
             
             # Extract segments
             segments = []
-            full_text_parts = []
+            text_buf = io.StringIO()
             
             for segment in whisperkit_result.get("segments", []):
                 segment_dict = {
@@ -154,23 +185,30 @@ class WhisperKitEngine(BaseEngine):
                 }
                 segments.append(segment_dict)
                 if segment_dict["text"]:
-                    full_text_parts.append(segment_dict["text"])
+                    if text_buf.tell():
+                        text_buf.write(" ")
+                    text_buf.write(segment_dict["text"])
             
             # Format and save output in requested format
-            self._format_output(segments, output_format, output_path)
+            await self._write_output_async(segments, output_format, output_path)
             
             # Get full text
-            full_text = " ".join(full_text_parts)
+            full_text = text_buf.getvalue()
             
-            # Clean up JSON file if not needed
-            if output_format != "json":
-                try:
-                    json_output_path.unlink()
-                except Exception:
-                    pass  # Ignore cleanup errors
+            # Keep the JSON next to the output only if it was asked for; the
+            # work directory is removed below either way
+            if output_format == "json":
+                os.replace(json_output_path, output_path.parent / f"{file_path.stem}.json")
             
             processing_time = time.time() - start_time
             
+            metadata = {"whisperkit_version": await self._get_version()}
+            # The raw CLI output and parsed JSON duplicate the segments and are
+            # only useful for debugging
+            if self.config.get("include_raw_metadata", False):
+                metadata["cli_output"] = stdout.decode("utf-8", errors="replace")
+                metadata["original_result"] = whisperkit_result
+            
             return TranscriptionResult(
                 success=True,
                 output_path=output_path,
@@ -181,14 +219,10 @@ class WhisperKitEngine(BaseEngine):
                 processing_time=processing_time,
                 engine=self.name,
                 model=model,
-                metadata={
-                    "whisperkit_version": self._get_version(),
-                    "cli_output": result.stdout,
-                    "original_result": whisperkit_result
-                }
+                metadata=metadata
             )
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             processing_time = time.time() - start_time
             error_msg = f"WhisperKit transcription timed out after {self.config.get('timeout', 3600)} seconds"
             logger.error(error_msg)
@@ -212,25 +246,42 @@ class WhisperKitEngine(BaseEngine):
                 engine=self.name,
                 model=model
             )
+            
+        finally:
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
     
-    def _get_version(self) -> str:
+    async def _get_version(self) -> str:
         """Get WhisperKit CLI version.
         
+        The CLI is asked only once; a failed or timed out probe is cached as
+        'unknown' too, so it doesn't cost every later transcription.
+        
         Returns:
             Version string or 'unknown'
         """
+        if self._cached_version is not None:
+            return self._cached_version
+        
+        version = "unknown"
         try:
-            result = subprocess.run(
-                [self._cli_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
+            process = await asyncio.create_subprocess_exec(
+                self._cli_path, "--version",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.communicate()
+                raise
+            if process.returncode == 0:
+                version = stdout.decode("utf-8", errors="replace").strip()
         except Exception:
             pass
-        return "unknown"
+        self._cached_version = version
+        return version
     
     def download_model(self, model: str) -> bool:
         """Download a WhisperKit model.
@@ -283,7 +334,7 @@ class WhisperKitEngine(BaseEngine):
                 models = []
                 for line in result.stdout.split('\n'):
                     line = line.strip()
-                    if line and not line.startswith('#') and line in self._available_models:
+                    if line and not line.startswith('#') and line in _MODELS_SET:
                         models.append(line)
                 return models
             
@@ -0,0 +1,224 @@
+"""Content-addressed cache of transcription results."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .engines.base import TranscriptionResult
+
+try:
+    from blake3 import blake3 as _new_digest
+except ImportError:
+    # OpenSSL's sha256 uses the CPU's SHA extensions where available
+    _new_digest = hashlib.sha256
+
+logger = logging.getLogger(__name__)
+
+# Slice size fed to the digest when hashing input files
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Default on-disk budget for persisted entries
+_DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+
+def hash_file(file_path: Path) -> str:
+    """Hash a file's contents.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Hex digest of the contents
+    """
+    digest = _new_digest()
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Empty files can't be mapped
+            return digest.hexdigest()
+        
+        # Hash straight from the page cache instead of copying into buffers
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, size, _HASH_CHUNK_SIZE):
+                    digest.update(view[offset:offset + _HASH_CHUNK_SIZE])
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Cache of transcription results keyed by input content and options.
+    
+    Entries are kept in memory up to ``max_bytes`` (least recently used
+    first out) and, when a cache directory is given, also written to disk
+    so they survive restarts.
+    """
+    
+    def __init__(
+        self,
+        max_bytes: int,
+        cache_dir: Optional[Path] = None,
+        max_disk_bytes: int = _DEFAULT_MAX_DISK_BYTES
+    ):
+        """Initialize the cache.
+        
+        Args:
+            max_bytes: Memory budget for cached subtitle output
+            cache_dir: Directory for persisted entries, or None for memory only
+            max_disk_bytes: Size budget for persisted entries; the least
+                recently used ones are deleted beyond it
+        """
+        self._max_bytes = max_bytes
+        self._cache_dir = cache_dir
+        self._max_disk_bytes = max_disk_bytes
+        # key -> (result, output file bytes), least recently used first.
+        # Only touched from the event loop between awaits, so no lock needed
+        self._entries: "OrderedDict[str, Tuple[TranscriptionResult, bytes]]" = OrderedDict()
+        self._size = 0
+    
+    @staticmethod
+    def make_key(
+        digest: str,
+        engine: str,
+        model: str,
+        language: str,
+        output_format: str,
+        engine_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build a cache key from the input digest and transcription options.
+        
+        The engine's configuration (prompt, beam size, VAD options, ...)
+        changes the output too, so a stable hash of it is part of the key.
+        """
+        config_json = json.dumps(engine_config or {}, sort_keys=True, default=repr)
+        config_digest = hashlib.sha256(config_json.encode("utf-8")).hexdigest()[:16]
+        return f"{digest}-{engine}-{model}-{language}-{output_format}-{config_digest}"
+    
+    async def get(self, key: str, output_path: Path) -> Optional[TranscriptionResult]:
+        """Return a cached result, writing its output to output_path.
+        
+        Args:
+            key: Cache key
+            output_path: Where the caller expects the output file
+            
+        Returns:
+            TranscriptionResult for the cached run, or None on a miss
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self._cache_dir is not None:
+            entry = await loop.run_in_executor(None, self._load, key)
+            if entry is None:
+                return None
+            self._remember(key, *entry)
+        else:
+            return None
+        
+        result, output = entry
+        await loop.run_in_executor(None, _write_output, output_path, output)
+        logger.info(f"Reusing cached transcription for {output_path.name}")
+        return replace(
+            result,
+            output_path=output_path,
+            metadata=dict(result.metadata or {}, cache_hit=True)
+        )
+    
+    async def put(self, key: str, result: TranscriptionResult) -> None:
+        """Cache a successful result together with its output file.
+        
+        Args:
+            key: Cache key
+            result: Transcription result whose output file exists
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            output = await loop.run_in_executor(None, result.output_path.read_bytes)
+        except OSError as e:
+            logger.warning(f"Not caching transcription result: {e}")
+            return
+        
+        self._remember(key, result, output)
+        if self._cache_dir is not None:
+            await loop.run_in_executor(None, self._save, key, result, output)
+    
+    def _remember(self, key: str, result: TranscriptionResult, output: bytes) -> None:
+        """Keep an entry in memory, evicting old ones to stay within budget."""
+        size = len(output)
+        if size > self._max_bytes:
+            return
+        
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old[1])
+        self._entries[key] = (result, output)
+        self._size += size
+        
+        while self._size > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+    
+    def _load(self, key: str) -> Optional[Tuple[TranscriptionResult, bytes]]:
+        """Read a persisted entry, if present and readable."""
+        cache_path = self._cache_dir / f"{key}.pkl"
+        try:
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+            # Mark as recently used for disk eviction
+            os.utime(cache_path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+    
+    def _save(self, key: str, result: TranscriptionResult, output: bytes) -> None:
+        """Persist an entry atomically; failures only cost a future miss."""
+        try:
+            # Entries are unpickled on load, so keep them private to the user
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_path = self._cache_dir / f"{key}.pkl"
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "wb") as f:
+                pickle.dump((result, output), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._prune_disk()
+        except Exception as e:
+            logger.warning(f"Failed to persist cache entry {key}: {e}")
+    
+    def _prune_disk(self) -> None:
+        """Delete the least recently used persisted entries beyond the budget."""
+        entries = []
+        total = 0
+        with os.scandir(self._cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl") and entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def _write_output(output_path: Path, output: bytes) -> None:
+    """Write cached output bytes to the requested path."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(output)
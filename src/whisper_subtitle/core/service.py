@@ -2,14 +2,16 @@
 
 import logging
 import asyncio
+import os
+import stat
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List
 from datetime import datetime
 
 from .engines.registry import get_engine, get_available_engines
 from .engines.base import TranscriptionResult
-from .transcription import TranscriptionService
-from ..config.settings import Settings
+from .transcription import TranscriptionService, get_transcription_service
+from ..config.settings import Settings, settings as default_settings
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +25,8 @@ class SubtitleService:
         Args:
             settings: Application settings
         """
-        self.settings = settings or Settings()
-        self.transcription_service = TranscriptionService(self.settings)
+        self.settings = settings or default_settings
+        self.transcription_service = get_transcription_service(self.settings)
         
         # Ensure directories exist
         self.settings.ensure_directories()
@@ -91,8 +93,8 @@ class SubtitleService:
         language: str = "auto",
         output_format: str = "srt",
         max_concurrent: Optional[int] = None
-    ) -> List[TranscriptionResult]:
-        """Transcribe multiple files concurrently.
+    ) -> AsyncIterator[TranscriptionResult]:
+        """Transcribe multiple files concurrently, yielding results as they finish.
         
         Args:
             file_paths: List of input file paths
@@ -102,45 +104,57 @@ class SubtitleService:
             output_format: Output format
             max_concurrent: Maximum concurrent tasks
             
-        Returns:
-            List of TranscriptionResults
+        Yields:
+            TranscriptionResult for each file in completion order; failures
+            are reported as unsuccessful results with the input file in
+            their metadata
         """
         max_concurrent = max_concurrent or self.settings.max_concurrent_tasks
         
+        # Requests for engines that batch are coalesced by the transcription
+        # service, so let them all through at once
+        engine_instance = get_engine(engine or self.settings.default_engine)
+        if engine_instance is not None and engine_instance.supports_batching:
+            max_concurrent = max(max_concurrent, len(file_paths))
+        
         logger.info(f"Starting batch transcription: {len(file_paths)} files")
         
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def transcribe_with_semaphore(file_path: Path) -> TranscriptionResult:
             async with semaphore:
-                return await self.transcribe_file(
-                    file_path=file_path,
-                    engine=engine,
-                    model=model,
-                    language=language,
-                    output_format=output_format
-                )
-        
-        tasks = [transcribe_with_semaphore(fp) for fp in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Convert exceptions to failed results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(TranscriptionResult(
-                    success=False,
-                    error=str(result),
-                    engine=engine,
-                    model=model
-                ))
-            else:
-                processed_results.append(result)
+                try:
+                    return await self.transcribe_file(
+                        file_path=file_path,
+                        engine=engine,
+                        model=model,
+                        language=language,
+                        output_format=output_format
+                    )
+                except Exception as e:
+                    return TranscriptionResult(
+                        success=False,
+                        error=str(e),
+                        engine=engine,
+                        model=model,
+                        metadata={"file_path": str(file_path)}
+                    )
         
-        successful = sum(1 for r in processed_results if r.success)
-        logger.info(f"Batch transcription completed: {successful}/{len(file_paths)} successful")
+        # Hand each result over as soon as it's ready instead of holding
+        # the whole batch until the slowest file finishes
+        tasks = [asyncio.ensure_future(transcribe_with_semaphore(fp)) for fp in file_paths]
+        successful = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                successful += result.success
+                yield result
+        finally:
+            # The caller may stop iterating early
+            for task in tasks:
+                task.cancel()
         
-        return processed_results
+        logger.info(f"Batch transcription completed: {successful}/{len(file_paths)} successful")
     
     def get_available_engines(self) -> List[str]:
         """Get list of available engines.
@@ -180,21 +194,28 @@ class SubtitleService:
         Returns:
             True if file is valid, False otherwise
         """
-        if not file_path.exists():
+        # Extension first: it needs no syscall
+        if file_path.suffix.lower() not in self.settings.allowed_extensions_set:
             return False
         
-        if not file_path.is_file():
-            return False
-        
-        # Check file size
-        if file_path.stat().st_size > self.settings.max_file_size:
+        # One stat answers existence, type and size
+        try:
+            st = file_path.stat()
+        except OSError:
             return False
         
-        # Check file extension
-        if file_path.suffix.lower() not in self.settings.allowed_extensions:
-            return False
+        return stat.S_ISREG(st.st_mode) and st.st_size <= self.settings.max_file_size
+    
+    def validate_files(self, file_paths: List[Path]) -> List[Path]:
+        """Return the files that can be processed, in their original order.
         
-        return True
+        Args:
+            file_paths: Paths to check
+            
+        Returns:
+            The valid paths
+        """
+        return [file_path for file_path in file_paths if self.validate_file(file_path)]
     
     def get_output_path(
         self,
@@ -221,9 +242,11 @@ class SubtitleService:
         
         return output_dir / filename
     
-    def cleanup_temp_files(self, max_age_hours: int = 24) -> int:
+    async def cleanup_temp_files(self, max_age_hours: int = 24) -> int:
         """Clean up temporary files older than specified age.
         
+        The scan runs in a worker thread so it doesn't block the event loop.
+        
         Args:
             max_age_hours: Maximum age in hours
             
@@ -235,15 +258,48 @@ class SubtitleService:
             return 0
         
         cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
-        cleaned_count = 0
         
-        for file_path in temp_dir.rglob("*"):
-            if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                try:
-                    file_path.unlink()
-                    cleaned_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to delete temp file {file_path}: {e}")
+        loop = asyncio.get_running_loop()
+        cleaned_count = await loop.run_in_executor(
+            None, _remove_files_older_than, str(temp_dir), cutoff_time
+        )
         
         logger.info(f"Cleaned up {cleaned_count} temporary files")
-        return cleaned_count
\ No newline at end of file
+        return cleaned_count
+
+
+def _remove_files_older_than(root: str, cutoff_time: float) -> int:
+    """Delete regular files under root last modified before cutoff_time.
+    
+    Walks the tree with os.scandir, whose entries carry their file type and
+    cache their stat result, instead of two stat calls per path.
+    
+    Args:
+        root: Directory to clean
+        cutoff_time: Files with an older mtime are deleted
+        
+    Returns:
+        Number of files deleted
+    """
+    cleaned_count = 0
+    pending = [root]
+    
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError as e:
+            logger.warning(f"Failed to scan temp directory: {e}")
+            continue
+        
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        cleaned_count += 1
+                except OSError as e:
+                    logger.warning(f"Failed to delete temp file {entry.path}: {e}")
+    
+    return cleaned_count
@@ -1,19 +1,32 @@
 """Transcription service for handling speech recognition."""
 
 import asyncio
+import itertools
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Optional, Dict, Any, AsyncIterator, List, Union
+from dataclasses import dataclass, replace
 
-from ..config.settings import Settings
+from ..config.settings import Settings, settings as default_settings
+from .batching import BatchQueue
+from .result_cache import ResultCache, hash_file
 from .engines.registry import EngineRegistry, registry
-from .engines.base import TranscriptionResult
+from .engines.base import BaseEngine, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
 
+# One service per process, so every caller shares the same loaded models
+_shared_service: Optional["TranscriptionService"] = None
+
+# Sequence numbers for generated output filenames
+_output_counter = itertools.count(1)
+
+
 @dataclass
 class TranscriptionRequest:
     """Transcription request data."""
@@ -35,13 +48,101 @@ class TranscriptionRequest:
 class TranscriptionService:
     """Service for handling transcription requests."""
     
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Optional[Settings] = None):
         """Initialize the transcription service."""
+        settings = settings or default_settings
         self.settings = settings
         self.engine_registry = registry
         
+        # Engines with a model already loaded, keyed by (engine, model),
+        # least recently used first
+        self._ready: "OrderedDict[tuple, BaseEngine]" = OrderedDict()
+        # Created on first use for the running loop; a lock bound to one
+        # loop cannot be awaited from another
+        self._ready_lock: Optional[asyncio.Lock] = None
+        self._ready_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Concurrent requests for engines that batch are grouped here
+        self._batch_queue = BatchQueue(
+            self._get_ready_engine,
+            max_batch=settings.batch_max_size,
+            max_wait_ms=settings.batch_max_wait_ms
+        )
+        
+        # Results for inputs seen before, keyed by content hash and options
+        self._result_cache = None
+        if settings.result_cache_enabled:
+            self._result_cache = ResultCache(
+                settings.result_cache_max_bytes,
+                settings.cache_dir if settings.result_cache_persist else None,
+                settings.result_cache_max_disk_bytes
+            )
+        # Requests currently running, keyed like the result cache; completes
+        # once the result is cached so identical requests can reuse it.
+        # Only touched from the event loop between awaits, so no lock needed
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
         # Import engines to ensure they are registered
         from . import engines
+    
+    async def preload(self, engine: str, model: Optional[str] = None) -> BaseEngine:
+        """Load an engine's model ahead of the first request.
+        
+        Args:
+            engine: Engine name
+            model: Model name (defaults to the engine's configured default)
+            
+        Returns:
+            Engine instance with the model loaded
+        """
+        if model is None:
+            model = self.settings.get_engine_config(engine).default_model
+        return await self._get_ready_engine(engine, model)
+    
+    async def _get_ready_engine(self, engine: str, model: str) -> BaseEngine:
+        """Return an engine with model loaded, loading it on first use.
+        
+        At most ``max_loaded_models`` engine/model pairs are kept; the least
+        recently used one is unloaded to make room.
+        
+        Args:
+            engine: Engine name
+            model: Model name
+            
+        Returns:
+            Engine instance
+        """
+        key = (engine, model)
+        engine_instance = self._ready.get(key)
+        if engine_instance is not None:
+            self._ready.move_to_end(key)
+            return engine_instance
+        
+        loop = asyncio.get_running_loop()
+        if self._ready_loop is not loop:
+            self._ready_loop = loop
+            self._ready_lock = asyncio.Lock()
+        
+        async with self._ready_lock:
+            # Another request may have loaded it while we waited
+            engine_instance = self._ready.get(key)
+            if engine_instance is not None:
+                self._ready.move_to_end(key)
+                return engine_instance
+            
+            engine_instance = self.engine_registry.get_engine(engine)
+            if engine_instance is None:
+                raise ValueError(f"Engine not available: {engine}")
+            
+            await engine_instance.load_model(model)
+            self._ready[key] = engine_instance
+            
+            while len(self._ready) > max(1, self.settings.max_loaded_models):
+                (evicted_engine, evicted_model), evicted = self._ready.popitem(last=False)
+                evicted.unload_model(evicted_model)
+                logger.info(f"Unloaded {evicted_engine}/{evicted_model}")
+            
+            return engine_instance
         
     async def transcribe_file(
         self,
@@ -77,13 +178,9 @@ class TranscriptionService:
         if not self.engine_registry.is_engine_available(engine):
             raise ValueError(f"Engine not available: {engine}")
         
-        # Get engine instance
-        engine_instance = self.engine_registry.get_engine(engine)
-        
         # Set model if not provided
         if model is None:
-            engine_config = self.settings.get_engine_config(engine)
-            model = engine_config.get("default_model", "base")
+            model = self.settings.get_engine_config(engine).default_model
         
         # Generate output path if not provided
         if output_path is None:
@@ -102,28 +199,71 @@ class TranscriptionService:
             **kwargs
         )
         
-        logger.info(f"Starting transcription: {file_path} with {engine}")
+        post_process = any([request.merge_segments, request.split_segments, request.filter_segments])
+        
+        # Identical input and options give an identical result
+        cache_key = None
+        inflight = None
+        if self._result_cache is not None and not post_process:
+            loop = asyncio.get_running_loop()
+            digest = await loop.run_in_executor(None, hash_file, file_path)
+            engine_config = getattr(self.engine_registry.get_engine(engine), "config", None)
+            cache_key = ResultCache.make_key(digest, engine, model, language, output_format, engine_config)
+            while True:
+                cached = await self._result_cache.get(cache_key, output_path)
+                if cached is not None:
+                    return cached
+                # An identical request is running; wait for it to cache its
+                # result. If it failed or wasn't cached, run it ourselves
+                pending = self._inflight.get(cache_key)
+                if pending is None:
+                    break
+                await asyncio.shield(pending)
+            inflight = loop.create_future()
+            self._inflight[cache_key] = inflight
         
         try:
+            # Get an engine instance with the model already loaded
+            engine_instance = await self._get_ready_engine(engine, model)
+            
+            logger.info(f"Starting transcription: {file_path} with {engine}")
+            
             # Perform transcription
-            result = await engine_instance.transcribe(
-                file_path=file_path,
-                model=model,
-                language=language,
-                output_format=output_format,
-                output_path=output_path
-            )
+            if engine_instance.supports_batching:
+                result = await self._batch_queue.submit(
+                    file_path,
+                    engine,
+                    model,
+                    language=language,
+                    output_format=output_format,
+                    output_path=output_path
+                )
+            else:
+                result = await engine_instance.transcribe(
+                    file_path=file_path,
+                    model=model,
+                    language=language,
+                    output_format=output_format,
+                    output_path=output_path
+                )
             
             # Post-process if needed
-            if any([request.merge_segments, request.split_segments, request.filter_segments]):
+            if post_process:
                 result = await self._post_process_result(result, request)
             
+            if cache_key is not None and result.success and result.output_path:
+                await self._result_cache.put(cache_key, result)
+            
             logger.info(f"Transcription completed: {result.output_path}")
             return result
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
+        finally:
+            if inflight is not None:
+                del self._inflight[cache_key]
+                inflight.set_result(None)
     
     async def transcribe_batch(
         self,
@@ -135,8 +275,8 @@ class TranscriptionService:
         output_dir: Optional[Union[str, Path]] = None,
         max_concurrent: int = 3,
         **kwargs
-    ) -> List[TranscriptionResult]:
-        """Transcribe multiple files concurrently.
+    ) -> AsyncIterator[TranscriptionResult]:
+        """Transcribe multiple files concurrently, yielding results as they finish.
         
         Args:
             file_paths: List of file paths to transcribe
@@ -148,14 +288,20 @@ class TranscriptionService:
             max_concurrent: Maximum concurrent transcriptions
             **kwargs: Additional options
             
-        Returns:
-            List of TranscriptionResult objects
+        Yields:
+            TranscriptionResult for each file in completion order; failures
+            are reported as unsuccessful results with the input file in
+            their metadata
         """
         if output_dir:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create semaphore to limit concurrent transcriptions
+        # Create semaphore to limit concurrent transcriptions. Engines that
+        # batch take everything at once; the batch queue bounds the work
+        engine_instance = self.engine_registry.get_engine(engine)
+        if engine_instance is not None and engine_instance.supports_batching:
+            max_concurrent = max(max_concurrent, len(file_paths))
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def transcribe_single(file_path: Union[str, Path]) -> TranscriptionResult:
@@ -165,29 +311,206 @@ class TranscriptionService:
                     file_path_obj = Path(file_path)
                     output_path = output_dir / f"{file_path_obj.stem}.{output_format}"
                 
-                return await self.transcribe_file(
-                    file_path=file_path,
-                    engine=engine,
-                    model=model,
-                    language=language,
-                    output_format=output_format,
-                    output_path=output_path,
-                    **kwargs
-                )
+                try:
+                    return await self.transcribe_file(
+                        file_path=file_path,
+                        engine=engine,
+                        model=model,
+                        language=language,
+                        output_format=output_format,
+                        output_path=output_path,
+                        **kwargs
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to transcribe {file_path}: {e}")
+                    return TranscriptionResult(
+                        success=False,
+                        error=str(e),
+                        engine=engine,
+                        model=model,
+                        metadata={"file_path": str(file_path)}
+                    )
         
-        # Run transcriptions concurrently
-        tasks = [transcribe_single(fp) for fp in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Hand each result over as soon as it's ready instead of holding
+        # the whole batch until the slowest file finishes
+        tasks = [asyncio.ensure_future(transcribe_single(fp)) for fp in file_paths]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The caller may stop iterating early
+            for task in tasks:
+                task.cancel()
+    
+    # Wrappers keeping the methods and argument names of the service that
+    # core.transcriber used to define; they all go through transcribe_file
+    
+    async def transcribe_audio(
+        self,
+        audio_path: Union[str, Path],
+        engine_name: str = "openai_whisper",
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        output_format: str = "srt",
+        **kwargs
+    ) -> TranscriptionResult:
+        """Transcribe an audio file.
         
-        # Filter out exceptions and log errors
-        successful_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to transcribe {file_paths[i]}: {result}")
-            else:
-                successful_results.append(result)
+        Args:
+            audio_path: Path to audio file
+            engine_name: Name of the engine to use
+            model_name: Model to use (defaults to the engine's configured default)
+            language: Language code (auto-detect if None)
+            output_format: Output format (srt, vtt, txt, json)
+            **kwargs: Additional options passed to transcribe_file
+            
+        Returns:
+            TranscriptionResult with the transcription details
+        """
+        return await self._transcribe_compat(
+            audio_path, engine_name, model_name, language, output_format, **kwargs
+        )
+    
+    async def transcribe_video(
+        self,
+        video_path: Union[str, Path],
+        engine_name: str = "openai_whisper",
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        output_format: str = "srt",
+        **kwargs
+    ) -> TranscriptionResult:
+        """Transcribe a video file; the engines read its audio track directly.
+        
+        Args:
+            video_path: Path to video file
+            engine_name: Name of the engine to use
+            model_name: Model to use (defaults to the engine's configured default)
+            language: Language code (auto-detect if None)
+            output_format: Output format (srt, vtt, txt, json)
+            **kwargs: Additional options passed to transcribe_file
+            
+        Returns:
+            TranscriptionResult with the transcription details
+        """
+        return await self._transcribe_compat(
+            video_path, engine_name, model_name, language, output_format, **kwargs
+        )
+    
+    async def transcribe_youtube(
+        self,
+        url: str,
+        engine_name: str = "openai_whisper",
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        output_format: str = "srt",
+        **kwargs
+    ) -> TranscriptionResult:
+        """Download a YouTube video's audio and transcribe it.
+        
+        Args:
+            url: YouTube video URL
+            engine_name: Name of the engine to use
+            model_name: Model to use (defaults to the engine's configured default)
+            language: Language code (auto-detect if None)
+            output_format: Output format (srt, vtt, txt, json)
+            **kwargs: Additional options passed to transcribe_file
+            
+        Returns:
+            TranscriptionResult with the transcription details
+        """
+        # yt-dlp is only needed here
+        from ..utils.video import VideoDownloader
         
-        return successful_results
+        audio_path = await VideoDownloader().download_video(url=url, output_path=None, audio_only=True)
+        if not audio_path or not audio_path.exists():
+            raise RuntimeError("Failed to download audio from YouTube")
+        
+        return await self._transcribe_compat(
+            audio_path, engine_name, model_name, language, output_format, **kwargs
+        )
+    
+    async def batch_transcribe(
+        self,
+        file_paths: List[Union[str, Path]],
+        engine_name: str = "openai_whisper",
+        model_name: Optional[str] = None,
+        language: Optional[str] = None,
+        output_format: str = "srt",
+        max_concurrent: int = 3,
+        **kwargs
+    ) -> List[TranscriptionResult]:
+        """Transcribe multiple files concurrently.
+        
+        Args:
+            file_paths: List of file paths to transcribe
+            engine_name: Name of the engine to use
+            model_name: Model to use (defaults to the engine's configured default)
+            language: Language code (auto-detect if None)
+            output_format: Output format (srt, vtt, txt, json)
+            max_concurrent: Maximum concurrent transcriptions
+            **kwargs: Additional options passed to transcribe_file
+            
+        Returns:
+            List of TranscriptionResult in input order; failures are
+            reported as unsuccessful results
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def transcribe_single(file_path: Union[str, Path]) -> TranscriptionResult:
+            async with semaphore:
+                try:
+                    return await self._transcribe_compat(
+                        file_path, engine_name, model_name, language, output_format, **kwargs
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to transcribe {file_path}: {e}")
+                    return TranscriptionResult(
+                        success=False,
+                        error=str(e),
+                        engine=engine_name,
+                        model=model_name,
+                        metadata={"file_path": str(file_path)}
+                    )
+        
+        return list(await asyncio.gather(*(transcribe_single(fp) for fp in file_paths)))
+    
+    async def _transcribe_compat(
+        self,
+        file_path: Union[str, Path],
+        engine_name: str,
+        model_name: Optional[str],
+        language: Optional[str],
+        output_format: str,
+        **kwargs
+    ) -> TranscriptionResult:
+        """Run transcribe_file with the former service's arguments.
+        
+        The engines write srt, vtt and txt; json output is built from the
+        result of a txt run, whose file is removed afterwards.
+        
+        Returns:
+            TranscriptionResult with the transcription details
+        """
+        language = language or "auto"
+        if output_format.lower() != "json":
+            return await self.transcribe_file(
+                file_path, engine_name, model=model_name, language=language,
+                output_format=output_format, **kwargs
+            )
+        
+        output_path = kwargs.pop("output_path", None)
+        output_path = Path(output_path) if output_path else self._generate_output_path(Path(file_path), "json")
+        result = await self.transcribe_file(
+            file_path, engine_name, model=model_name, language=language, output_format="txt",
+            output_path=self._generate_output_path(Path(file_path), "txt"), **kwargs
+        )
+        if not result.success or result.output_path is None:
+            return result
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _write_json_result, result, output_path)
+        return replace(result, output_path=output_path)
     
     def get_available_engines(self) -> List[str]:
         """Get list of available engines."""
@@ -210,11 +533,14 @@ class TranscriptionService:
         output_dir = self.settings.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate filename with timestamp to avoid conflicts
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{input_path.stem}_{timestamp}.{output_format}"
+        # Process id plus a per-process counter is unique within a run,
+        # unlike a seconds timestamp; a file left by an earlier process
+        # with the same pid falls back to a nanosecond timestamp
+        output_path = output_dir / f"{input_path.stem}_{os.getpid()}_{next(_output_counter)}.{output_format}"
+        if output_path.exists():
+            output_path = output_dir / f"{input_path.stem}_{time.time_ns()}.{output_format}"
         
-        return output_dir / filename
+        return output_path
     
     async def _post_process_result(
         self,
@@ -242,4 +568,47 @@ class TranscriptionService:
             await self.engine_registry.cleanup()
         
         # Any other cleanup tasks can be added here
-        logger.info("Transcription service cleanup completed")
\ No newline at end of file
+        logger.info("Transcription service cleanup completed")
+
+
+def _write_json_result(result: TranscriptionResult, output_path: Path) -> None:
+    """Write a result as JSON and remove the output file it was built from.
+    
+    Args:
+        result: Successful transcription result
+        output_path: Path to save the JSON file
+    """
+    content = {
+        "text": result.text,
+        "segments": result.segments or [],
+        "language": result.language,
+        "duration": result.duration,
+        "engine": result.engine,
+        "model": result.model,
+        "processing_time": result.processing_time,
+        "error": result.error,
+        "metadata": result.metadata,
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(content, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    if result.output_path != output_path:
+        result.output_path.unlink(missing_ok=True)
+
+
+def get_transcription_service(settings: Settings) -> TranscriptionService:
+    """Return the process-wide transcription service.
+    
+    Loaded models live on the service, so sharing one instance keeps them
+    from being loaded again by every component that needs to transcribe.
+    A new service is only created if called with different settings.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Shared TranscriptionService
+    """
+    global _shared_service
+    if _shared_service is None or _shared_service.settings is not settings:
+        _shared_service = TranscriptionService(settings)
+    return _shared_service
@@ -1,11 +1,6 @@
 """Speech recognition engines for Whisper Subtitle Generator."""
 
 from .base import BaseEngine, TranscriptionResult
-from .openai_whisper import OpenAIWhisperEngine
-from .faster_whisper import FasterWhisperEngine
-from .whisperkit import WhisperKitEngine
-from .whispercpp import WhisperCppEngine
-from .alibaba_asr import AlibabaASREngine
 
 __all__ = [
     "BaseEngine",
@@ -15,4 +10,23 @@ __all__ = [
     "WhisperKitEngine",
     "WhisperCppEngine",
     "AlibabaASREngine",
-]
\ No newline at end of file
+]
+
+_LAZY_EXPORTS = {
+    "OpenAIWhisperEngine": ".openai_whisper",
+    "FasterWhisperEngine": ".faster_whisper",
+    "WhisperKitEngine": ".whisperkit",
+    "WhisperCppEngine": ".whispercpp",
+    "AlibabaASREngine": ".alibaba_asr",
+}
+
+
+def __getattr__(name):
+    # Backends import torch, ctranslate2 and friends at module level, so
+    # importing the package (or just its base classes) must not load them all
+    if name in _LAZY_EXPORTS:
+        import importlib
+        
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
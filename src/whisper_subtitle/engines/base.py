@@ -2,9 +2,13 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union, Dict, Any
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -160,9 +164,15 @@ class TranscriptionResult:
 class BaseEngine(ABC):
     """Abstract base class for speech recognition engines."""
     
+    # Engines that can decode a 16 kHz mono float32 array passed as
+    # audio_path set this, so callers can skip writing a temp file
+    supports_array_input = False
+    
     def __init__(self, name: str):
         self.name = name
         self._initialized = False
+        # Pool for blocking model work; None uses the loop's default executor
+        self.executor: Optional[Executor] = None
     
     @abstractmethod
     async def initialize(self) -> None:
@@ -211,6 +221,25 @@ class BaseEngine(ABC):
         """Clean up resources used by the engine."""
         pass
     
+    @staticmethod
+    def _audio_source(
+        audio: Union[str, Path, "np.ndarray"],
+        source_name: Optional[str] = None
+    ) -> Tuple[Any, str]:
+        """Split engine input into what the model decodes and a display name.
+        
+        Args:
+            audio: Path to an audio file, or decoded samples
+            source_name: Name for decoded samples, used for output files
+        
+        Returns:
+            Tuple of (model input, name used for logging and output files)
+        """
+        if isinstance(audio, (str, Path)):
+            audio = Path(audio)
+            return str(audio), audio.stem
+        return audio, source_name or "audio"
+    
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name})"
     
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 try:
     from faster_whisper import WhisperModel
@@ -16,12 +16,17 @@ except ImportError:
 from .base import BaseEngine, TranscriptionResult, TranscriptionSegment
 from ..config.settings import settings
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 class FasterWhisperEngine(BaseEngine):
     """Faster Whisper speech recognition engine."""
     
+    supports_array_input = True
+    
     def __init__(self):
         super().__init__("faster_whisper")
         self.model = None
@@ -74,7 +79,7 @@ class FasterWhisperEngine(BaseEngine):
         # Run model loading in thread pool to avoid blocking
         loop = asyncio.get_event_loop()
         self.model = await loop.run_in_executor(
-            None,
+            self.executor,
             lambda: WhisperModel(
                 model_name,
                 device=device,
@@ -87,7 +92,7 @@ class FasterWhisperEngine(BaseEngine):
     
     async def transcribe(
         self,
-        audio_path: Union[str, Path],
+        audio_path: Union[str, Path, "np.ndarray"],
         model_name: str = "medium",
         language: Optional[str] = None,
         output_format: str = "srt",
@@ -97,7 +102,7 @@ class FasterWhisperEngine(BaseEngine):
         if not FASTER_WHISPER_AVAILABLE:
             raise RuntimeError("faster-whisper package is not installed")
         
-        audio_path = Path(audio_path)
+        audio, source_name = self._audio_source(audio_path, kwargs.pop("source_name", None))
         start_time = time.time()
         
         if not await self.is_ready():
@@ -106,7 +111,7 @@ class FasterWhisperEngine(BaseEngine):
         # Load model if different from current
         await self._load_model(model_name)
         
-        logger.info(f"Transcribing {audio_path} with Faster Whisper ({model_name})")
+        logger.info(f"Transcribing {source_name} with Faster Whisper ({model_name})")
         
         try:
             # Prepare transcription options
@@ -129,13 +134,13 @@ class FasterWhisperEngine(BaseEngine):
             # Run transcription in thread pool
             loop = asyncio.get_event_loop()
             segments_generator, info = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(str(audio_path), **transcribe_options)
+                self.executor,
+                lambda: self.model.transcribe(audio, **transcribe_options)
             )
             
             # Convert generator to list in thread pool
             segments_list = await loop.run_in_executor(
-                None,
+                self.executor,
                 lambda: list(segments_generator)
             )
             
@@ -174,7 +179,7 @@ class FasterWhisperEngine(BaseEngine):
             # Save to file if requested
             if output_format != "none":
                 output_dir = settings.output_dir
-                output_filename = f"{audio_path.stem}_{self.name}_{model_name}.{output_format}"
+                output_filename = f"{source_name}_{self.name}_{model_name}.{output_format}"
                 output_path = output_dir / output_filename
                 transcription_result.save_to_file(output_path, output_format)
             
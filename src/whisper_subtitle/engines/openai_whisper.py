@@ -4,19 +4,24 @@ import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import whisper
 
 from .base import BaseEngine, TranscriptionResult, TranscriptionSegment
 from ..config.settings import settings
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 class OpenAIWhisperEngine(BaseEngine):
     """OpenAI Whisper speech recognition engine."""
     
+    supports_array_input = True
+    
     def __init__(self):
         super().__init__("openai_whisper")
         self.model = None
@@ -52,7 +57,7 @@ class OpenAIWhisperEngine(BaseEngine):
         # Run model loading in thread pool to avoid blocking
         loop = asyncio.get_event_loop()
         self.model = await loop.run_in_executor(
-            None, 
+            self.executor,
             lambda: whisper.load_model(model_name, download_root=str(settings.model_dir))
         )
         self.current_model_name = model_name
@@ -61,14 +66,14 @@ class OpenAIWhisperEngine(BaseEngine):
     
     async def transcribe(
         self,
-        audio_path: Union[str, Path],
+        audio_path: Union[str, Path, "np.ndarray"],
         model_name: str = "medium",
         language: Optional[str] = None,
         output_format: str = "srt",
         **kwargs
     ) -> TranscriptionResult:
         """Transcribe audio using OpenAI Whisper."""
-        audio_path = Path(audio_path)
+        audio, source_name = self._audio_source(audio_path, kwargs.pop("source_name", None))
         start_time = time.time()
         
         if not await self.is_ready():
@@ -77,7 +82,7 @@ class OpenAIWhisperEngine(BaseEngine):
         # Load model if different from current
         await self._load_model(model_name)
         
-        logger.info(f"Transcribing {audio_path} with OpenAI Whisper ({model_name})")
+        logger.info(f"Transcribing {source_name} with OpenAI Whisper ({model_name})")
         
         try:
             # Prepare transcription options
@@ -94,8 +99,8 @@ class OpenAIWhisperEngine(BaseEngine):
             # Run transcription in thread pool
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(str(audio_path), **transcribe_options)
+                self.executor,
+                lambda: self.model.transcribe(audio, **transcribe_options)
             )
             
             # Process result
@@ -128,7 +133,7 @@ class OpenAIWhisperEngine(BaseEngine):
             # Save to file if requested
             if output_format != "none":
                 output_dir = settings.output_dir
-                output_filename = f"{audio_path.stem}_{self.name}_{model_name}.{output_format}"
+                output_filename = f"{source_name}_{self.name}_{model_name}.{output_format}"
                 output_path = output_dir / output_filename
                 transcription_result.save_to_file(output_path, output_format)
             
@@ -1,6 +1,19 @@
 """Services module for external integrations."""
 
-from .translation import TranslationService
-from .social_media import SocialMediaService
+__all__ = ["TranslationService", "SocialMediaService"]
 
-__all__ = ["TranslationService", "SocialMediaService"]
\ No newline at end of file
+_LAZY_EXPORTS = {
+    "TranslationService": ".translation",
+    "SocialMediaService": ".social_media",
+}
+
+
+def __getattr__(name):
+    # Resolve services on first access so importing one service does not load
+    # the SDKs of the others
+    if name in _LAZY_EXPORTS:
+        import importlib
+        
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
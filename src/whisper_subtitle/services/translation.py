@@ -1,11 +1,20 @@
 """Translation service using Alibaba Cloud AI."""
 
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional, Tuple
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 import json
 import re
+import shutil
+from itertools import islice
 
 try:
     from alibabacloud_mt20181012.client import Client as AlibabaTranslateClient
@@ -18,8 +27,24 @@ except ImportError:
     open_api_models = None
     util_models = None
 
+try:
+    import cld3
+except ImportError:
+    cld3 = None
+
+from .translation_common import (
+    DEFAULT_BUFFER_SIZE,
+    SUPPORTED_LANGUAGES,
+    TEMP_SUFFIX,
+    copy_subtitle_file,
+    is_same_language,
+)
+
 logger = logging.getLogger(__name__)
 
+# Number of characters looked at when detecting the source language locally
+DETECT_SAMPLE_CHARS = 512
+
 
 @dataclass
 class TranslationConfig:
@@ -31,6 +56,100 @@ class TranslationConfig:
     region_id: str = "cn-hangzhou"
     
 
+async def _gather_or_cancel(*aws) -> list:
+    """Gather awaitables, cancelling the rest as soon as one of them fails.
+    
+    Args:
+        *aws: Coroutines or futures to run concurrently
+        
+    Returns:
+        List of results in the order given
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class TranslationCache:
+    """Persistent cache of translated texts backed by SQLite."""
+    
+    DEFAULT_PATH = Path.home() / ".cache" / "whisper-node" / "mt" / "translations.sqlite3"
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None, expire: int = 7 * 86400):
+        """Initialize translation cache.
+        
+        Args:
+            path: Path to the cache database. Defaults to ~/.cache/whisper-node/mt.
+            expire: Number of seconds a cached translation stays valid
+        """
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.expire = expire
+        self._lock = threading.Lock()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(source_lang: str, target_lang: str, text: str) -> str:
+        """Build the cache key for a translation.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            text: Text to translate
+            
+        Returns:
+            Hex digest identifying the translation
+        """
+        return hashlib.sha256(f"{source_lang}|{target_lang}|{text}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached translation.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Translated text, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a translation.
+        
+        Args:
+            key: Cache key from make_key
+            value: Translated text
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + self.expire)
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
 @dataclass
 class SubtitleEntry:
     """Subtitle entry with timing information."""
@@ -43,17 +162,73 @@ class SubtitleEntry:
 class TranslationService:
     """Translation service using Alibaba Cloud AI."""
     
-    def __init__(self, config: Optional[TranslationConfig] = None):
+    # Maximum number of texts accepted by a single GetBatchTranslate request
+    BATCH_TRANSLATE_LIMIT = 50
+    
+    # Number of subtitle entries held in memory when streaming a file
+    STREAM_WINDOW = 500
+    
+    def __init__(self, config: Optional[TranslationConfig] = None, max_connections: int = 10,
+                 cache: Optional[TranslationCache] = None):
         """Initialize translation service.
         
         Args:
             config: Translation configuration. If None, will try to load from environment.
+            max_connections: Maximum number of concurrent requests to the translation API
+            cache: Cache consulted before calling the translation API
         """
         self.config = config
         self.client = None
+        self.max_connections = max_connections
+        self.cache = cache
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._runtime = None
         
         if config and AlibabaTranslateClient:
             self._initialize_client()
+        
+        # The client never changes after construction, so availability is
+        # decided once per service
+        self._available = self.client is not None and AlibabaTranslateClient is not None
+    
+    async def __aenter__(self) -> "TranslationService":
+        """Open a request pool shared by every call made inside the context."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix="translation"
+            )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Shut down the request pool.
+        
+        The cache is left open so the service can be entered again.
+        """
+        self._shutdown_executor()
+    
+    def _shutdown_executor(self) -> None:
+        """Shut down the request pool, if one is open."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def close(self) -> None:
+        """Release the request pool and cache used by this service."""
+        self._shutdown_executor()
+        
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+    
+    def _get_runtime_options(self):
+        """Get runtime options, keeping connections alive between requests."""
+        if self._runtime is None:
+            self._runtime = util_models.RuntimeOptions(
+                keep_alive=True,
+                max_idle_conns=self.max_connections
+            )
+        return self._runtime
     
     def _initialize_client(self):
         """Initialize Alibaba Cloud translation client."""
@@ -71,7 +246,37 @@ class TranslationService:
     
     def is_available(self) -> bool:
         """Check if translation service is available."""
-        return self.client is not None and AlibabaTranslateClient is not None
+        return self._available
+    
+    def detect_source_language(self, text: str, source_lang: str = "auto") -> str:
+        """Resolve an 'auto' source language locally when cld3 is installed.
+        
+        Detecting the language up front lets callers skip texts that are already
+        in the target language and send an explicit source language to the API.
+        
+        Args:
+            text: Sample of the text to be translated
+            source_lang: Requested source language code
+            
+        Returns:
+            Detected language code, or source_lang if it was explicit or the
+            language could not be reliably detected
+        """
+        if source_lang != "auto" or cld3 is None or not text.strip():
+            return source_lang
+        
+        try:
+            prediction = cld3.get_language(text[:DETECT_SAMPLE_CHARS])
+        except Exception as e:
+            logger.debug(f"Local language detection failed: {e}")
+            return source_lang
+        
+        if prediction is None or not prediction.is_reliable:
+            return source_lang
+        
+        # cld3 reports some languages with a region suffix (e.g. zh-Latn)
+        language = prediction.language.split('-')[0]
+        return language if language in SUPPORTED_LANGUAGES else source_lang
     
     def _get_alibaba_client(self):
         """Get Alibaba Cloud translation client.
@@ -92,24 +297,43 @@ class TranslationService:
         
         return MockClient()
     
-    async def translate_text(self, text: str, source_lang: str = "auto", target_lang: str = "en") -> str:
+    async def translate_text(self, text: str, source_lang: str = "auto", target_lang: str = "en",
+                             strict: bool = False) -> str:
         """Translate a single text.
         
         Args:
             text: Text to translate
             source_lang: Source language code (auto for auto-detection)
             target_lang: Target language code
+            strict: Raise instead of returning the original text when the
+                text cannot be translated
             
         Returns:
             Translated text
         """
+        if is_same_language(source_lang, target_lang):
+            return text
+        
         if not self.is_available():
+            if strict:
+                raise RuntimeError("Translation service not available")
             logger.warning("Translation service not available, returning original text")
             return text
         
         if not text.strip():
             return text
         
+        source_lang = self.detect_source_language(text, source_lang)
+        if is_same_language(source_lang, target_lang):
+            return text
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(source_lang, target_lang, text)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             request = mt_models.TranslateGeneralRequest(
                 format_type="text",
@@ -119,19 +343,26 @@ class TranslationService:
                 scene="general"
             )
             
-            runtime = util_models.RuntimeOptions()
+            runtime = self._get_runtime_options()
             response = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self.client.translate_general_with_options(request, runtime)
+                self._executor, lambda: self.client.translate_general_with_options(request, runtime)
             )
             
             if response.body.code == "200":
-                return response.body.data.translated
+                translated = response.body.data.translated
+                if cache_key is not None:
+                    self.cache.set(cache_key, translated)
+                return translated
             else:
                 logger.error(f"Translation failed: {response.body.message}")
+                if strict:
+                    raise RuntimeError(f"Translation failed: {response.body.message}")
                 return text
                 
         except Exception as e:
             logger.error(f"Translation error: {e}")
+            if strict:
+                raise
             return text
     
     async def translate_batch(self, texts: List[str], source_lang: str = "auto", target_lang: str = "en", 
@@ -174,6 +405,128 @@ class TranslationService:
         
         return results
     
+    async def translate_texts(self, texts: List[str], source_lang: str = "auto",
+                              target_lang: str = "en", strict: bool = False) -> List[str]:
+        """Translate multiple texts using the batch translation endpoint.
+        
+        Texts are sent in chunks of up to BATCH_TRANSLATE_LIMIT per request and
+        the chunks are submitted concurrently.
+        
+        Args:
+            texts: List of texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            strict: Raise instead of keeping the original text for texts that
+                cannot be translated
+            
+        Returns:
+            List of translated texts in the same order as the input
+        """
+        if not texts:
+            return []
+        
+        if is_same_language(source_lang, target_lang):
+            return list(texts)
+        
+        if not self.is_available():
+            if strict:
+                raise RuntimeError("Translation service not available")
+            logger.warning("Translation service not available, returning original texts")
+            return list(texts)
+        
+        if source_lang == "auto":
+            sample = "\n".join(text for text in islice(texts, 32) if text.strip())
+            source_lang = self.detect_source_language(sample, source_lang)
+            if is_same_language(source_lang, target_lang):
+                return list(texts)
+        
+        results = list(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            
+            if self.cache is not None:
+                cached = self.cache.get(self.cache.make_key(source_lang, target_lang, text))
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            
+            pending.append(i)
+        
+        chunks = [
+            pending[start:start + self.BATCH_TRANSLATE_LIMIT]
+            for start in range(0, len(pending), self.BATCH_TRANSLATE_LIMIT)
+        ]
+        # A failed chunk fails the whole call in strict mode, so the other
+        # chunks stop instead of sending requests for nothing
+        chunk_results = await _gather_or_cancel(
+            *[self._translate_chunk([texts[i] for i in chunk], source_lang, target_lang, strict)
+              for chunk in chunks]
+        )
+        
+        for chunk, translated_texts in zip(chunks, chunk_results):
+            for i, translated in zip(chunk, translated_texts):
+                results[i] = translated
+        
+        return results
+    
+    async def _translate_chunk(self, texts: List[str], source_lang: str, target_lang: str,
+                               strict: bool = False) -> List[str]:
+        """Translate one chunk of texts with a single GetBatchTranslate request.
+        
+        Falls back to translating each text on its own if the batch request fails.
+        
+        Args:
+            texts: Texts to translate, at most BATCH_TRANSLATE_LIMIT of them
+            source_lang: Source language code
+            target_lang: Target language code
+            strict: Raise if a text cannot be translated individually either
+            
+        Returns:
+            List of translated texts
+        """
+        try:
+            request = mt_models.GetBatchTranslateRequest(
+                format_type="text",
+                source_language=source_lang,
+                target_language=target_lang,
+                source_text=json.dumps({str(i): text for i, text in enumerate(texts)}, ensure_ascii=False),
+                scene="general",
+                api_type="translate_standard"
+            )
+            
+            runtime = self._get_runtime_options()
+            response = await asyncio.get_event_loop().run_in_executor(
+                self._executor, lambda: self.client.get_batch_translate_with_options(request, runtime)
+            )
+            
+            if str(response.body.code) != "200":
+                raise RuntimeError(response.body.message)
+            
+            translated = {
+                int(item["index"]): item["translated"]
+                for item in response.body.translated_list
+                if str(item.get("code", "200")) == "200"
+            }
+        except Exception as e:
+            logger.warning(f"Batch translation failed, translating texts individually: {e}")
+            return list(await _gather_or_cancel(
+                *[self.translate_text(text, source_lang, target_lang, strict) for text in texts]
+            ))
+        
+        results = []
+        for i, text in enumerate(texts):
+            if i in translated:
+                if self.cache is not None:
+                    self.cache.set(self.cache.make_key(source_lang, target_lang, text), translated[i])
+                results.append(translated[i])
+            else:
+                results.append(await self.translate_text(text, source_lang, target_lang, strict))
+        
+        return results
+    
     async def translate_srt_file(self, srt_content: str, source_lang: str = "auto", target_lang: str = "en") -> str:
         """Translate an entire SRT file while preserving timing.
         
@@ -221,36 +574,79 @@ class TranslationService:
         blocks = srt_content.strip().split('\n\n')
         
         for block in blocks:
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
-                continue
+            entry = self._parse_srt_block(block)
+            if entry is not None:
+                entries.append(entry)
+        
+        return entries
+    
+    def _parse_srt_block(self, block: str) -> Optional[SubtitleEntry]:
+        """Parse a single SRT block.
+        
+        Args:
+            block: Raw SRT block (index, timing and text lines)
             
-            try:
-                # Parse index
-                index = int(lines[0])
-                
-                # Parse timing
-                timing_line = lines[1]
-                if ' --> ' not in timing_line:
+        Returns:
+            SubtitleEntry, or None if the block is not a valid subtitle
+        """
+        lines = block.strip().split('\n')
+        if len(lines) < 3:
+            return None
+        
+        try:
+            # Parse index
+            index = int(lines[0])
+            
+            # Parse timing
+            timing_line = lines[1]
+            if ' --> ' not in timing_line:
+                return None
+            
+            start_time, end_time = timing_line.split(' --> ')
+            
+            # Parse text (may be multiple lines)
+            text = '\n'.join(lines[2:])
+            
+            return SubtitleEntry(
+                index=index,
+                start_time=start_time.strip(),
+                end_time=end_time.strip(),
+                text=text
+            )
+            
+        except (ValueError, IndexError) as e:
+            logger.warning(f"Failed to parse SRT block: {block[:50]}... Error: {e}")
+            return None
+    
+    def iter_srt_file(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[SubtitleEntry]:
+        """Stream subtitle entries from an SRT file without reading it whole.
+        
+        Args:
+            path: Path to the SRT file
+            buffer_size: Read buffer size in bytes
+            
+        Yields:
+            SubtitleEntry objects in file order
+        """
+        with open(path, 'r', encoding='utf-8', buffering=buffer_size) as f:
+            block_lines = []
+            
+            for line in f:
+                line = line.rstrip('\r\n')
+                if line.strip():
+                    block_lines.append(line)
                     continue
                 
-                start_time, end_time = timing_line.split(' --> ')
-                
-                # Parse text (may be multiple lines)
-                text = '\n'.join(lines[2:])
-                
-                entries.append(SubtitleEntry(
-                    index=index,
-                    start_time=start_time.strip(),
-                    end_time=end_time.strip(),
-                    text=text
-                ))
-                
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse SRT block: {block[:50]}... Error: {e}")
-                continue
-        
-        return entries
+                if block_lines:
+                    entry = self._parse_srt_block('\n'.join(block_lines))
+                    if entry is not None:
+                        yield entry
+                    block_lines = []
+            
+            if block_lines:
+                entry = self._parse_srt_block('\n'.join(block_lines))
+                if entry is not None:
+                    yield entry
     
     def format_srt_content(self, entries: List[SubtitleEntry]) -> str:
         """Format subtitle entries back to SRT format.
@@ -264,16 +660,14 @@ class TranslationService:
         if not entries:
             return ""
         
-        srt_blocks = []
-        for entry in entries:
-            block = []
-            block.append(str(entry.index))
-            block.append(f"{entry.start_time} --> {entry.end_time}")
-            block.append(entry.text)
-            srt_blocks.append("\n".join(block))
+        srt_blocks = [self._format_srt_block(entry) for entry in entries]
         
         return "\n\n".join(srt_blocks) + "\n\n"
     
+    def _format_srt_block(self, entry: SubtitleEntry) -> str:
+        """Format a single subtitle entry as an SRT block without trailing blank line."""
+        return f"{entry.index}\n{entry.start_time} --> {entry.end_time}\n{entry.text}"
+    
     async def translate_subtitle_file(self, srt_content: str, source_lang: str = "auto", 
                                     target_lang: str = "en") -> str:
         """Translate an entire SRT subtitle file while preserving timing.
@@ -293,50 +687,120 @@ class TranslationService:
             logger.warning("No subtitle entries found to translate")
             return srt_content
         
-        # Extract texts for translation
-        texts = [entry.text for entry in entries]
-        
-        # Translate all texts
-        logger.info(f"Translating {len(texts)} subtitle entries from {source_lang} to {target_lang}")
-        translated_texts = await self.translate_batch(texts, source_lang, target_lang)
-        
-        # Update entries with translated texts
-        for entry, translated_text in zip(entries, translated_texts):
-            entry.text = translated_text
+        await self._translate_entries(entries, source_lang, target_lang)
         
         # Format back to SRT
         return self.format_srt_content(entries)
     
+    async def _translate_entries(self, entries: List[SubtitleEntry], source_lang: str,
+                                 target_lang: str, strict: bool = False) -> None:
+        """Translate subtitle entries in place, translating each distinct text once.
+        
+        Args:
+            entries: Subtitle entries to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            strict: Raise instead of keeping untranslated text
+        """
+        unique_texts = list(dict.fromkeys(entry.text for entry in entries))
+        logger.info(
+            f"Translating {len(entries)} subtitle entries ({len(unique_texts)} unique) "
+            f"from {source_lang} to {target_lang}"
+        )
+        translated_texts = await self.translate_texts(unique_texts, source_lang, target_lang, strict=strict)
+        translations = dict(zip(unique_texts, translated_texts))
+        
+        for entry in entries:
+            entry.text = translations[entry.text]
+    
     async def translate_subtitle_file_path(self, input_path: str, output_path: str, 
-                                         source_lang: str = "auto", target_lang: str = "en") -> bool:
+                                         source_lang: str = "auto", target_lang: str = "en",
+                                         buffer_size: int = DEFAULT_BUFFER_SIZE,
+                                         strict: bool = False) -> bool:
         """Translate a subtitle file and save to output path.
         
+        The input is streamed and translated in windows of STREAM_WINDOW entries,
+        so memory use does not grow with the size of the file. Reading the next
+        window and writing the previous one run in worker threads while the
+        current window is being translated. The output is written to a
+        temporary file and atomically renamed into place when complete.
+        
         Args:
             input_path: Path to input SRT file
             output_path: Path to save translated SRT file
             source_lang: Source language code
             target_lang: Target language code
+            buffer_size: Read and write buffer size in bytes
+            strict: Fail instead of writing cues that could not be translated
+                in their original language
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Read input file
-            with open(input_path, 'r', encoding='utf-8') as f:
-                srt_content = f.read()
+            loop = asyncio.get_event_loop()
+            entries = self.iter_srt_file(input_path, buffer_size)
+            written = 0
+            
+            # Write next to the output and rename into place, so an interrupted
+            # run never leaves a partial file at output_path
+            temp_path = output_path + TEMP_SUFFIX
+            
+            if is_same_language(source_lang, target_lang):
+                await loop.run_in_executor(None, copy_subtitle_file, input_path, output_path)
+                logger.info(f"Source and target language match, copied: {input_path} -> {output_path}")
+                return True
             
-            # Translate content
-            translated_content = await self.translate_subtitle_file(srt_content, source_lang, target_lang)
+            def read_window():
+                return list(islice(entries, self.STREAM_WINDOW))
             
-            # Write output file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(translated_content)
+            with open(temp_path, 'w', encoding='utf-8', buffering=buffer_size) as f:
+                def write_window(window):
+                    f.writelines(f"{self._format_srt_block(entry)}\n\n" for entry in window)
+                
+                next_window = loop.run_in_executor(None, read_window)
+                pending_write = None
+                
+                try:
+                    while True:
+                        window = await next_window
+                        if not window:
+                            break
+                        
+                        # Prefetch the next window while this one is translated
+                        next_window = loop.run_in_executor(None, read_window)
+                        await self._translate_entries(window, source_lang, target_lang, strict=strict)
+                        
+                        if pending_write is not None:
+                            await pending_write
+                        pending_write = loop.run_in_executor(None, write_window, window)
+                        written += len(window)
+                finally:
+                    # Nothing more is read once the translation has failed
+                    if not next_window.done():
+                        next_window.cancel()
+                    # The file must not be closed under an in-flight write
+                    if pending_write is not None:
+                        await pending_write
+                
+                if written:
+                    f.flush()
+                    os.fsync(f.fileno())
             
+            if not written:
+                logger.warning("No subtitle entries found to translate")
+                shutil.copyfile(input_path, temp_path)
+            
+            os.replace(temp_path, output_path)
             logger.info(f"Successfully translated subtitle file: {input_path} -> {output_path}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to translate subtitle file {input_path}: {e}")
+            try:
+                os.unlink(output_path + TEMP_SUFFIX)
+            except OSError:
+                pass
             return False
     
     def get_supported_languages(self) -> Dict[str, str]:
@@ -345,24 +809,4 @@ class TranslationService:
         Returns:
             Dictionary mapping language codes to language names
         """
-        return {
-            "auto": "Auto Detect",
-            "zh": "Chinese (Simplified)",
-            "zh-tw": "Chinese (Traditional)",
-            "en": "English",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "fr": "French",
-            "es": "Spanish",
-            "it": "Italian",
-            "de": "German",
-            "tr": "Turkish",
-            "ru": "Russian",
-            "pt": "Portuguese",
-            "vi": "Vietnamese",
-            "id": "Indonesian",
-            "th": "Thai",
-            "ms": "Malay",
-            "ar": "Arabic",
-            "hi": "Hindi"
-        }
\ No newline at end of file
+        return dict(SUPPORTED_LANGUAGES)
\ No newline at end of file
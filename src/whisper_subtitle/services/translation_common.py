@@ -0,0 +1,61 @@
+"""Translation constants and helpers that do not need the translation SDK."""
+
+import os
+import shutil
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Suffix of the temporary file a translated subtitle is written to before
+# being renamed over the output path
+TEMP_SUFFIX = ".tmp"
+
+# Languages supported by Alibaba Cloud machine translation
+SUPPORTED_LANGUAGES = {
+    "auto": "Auto Detect",
+    "zh": "Chinese (Simplified)",
+    "zh-tw": "Chinese (Traditional)",
+    "en": "English",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "fr": "French",
+    "es": "Spanish",
+    "it": "Italian",
+    "de": "German",
+    "tr": "Turkish",
+    "ru": "Russian",
+    "pt": "Portuguese",
+    "vi": "Vietnamese",
+    "id": "Indonesian",
+    "th": "Thai",
+    "ms": "Malay",
+    "ar": "Arabic",
+    "hi": "Hindi"
+}
+
+
+def copy_subtitle_file(input_path: str, output_path: str) -> None:
+    """Copy a subtitle file whose translation would leave it unchanged.
+    
+    The copy is written next to the output and renamed into place, like a
+    translated file.
+    
+    Args:
+        input_path: Path to input SRT file
+        output_path: Path to save the copy
+    """
+    temp_path = output_path + TEMP_SUFFIX
+    shutil.copyfile(input_path, temp_path)
+    os.replace(temp_path, output_path)
+
+
+def is_same_language(source_lang: str, target_lang: str) -> bool:
+    """Check whether a translation would leave text unchanged.
+    
+    Args:
+        source_lang: Source language code (auto for auto-detection)
+        target_lang: Target language code
+        
+    Returns:
+        True if both languages are the same explicit language
+    """
+    return source_lang == target_lang and source_lang != "auto"
@@ -4,12 +4,15 @@ import asyncio
 import logging
 import subprocess
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import ffmpeg
 
 from ..config.settings import settings
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,6 +118,58 @@ class AudioProcessor:
             logger.error(error_msg)
             raise RuntimeError(error_msg)
     
+    async def load_audio(
+        self,
+        input_path: Union[str, Path],
+        sample_rate: int = 16000
+    ) -> "np.ndarray":
+        """Decode a file's audio track straight into memory.
+        
+        FFmpeg writes raw 16-bit mono PCM to a pipe, which is converted to
+        the float32 samples Whisper models take, with no temp file.
+        
+        Args:
+            input_path: Path to input audio or video file
+            sample_rate: Audio sample rate in Hz
+        
+        Returns:
+            Mono float32 samples in [-1, 1)
+        """
+        import numpy as np
+        
+        input_path = Path(input_path)
+        
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        logger.info(f"Decoding audio from {input_path}")
+        
+        try:
+            stream = ffmpeg.input(str(input_path))
+            stream = ffmpeg.output(
+                stream,
+                'pipe:',
+                format='s16le',
+                acodec='pcm_s16le',
+                ar=sample_rate,
+                ac=1,
+                loglevel='error'
+            )
+            
+            # Run in thread pool to avoid blocking
+            loop = asyncio.get_event_loop()
+            out, _ = await loop.run_in_executor(
+                None,
+                lambda: ffmpeg.run(stream, capture_stdout=True, capture_stderr=True, cmd=self.ffmpeg_path)
+            )
+            
+            return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+        
+        except ffmpeg.Error as e:
+            error_msg = f"FFmpeg error during audio decoding: {e.stderr.decode() if e.stderr else str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+    
     async def convert_audio(
         self,
         input_path: Union[str, Path],
@@ -319,49 +319,9 @@ class SubtitleProcessor:
         split_segments = []
         
         for segment in segments:
-            duration = segment['end'] - segment['start']
-            text = segment['text']
-            
-            # Check if segment needs splitting
-            if duration <= max_duration and len(text) <= max_chars:
-                split_segments.append(segment)
-                continue
-            
-            # Split by sentences first
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-            
-            if len(sentences) <= 1:
-                # Can't split by sentences, split by words
-                words = text.split()
-                sentences = []
-                current_sentence = []
-                
-                for word in words:
-                    current_sentence.append(word)
-                    if len(' '.join(current_sentence)) >= max_chars // 2:
-                        sentences.append(' '.join(current_sentence))
-                        current_sentence = []
-                
-                if current_sentence:
-                    sentences.append(' '.join(current_sentence))
-            
-            # Create sub-segments
-            time_per_char = duration / len(text) if text else 0
-            current_start = segment['start']
-            
-            for sentence in sentences:
-                sentence_duration = len(sentence) * time_per_char
-                sentence_end = min(current_start + sentence_duration, segment['end'])
-                
-                split_segments.append({
-                    'sequence': len(split_segments) + 1,
-                    'start': current_start,
-                    'end': sentence_end,
-                    'text': sentence
-                })
-                
-                current_start = sentence_end
+            split_segments.extend(
+                SubtitleProcessor._split_segment(segment, max_duration, max_chars)
+            )
         
         # Update sequence numbers
         for i, segment in enumerate(split_segments, 1):
@@ -369,6 +329,67 @@ class SubtitleProcessor:
         
         return split_segments
     
+    @staticmethod
+    def _split_segment(
+        segment: Dict,
+        max_duration: float,
+        max_chars: int
+    ) -> List[Dict]:
+        """Split a single segment into shorter ones if it is too long.
+        
+        Args:
+            segment: Subtitle segment
+            max_duration: Maximum duration for segments
+            max_chars: Maximum characters for segments
+        
+        Returns:
+            List containing the segment itself or its sub-segments
+        """
+        duration = segment['end'] - segment['start']
+        text = segment['text']
+        
+        # Check if segment needs splitting
+        if duration <= max_duration and len(text) <= max_chars:
+            return [segment]
+        
+        # Split by sentences first
+        sentences = re.split(r'[.!?]+', text)
+        sentences = [s.strip() for s in sentences if s.strip()]
+        
+        if len(sentences) <= 1:
+            # Can't split by sentences, split by words
+            words = text.split()
+            sentences = []
+            current_sentence = []
+            
+            for word in words:
+                current_sentence.append(word)
+                if len(' '.join(current_sentence)) >= max_chars // 2:
+                    sentences.append(' '.join(current_sentence))
+                    current_sentence = []
+            
+            if current_sentence:
+                sentences.append(' '.join(current_sentence))
+        
+        # Create sub-segments
+        time_per_char = duration / len(text) if text else 0
+        current_start = segment['start']
+        parts = []
+        
+        for sentence in sentences:
+            sentence_duration = len(sentence) * time_per_char
+            sentence_end = min(current_start + sentence_duration, segment['end'])
+            
+            parts.append({
+                'start': current_start,
+                'end': sentence_end,
+                'text': sentence
+            })
+            
+            current_start = sentence_end
+        
+        return parts
+    
     @staticmethod
     def filter_segments(
         segments: List[Dict],
@@ -400,6 +421,85 @@ class SubtitleProcessor:
         
         return filtered
     
+    @staticmethod
+    def postprocess(
+        segments: List[Dict],
+        *,
+        filter: bool = False,
+        merge: bool = False,
+        split: bool = False,
+        min_duration: float = 0.1,
+        min_chars: int = 1,
+        max_duration: float = 10.0,
+        max_chars: int = 100,
+        merge_max_chars: int = 200
+    ) -> List[Dict]:
+        """Filter, merge and split segments in a single pass.
+        
+        Produces the same result as chaining ``filter_segments``,
+        ``merge_segments`` and ``split_long_segments`` without building an
+        intermediate list for every step.
+        
+        Args:
+            segments: List of subtitle segments
+            filter: Drop segments that are too short
+            merge: Merge adjacent short segments
+            split: Split segments that are too long
+            min_duration: Minimum duration in seconds (for filtering)
+            min_chars: Minimum number of characters (for filtering)
+            max_duration: Maximum duration for merged and split segments
+            max_chars: Maximum characters for split segments
+            merge_max_chars: Maximum characters for merged segments
+        
+        Returns:
+            List of processed segments
+        """
+        processed = []
+        pending = None
+        
+        def flush(segment: Dict) -> None:
+            if split:
+                processed.extend(
+                    SubtitleProcessor._split_segment(segment, max_duration, max_chars)
+                )
+            else:
+                processed.append(segment)
+        
+        for segment in segments:
+            if filter and (
+                segment['end'] - segment['start'] < min_duration or
+                len(segment['text'].strip()) < min_chars
+            ):
+                continue
+            
+            if not merge:
+                flush(segment)
+                continue
+            
+            if pending is None:
+                pending = segment.copy()
+                continue
+            
+            merged_text = pending['text'] + ' ' + segment['text']
+            
+            if (len(merged_text) <= merge_max_chars and
+                segment['end'] - pending['start'] <= max_duration and
+                segment['start'] - pending['end'] <= 1.0):  # Gap <= 1 second
+                pending['end'] = segment['end']
+                pending['text'] = merged_text
+            else:
+                flush(pending)
+                pending = segment.copy()
+        
+        if pending is not None:
+            flush(pending)
+        
+        # Update sequence numbers
+        for i, segment in enumerate(processed, 1):
+            segment['sequence'] = i
+        
+        return processed
+    
     @staticmethod
     def load_subtitle_file(file_path: Union[str, Path]) -> List[Dict]:
         """Load subtitle file and parse it.
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Unit tests for the transcription batch queue."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.batching import BatchQueue
+from whisper_subtitle.core.engines.base import TranscriptionResult
+
+
+class RecordingEngine:
+    """Engine stand-in that records the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def transcribe_batch(self, files, model, language, output_format, output_paths):
+        self.batches.append(list(files))
+        for file_path in files:
+            yield TranscriptionResult(success=True, text=str(file_path), model=model)
+
+
+def run_submissions(queue, submissions):
+    """Submit all requests concurrently and return their results."""
+    async def run():
+        return await asyncio.gather(*(queue.submit(*args) for args in submissions))
+    return asyncio.run(run())
+
+
+class TestBatchQueue:
+    """Test cases for BatchQueue."""
+
+    def test_concurrent_requests_are_coalesced(self):
+        """Test that requests arriving together share one batch."""
+        engine = RecordingEngine()
+
+        async def get_engine(name, model):
+            return engine
+
+        queue = BatchQueue(get_engine, max_batch=8, max_wait_ms=5)
+        results = run_submissions(queue, [("a", "fw", "base"), ("b", "fw", "base"), ("c", "fw", "base")])
+
+        assert [r.text for r in results] == ["a", "b", "c"]
+        assert engine.batches == [["a", "b", "c"]]
+
+    def test_batches_split_by_model_and_size(self):
+        """Test that only compatible requests share a batch."""
+        engine = RecordingEngine()
+
+        async def get_engine(name, model):
+            return engine
+
+        queue = BatchQueue(get_engine, max_batch=2, max_wait_ms=5)
+        run_submissions(queue, [("a", "fw", "base"), ("b", "fw", "small"), ("c", "fw", "base"), ("d", "fw", "base")])
+
+        assert engine.batches == [["a"], ["b"], ["c", "d"]]
+
+    def test_engine_errors_reach_every_caller(self):
+        """Test that a failing engine lookup fails the whole batch."""
+        async def get_engine(name, model):
+            raise ValueError("Engine not available")
+
+        queue = BatchQueue(get_engine, max_wait_ms=5)
+
+        async def run():
+            return await asyncio.gather(
+                queue.submit("a", "fw", "base"), queue.submit("b", "fw", "base"),
+                return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+    def test_groups_run_concurrently(self):
+        """Test that a slow group does not hold up another model's group."""
+        small_started = None
+
+        class BlockingEngine(RecordingEngine):
+            async def transcribe_batch(self, files, model, language, output_format, output_paths):
+                if model == "base":
+                    # Only finishes if the "small" group runs meanwhile
+                    await asyncio.wait_for(small_started.wait(), timeout=1)
+                else:
+                    small_started.set()
+                for file_path in files:
+                    yield TranscriptionResult(success=True, text=str(file_path), model=model)
+
+        engine = BlockingEngine()
+
+        async def get_engine(name, model):
+            return engine
+
+        async def run():
+            nonlocal small_started
+            small_started = asyncio.Event()
+            queue = BatchQueue(get_engine, max_wait_ms=5)
+            return await asyncio.gather(queue.submit("a", "fw", "base"), queue.submit("b", "fw", "small"))
+
+        results = asyncio.run(run())
+
+        assert [r.text for r in results] == ["a", "b"]
+
+    def test_worker_on_previous_loop_is_cancelled(self):
+        """Test that switching event loops does not leave the old worker pending."""
+        engine = RecordingEngine()
+
+        async def get_engine(name, model):
+            return engine
+
+        queue = BatchQueue(get_engine, max_wait_ms=0)
+        old_loop = asyncio.new_event_loop()
+        try:
+            old_loop.run_until_complete(queue.submit("a", "fw", "base"))
+            old_worker = queue._worker
+
+            asyncio.run(queue.submit("b", "fw", "base"))
+            old_loop.run_until_complete(asyncio.sleep(0))
+
+            assert old_worker.cancelled()
+        finally:
+            old_loop.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
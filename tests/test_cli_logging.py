@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Unit tests for CLI logging setup."""
+
+import importlib
+import logging
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# The package re-exports a main() function that shadows the submodule
+cli_main = importlib.import_module("whisper_subtitle.cli.main")
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level afterwards."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    # The listener itself is stopped at exit
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def test_repeated_setup_replaces_root_handler(self, root_logger):
+        """Test that a second call feeds the new listener, not the stopped one."""
+        cli_main.setup_logging()
+        cli_main.setup_logging(verbose=True)
+
+        queue_handlers = [h for h in root_logger.handlers if isinstance(h, cli_main._RecordQueueHandler)]
+        assert len(queue_handlers) == 1
+        assert queue_handlers[0].queue is cli_main._log_listener.queue
+        assert root_logger.level == logging.DEBUG
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Unit tests for the transcribe CLI command."""
+
+import pytest
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.cli.main import cli
+from whisper_subtitle.cli.commands import transcribe as transcribe_module
+from whisper_subtitle.config.settings import Settings
+from whisper_subtitle.core import transcription as transcription_module
+from whisper_subtitle.core.engines.base import BaseEngine, TranscriptionResult
+from whisper_subtitle.core.engines.registry import EngineRegistry
+
+
+class FakeEngine(BaseEngine):
+    """Engine that writes a single fixed subtitle."""
+
+    segments = [{"start": 0.0, "end": 1.5, "text": "hello"}]
+
+    async def load_model(self, model):
+        pass
+
+    async def transcribe(self, file_path, model=None, language=None, output_format="srt", output_path=None, **kwargs):
+        self._write_srt(self.segments, output_path)
+        return TranscriptionResult(
+            success=True,
+            output_path=output_path,
+            text="hello",
+            segments=list(self.segments),
+            language="en",
+            engine="openai_whisper",
+            model=model
+        )
+
+    @classmethod
+    def is_available(cls, config=None):
+        return True
+
+    def get_models(self):
+        return ["base"]
+
+    def get_languages(self):
+        return ["en"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_engine_cache():
+    """Probe engines again in every test."""
+    transcribe_module._cached_engines.cache_clear()
+    yield
+    transcribe_module._cached_engines.cache_clear()
+
+
+class TestTranscribeCommand:
+    """Test cases for ``whisper-subtitle transcribe``."""
+
+    def test_unknown_engine_is_reported(self, tmp_path):
+        """Test that an engine missing from the registry is reported cleanly."""
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"audio")
+
+        result = CliRunner().invoke(cli, ["transcribe", str(audio), "--engine", "whispercpp"])
+
+        assert result.exit_code == 1
+        assert "Engine 'whispercpp' is not available" in result.output
+
+    def test_transcribes_to_output_file(self, tmp_path, monkeypatch):
+        """Test a full run writes the engine's subtitles next to the input."""
+        engines = EngineRegistry()
+        engines.register("openai_whisper", FakeEngine)
+        monkeypatch.setattr(transcribe_module, "registry", engines)
+        monkeypatch.setattr(transcription_module, "registry", engines)
+        monkeypatch.setattr(transcribe_module, "settings", Settings(result_cache_enabled=False))
+        monkeypatch.setattr(transcription_module, "_shared_service", None)
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"audio")
+
+        result = CliRunner().invoke(cli, ["transcribe", str(audio)])
+
+        assert result.exit_code == 0, result.output
+        content = (tmp_path / "a.srt").read_text(encoding="utf-8")
+        assert "00:00:00,000 --> 00:00:01,500" in content
+        assert "hello" in content
+        assert transcription_module._shared_service.settings is transcribe_module.settings
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Unit tests for the translate CLI helpers."""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.cli.commands import translate as translate_module
+
+
+class FakeService:
+    """Stand-in for a cached TranslationService."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTranslatingService(FakeService):
+    """Stand-in service that copies each input to its output."""
+
+    def __init__(self):
+        super().__init__()
+        self.seen_temps = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def is_available(self):
+        return True
+
+    async def translate_subtitle_file_path(self, input_path, output_path, source_lang, target_lang, **kwargs):
+        self.seen_temps.append(Path(output_path + ".tmp").exists())
+        Path(output_path).write_text(Path(input_path).read_text())
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_cached_services():
+    """Start and finish every test without cached services."""
+    translate_module._services.clear()
+    yield
+    translate_module._services.clear()
+
+
+class TestMakeService:
+    """Test cases for the cached translation services."""
+
+    def test_unavailable_service_is_not_reused(self):
+        """Test that a client that failed to initialise is built again next time."""
+        first = translate_module._make_service("id", "secret", "endpoint", "region", use_cache=False)
+        second = translate_module._make_service("id", "secret", "endpoint", "region", use_cache=False)
+
+        assert not first.is_available()
+        assert second is not first
+        assert translate_module._services == {}
+
+    def test_cached_services_are_closed(self):
+        """Test that closing releases every cached service."""
+        service = FakeService()
+        translate_module._services[("key",)] = service
+
+        translate_module._close_services()
+
+        assert service.closed
+        assert translate_module._services == {}
+
+
+class TestBatchCommand:
+    """Test cases for ``translate batch``."""
+
+    def test_only_own_stale_temp_files_are_removed(self, tmp_path, monkeypatch):
+        """Test that cleanup leaves temp files the batch did not create."""
+        service = FakeTranslatingService()
+        monkeypatch.setattr(translate_module, "_make_service", lambda *args: service)
+        input_dir, output_dir = tmp_path / "in", tmp_path / "out"
+        input_dir.mkdir()
+        output_dir.mkdir()
+        (input_dir / "a.srt").write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n")
+        (output_dir / "a_en.srt.tmp").write_text("partial")
+        (output_dir / "notes_english.tmp").write_text("keep")
+        (output_dir / "other_en.srt.tmp").write_text("in progress")
+
+        result = CliRunner().invoke(
+            translate_module.translate, ["batch", str(input_dir), str(output_dir), "-s", "fr", "-t", "en"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert service.seen_temps == [False]
+        assert (output_dir / "a_en.srt").exists()
+        assert (output_dir / "notes_english.tmp").read_text() == "keep"
+        assert (output_dir / "other_en.srt.tmp").read_text() == "in progress"
+
+    def test_same_language_copies_without_credentials(self, tmp_path, monkeypatch):
+        """Test that a same-language batch copies files without a service."""
+        monkeypatch.setattr(translate_module, "_make_service", lambda *args: None)
+        input_dir, output_dir = tmp_path / "in", tmp_path / "out"
+        input_dir.mkdir()
+        content = "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+        (input_dir / "a.srt").write_text(content)
+
+        result = CliRunner().invoke(
+            translate_module.translate, ["batch", str(input_dir), str(output_dir), "-s", "en", "-t", "en"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "credentials" not in result.output
+        assert (output_dir / "a_en.srt").read_text() == content
+        assert not (output_dir / "a_en.srt.tmp").exists()
+
+
+class TestLanguagesCommand:
+    """Test cases for ``translate languages``."""
+
+    def test_does_not_import_translation_sdk(self):
+        """Test that listing languages leaves the translation service unloaded."""
+        src = Path(__file__).parent.parent / "src"
+        script = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(src)!r})\n"
+            "from click.testing import CliRunner\n"
+            "from whisper_subtitle.cli.commands import translate\n"
+            "result = CliRunner().invoke(translate.translate, ['languages'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "assert 'hi' in result.output\n"
+            "print('whisper_subtitle.services.translation' in sys.modules)\n"
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
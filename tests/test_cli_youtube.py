@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Unit tests for the youtube CLI helpers."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.cli.commands import youtube as youtube_module
+
+
+@pytest.fixture(autouse=True)
+def no_shared_loop(monkeypatch):
+    """Give each test its own persistent loop, closed afterwards."""
+    monkeypatch.setattr(youtube_module, "_loop", None)
+    yield
+    youtube_module._close_loop()
+
+
+class TestPersistentLoop:
+    """Test cases for the module's persistent event loop."""
+
+    def test_loop_is_reused_across_calls(self):
+        """Test that consecutive calls run on the same loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert youtube_module._run(current_loop()) is youtube_module._run(current_loop())
+
+    def test_close_cancels_tasks_and_finalizes_generators(self):
+        """Test that closing the loop cleans up what is still running."""
+        finalized = []
+
+        async def agen():
+            try:
+                yield 1
+                yield 2
+            finally:
+                finalized.append(True)
+
+        async def start():
+            gen = agen()
+            await gen.__anext__()
+            task = asyncio.ensure_future(asyncio.sleep(3600))
+            return gen, task
+
+        gen, task = youtube_module._run(start())
+        loop = youtube_module._loop
+
+        youtube_module._close_loop()
+
+        assert task.cancelled()
+        assert finalized == [True]
+        assert loop.is_closed()
+        assert youtube_module._loop is None
+
+
+class TestSpinner:
+    """Test cases for the shared spinner display."""
+
+    def test_display_only_runs_while_a_spinner_is_shown(self, monkeypatch):
+        """Test that the display is started per use and stopped afterwards."""
+        monkeypatch.setattr(youtube_module, "_progress", None)
+
+        for _ in range(2):
+            with youtube_module._spinner("outer"):
+                progress = youtube_module._get_progress()
+                with youtube_module._spinner("inner"):
+                    assert progress.live.is_started
+                assert progress.live.is_started
+            assert not progress.live.is_started
+
+        assert youtube_module._get_progress() is progress
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
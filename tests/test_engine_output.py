@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Unit tests for engine subtitle output formatting."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.engines.base import BaseEngine
+
+
+class DummyEngine(BaseEngine):
+    """Minimal engine used to exercise the shared output writers."""
+
+    async def transcribe(self, file_path, **kwargs):
+        raise NotImplementedError
+
+    @classmethod
+    def is_available(cls, config=None):
+        return True
+
+    def get_models(self):
+        return []
+
+    def get_languages(self):
+        return []
+
+
+@pytest.fixture
+def engine():
+    """Create a dummy engine."""
+    return DummyEngine({})
+
+
+class TestTimeFormatting:
+    """Test cases for SRT/VTT timestamp formatting."""
+
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "00:00:00,000"),
+        (1.5, "00:00:01,500"),
+        (1.001, "00:00:01,001"),
+        (59.9996, "00:01:00,000"),
+        (3661.25, "01:01:01,250"),
+    ])
+    def test_format_time_srt(self, engine, seconds, expected):
+        """Test SRT timestamps round to the nearest millisecond."""
+        assert engine._format_time_srt(seconds) == expected
+
+    def test_format_time_vtt(self, engine):
+        """Test VTT timestamps use a dot before the milliseconds."""
+        assert engine._format_time_vtt(3661.25) == "01:01:01.250"
+
+
+class TestFormatOutput:
+    """Test cases for BaseEngine._format_output."""
+
+    def test_write_srt(self, engine, tmp_path):
+        """Test SRT output numbering and layout."""
+        output_path = tmp_path / "out.srt"
+        segments = [
+            {'start': 0.0, 'end': 1.5, 'text': ' Hello '},
+            {'start': 2.0, 'end': 3.0, 'text': 'World'},
+        ]
+
+        engine._format_output(segments, "srt", output_path)
+
+        assert output_path.read_text(encoding='utf-8') == (
+            "1\n00:00:00,000 --> 00:00:01,500\nHello\n\n"
+            "2\n00:00:02,000 --> 00:00:03,000\nWorld\n\n"
+        )
+
+    def test_write_vtt_and_txt(self, engine, tmp_path):
+        """Test VTT header and that TXT skips empty segments."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'Hi'},
+            {'start': 1.0, 'end': 2.0, 'text': '  '},
+        ]
+
+        engine._format_output(segments, "vtt", tmp_path / "out.vtt")
+        engine._format_output(segments, "txt", tmp_path / "out.txt")
+
+        assert (tmp_path / "out.vtt").read_text(encoding='utf-8').startswith(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nHi\n\n"
+        )
+        assert (tmp_path / "out.txt").read_text(encoding='utf-8') == "Hi\n"
+
+
+class TestStreamOutput:
+    """Test cases for BaseEngine._stream_output."""
+
+    @pytest.mark.parametrize("output_format", ["srt", "vtt", "txt"])
+    def test_matches_format_output(self, engine, tmp_path, output_format):
+        """Test streamed files are identical to the batch writers' output."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': ' One '},
+            {'start': 1.0, 'end': 2.5, 'text': 'Two'},
+        ]
+
+        engine._format_output(segments, output_format, tmp_path / "batch")
+        segment_list, full_text = engine._stream_output(
+            iter(segments), output_format, tmp_path / "stream"
+        )
+
+        assert (tmp_path / "stream").read_bytes() == (tmp_path / "batch").read_bytes()
+        assert [s['text'] for s in segment_list] == ["One", "Two"]
+        assert full_text == "One Two"
+
+    def test_removes_partial_file_on_error(self, engine, tmp_path):
+        """Test that a failing segment source leaves no output behind."""
+        def segments():
+            yield {'start': 0.0, 'end': 1.0, 'text': 'One'}
+            raise RuntimeError("decoder failed")
+
+        output_path = tmp_path / "out.srt"
+        with pytest.raises(RuntimeError):
+            engine._stream_output(segments(), "srt", output_path)
+
+        assert not output_path.exists()
+
+
+class TestWriteOutputAsync:
+    """Test cases for BaseEngine._write_output_async."""
+
+    @pytest.mark.parametrize("output_format", ["srt", "vtt", "txt"])
+    def test_matches_format_output(self, engine, tmp_path, output_format):
+        """Test async-written files are identical to the sync writers' output."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': ' One '},
+            {'start': 1.0, 'end': 2.5, 'text': 'Two'},
+        ]
+
+        engine._format_output(segments, output_format, tmp_path / "sync")
+        asyncio.run(engine._write_output_async(segments, output_format, tmp_path / "nested" / "async"))
+
+        assert (tmp_path / "nested" / "async").read_bytes() == (tmp_path / "sync").read_bytes()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
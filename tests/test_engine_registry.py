@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Unit tests for the engine registry."""
+
+import pytest
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.engines.base import BaseEngine
+from whisper_subtitle.core.engines.registry import EngineRegistry
+
+
+class CountingEngine(BaseEngine):
+    """Engine that counts availability probes."""
+
+    probes = 0
+
+    async def transcribe(self, file_path, **kwargs):
+        raise NotImplementedError
+
+    @classmethod
+    def is_available(cls, config=None):
+        cls.probes += 1
+        return True
+
+    def get_models(self):
+        return []
+
+    def get_languages(self):
+        return []
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with one counting engine."""
+    CountingEngine.probes = 0
+    registry = EngineRegistry(availability_ttl=60.0)
+    registry.register("counting", CountingEngine)
+    return registry
+
+
+class TestAvailabilityCache:
+    """Test cases for cached availability probes."""
+
+    def test_probe_is_reused_within_ttl(self, registry):
+        """Test that repeated checks only probe once."""
+        assert registry.get_available_engines() == ["counting"]
+        assert registry.is_engine_available("counting")
+        assert CountingEngine.probes == 1
+
+    def test_invalidate_forces_new_probe(self, registry):
+        """Test that invalidate drops the cached result."""
+        registry.get_available_engines()
+        registry.invalidate()
+        registry.get_available_engines()
+
+        assert CountingEngine.probes == 2
+
+    def test_expired_entry_is_reprobed(self):
+        """Test that a zero TTL disables caching."""
+        CountingEngine.probes = 0
+        registry = EngineRegistry(availability_ttl=0)
+        registry.register("counting", CountingEngine)
+
+        registry.is_engine_available("counting")
+        registry.is_engine_available("counting")
+
+        assert CountingEngine.probes == 2
+
+    def test_unknown_engine_is_unavailable(self, registry):
+        """Test that unknown engines are reported unavailable."""
+        assert not registry.is_engine_available("missing")
+
+    def test_probe_does_not_instantiate(self, registry):
+        """Test that availability is checked on the class."""
+        assert registry.is_engine_available("counting")
+        assert "counting" not in registry._instances
+
+    def test_lazy_engine_is_resolved(self, registry):
+        """Test that engines registered by import path load on first use."""
+        registry.register("lazy", f"{__name__}:CountingEngine")
+
+        assert isinstance(registry.get_engine("lazy"), CountingEngine)
+
+
+class ToggleEngine(CountingEngine):
+    """Engine whose availability can be switched by the test."""
+
+    available = True
+
+    @classmethod
+    def is_available(cls, config=None):
+        return cls.available
+
+
+class TestAllEnginesInfo:
+    """Test cases for get_all_engines_info."""
+
+    def test_ready_follows_availability_after_ttl(self):
+        """Test that a changed probe result is not masked by cached info."""
+        ToggleEngine.available = True
+        registry = EngineRegistry(availability_ttl=0)
+        registry.register("toggle", ToggleEngine)
+
+        assert registry.get_all_engines_info()["toggle"]["ready"] is True
+        ToggleEngine.available = False
+        assert registry.get_all_engines_info()["toggle"]["ready"] is False
+
+    def test_returned_info_is_a_copy(self, registry):
+        """Test that callers cannot modify the cached info."""
+        registry.get_all_engines_info()["counting"]["models"].append("tampered")
+
+        assert registry.get_all_engines_info()["counting"]["models"] == []
+
+
+class SlowInitEngine(CountingEngine):
+    """Engine that counts instances and takes a moment to create."""
+
+    instances = 0
+
+    def __init__(self, config):
+        type(self).instances += 1
+        time.sleep(0.01)
+        super().__init__(config)
+
+
+class TestThreadSafety:
+    """Test cases for lookups from several threads."""
+
+    def test_concurrent_lookups_create_one_instance(self):
+        """Test that threads racing on get_engine share one instance."""
+        SlowInitEngine.instances = 0
+        registry = EngineRegistry()
+        registry.register("slow", SlowInitEngine)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            engines = list(pool.map(lambda _: registry.get_engine("slow"), range(8)))
+
+        assert SlowInitEngine.instances == 1
+        assert all(engine is engines[0] for engine in engines)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
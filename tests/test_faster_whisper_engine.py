@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Unit tests for the faster-whisper engine model handling."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.engines.faster_whisper import FasterWhisperEngine
+
+
+@pytest.fixture
+def engine():
+    """Create an engine whose model loading is mocked out."""
+    engine = FasterWhisperEngine({"device": "cpu", "model_cache_size": 2})
+    engine._load_model = MagicMock(side_effect=lambda name, device, compute_type: MagicMock(name=name))
+    return engine
+
+
+class TestModelCache:
+    """Test cases for the per-model LRU cache."""
+
+    def test_defaults_to_int8_on_cpu(self, engine):
+        """Test the compute type used when none is configured."""
+        engine._get_model("base")
+
+        engine._load_model.assert_called_once_with("base", "cpu", "int8")
+
+    def test_reuses_loaded_model(self, engine):
+        """Test that a model is only loaded once."""
+        first = engine._get_model("base")
+        second = engine._get_model("base")
+
+        assert first is second
+        assert engine._load_model.call_count == 1
+
+    def test_different_model_is_loaded(self, engine):
+        """Test that asking for another model does not reuse the first."""
+        base = engine._get_model("base")
+        small = engine._get_model("small")
+
+        assert base is not small
+        assert engine._load_model.call_count == 2
+
+    def test_evicts_least_recently_used(self, engine):
+        """Test that the cache is bounded by model_cache_size."""
+        engine._get_model("base")
+        engine._get_model("small")
+        engine._get_model("base")
+        engine._get_model("medium")
+
+        assert [key[0] for key in engine._models] == ["base", "medium"]
+
+    def test_unload_clears_models(self, engine):
+        """Test that unload drops every cached model."""
+        engine._get_model("base")
+        engine.unload()
+
+        assert len(engine._models) == 0
+
+
+class TestTranscribeBatch:
+    """Test cases for FasterWhisperEngine.transcribe_batch."""
+
+    @pytest.fixture
+    def batch_engine(self):
+        """Create an engine whose model returns one segment per file."""
+        engine = FasterWhisperEngine({
+            "device": "cpu",
+            "vad_filter": False,
+            "condition_on_previous_text": True,
+        })
+        whisper_model = MagicMock()
+        whisper_model.transcribe.side_effect = lambda audio, **kwargs: (
+            iter([SimpleNamespace(start=0.0, end=1.0, text=Path(audio).stem)]),
+            SimpleNamespace(language="en", duration=1.0, language_probability=1.0),
+        )
+        engine._load_model = MagicMock(return_value=whisper_model)
+        return engine
+
+    def test_results_in_order_with_one_load(self, batch_engine, tmp_path):
+        """Test that every file is transcribed with a single model load."""
+        files = [tmp_path / "a.wav", tmp_path / "missing.wav", tmp_path / "b.wav"]
+        files[0].touch()
+        files[2].touch()
+
+        async def collect():
+            return [r async for r in batch_engine.transcribe_batch(files, output_format="txt")]
+
+        results = asyncio.run(collect())
+
+        assert [r.success for r in results] == [True, False, True]
+        assert [r.text for r in results if r.success] == ["a", "b"]
+        assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "b\n"
+        assert batch_engine._load_model.call_count == 1
+
+    def test_initial_prompt_encoded_once(self, batch_engine, tmp_path):
+        """Test that a configured prompt is tokenized once and reused."""
+        batch_engine.config["initial_prompt"] = "Glossary: CTranslate2"
+        whisper_model = batch_engine._load_model.return_value
+        whisper_model.hf_tokenizer.encode.return_value = SimpleNamespace(ids=[1, 2, 3])
+        files = [tmp_path / "a.wav", tmp_path / "b.wav"]
+        for file_path in files:
+            file_path.touch()
+
+        async def collect():
+            return [r async for r in batch_engine.transcribe_batch(files, output_format="txt")]
+
+        results = asyncio.run(collect())
+
+        assert whisper_model.hf_tokenizer.encode.call_count == 1
+        assert all(
+            call.kwargs["initial_prompt"] == [1, 2, 3]
+            for call in whisper_model.transcribe.call_args_list
+        )
+        assert results[0].metadata["options"]["initial_prompt"] == "Glossary: CTranslate2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Unit tests for the transcription result cache."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.engines.base import TranscriptionResult
+from whisper_subtitle.core.result_cache import ResultCache, hash_file
+
+
+def make_result(tmp_path, name, content):
+    """Create a successful result with an output file."""
+    output_path = tmp_path / f"{name}.srt"
+    output_path.write_bytes(content)
+    return TranscriptionResult(success=True, output_path=output_path, text=name)
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hash_file_depends_on_content(self, tmp_path):
+        """Test that equal contents hash equally regardless of name."""
+        (tmp_path / "a.wav").write_bytes(b"audio")
+        (tmp_path / "b.wav").write_bytes(b"audio")
+        (tmp_path / "c.wav").write_bytes(b"other")
+
+        assert hash_file(tmp_path / "a.wav") == hash_file(tmp_path / "b.wav")
+        assert hash_file(tmp_path / "a.wav") != hash_file(tmp_path / "c.wav")
+
+    def test_hit_writes_output_to_new_path(self, tmp_path):
+        """Test that a hit copies the cached output where it's requested."""
+        cache = ResultCache(max_bytes=1024)
+        target = tmp_path / "out" / "copy.srt"
+
+        async def run():
+            await cache.put("key", make_result(tmp_path, "first", b"1\nsubtitle\n"))
+            return await cache.get("key", target)
+
+        result = asyncio.run(run())
+
+        assert result.text == "first"
+        assert result.output_path == target
+        assert result.metadata["cache_hit"] is True
+        assert target.read_bytes() == b"1\nsubtitle\n"
+
+    def test_memory_budget_evicts_oldest(self, tmp_path):
+        """Test that entries beyond max_bytes are evicted LRU first."""
+        cache = ResultCache(max_bytes=10)
+
+        async def run():
+            await cache.put("a", make_result(tmp_path, "a", b"12345"))
+            await cache.put("b", make_result(tmp_path, "b", b"12345"))
+            await cache.put("c", make_result(tmp_path, "c", b"12345"))
+            return await cache.get("a", tmp_path / "x.srt"), await cache.get("c", tmp_path / "y.srt")
+
+        evicted, kept = asyncio.run(run())
+
+        assert evicted is None
+        assert kept is not None
+
+    def test_persisted_entries_survive_new_cache(self, tmp_path):
+        """Test that a cache directory gives hits across instances."""
+        cache_dir = tmp_path / "cache"
+
+        async def run():
+            await ResultCache(1024, cache_dir).put("key", make_result(tmp_path, "saved", b"data"))
+            return await ResultCache(1024, cache_dir).get("key", tmp_path / "restored.srt")
+
+        result = asyncio.run(run())
+
+        assert result.text == "saved"
+        assert (tmp_path / "restored.srt").read_bytes() == b"data"
+
+    def test_key_depends_on_engine_config(self):
+        """Test that changing engine options changes the key."""
+        first = ResultCache.make_key("d", "fw", "base", "en", "srt", {"initial_prompt": "first"})
+        second = ResultCache.make_key("d", "fw", "base", "en", "srt", {"initial_prompt": "second"})
+        reordered = ResultCache.make_key("d", "fw", "base", "en", "srt", {"b": 1, "a": 2})
+
+        assert first != second
+        assert reordered == ResultCache.make_key("d", "fw", "base", "en", "srt", {"a": 2, "b": 1})
+
+    def test_disk_budget_evicts_oldest(self, tmp_path):
+        """Test that persisted entries are bounded by max_disk_bytes."""
+        cache_dir = tmp_path / "cache"
+        cache = ResultCache(1024, cache_dir)
+
+        async def run():
+            await cache.put("a", make_result(tmp_path, "a", b"12345"))
+            # Room for exactly one entry
+            cache._max_disk_bytes = (cache_dir / "a.pkl").stat().st_size
+            await cache.put("b", make_result(tmp_path, "b", b"12345"))
+
+        asyncio.run(run())
+
+        assert [p.name for p in cache_dir.glob("*.pkl")] == ["b.pkl"]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
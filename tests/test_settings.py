@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Unit tests for settings loading."""
+
+import os
+import pickle
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.config import settings as settings_module
+
+
+@pytest.fixture
+def isolated_env(tmp_path, monkeypatch):
+    """Run with a private cache dir and working directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestLoadSettings:
+    """Test cases for the pickled settings cache."""
+
+    def test_reuses_cached_settings(self, isolated_env):
+        """Test that a second load is served from the cache file."""
+        first = settings_module._load_settings()
+
+        assert settings_module._settings_cache_path().exists()
+        second = settings_module._load_settings()
+        assert second is not first
+        assert second.model_dump() == first.model_dump()
+        assert (isolated_env / "output").is_dir()
+
+    def test_environment_change_invalidates_cache(self, isolated_env, monkeypatch):
+        """Test that changed environment variables are not masked by the cache."""
+        assert settings_module._load_settings().port == 8000
+
+        monkeypatch.setenv("WHISPER_SUBTITLE_PORT", "9000")
+        assert settings_module._load_settings().port == 9000
+
+    def test_env_file_change_invalidates_cache(self, isolated_env):
+        """Test that editing .env is picked up."""
+        settings_module._load_settings()
+
+        (isolated_env / ".env").write_text("WHISPER_SUBTITLE_PORT=9100\n")
+        assert settings_module._load_settings().port == 9100
+
+
+    def test_cache_file_is_private(self, isolated_env, monkeypatch):
+        """Test that the cache is owner-only and stores no raw environment values."""
+        monkeypatch.setenv("WHISPER_SUBTITLE_ALIBABA_ACCESS_KEY_SECRET", "s3cret")
+        settings_module._load_settings()
+
+        cache_path = settings_module._settings_cache_path()
+        assert cache_path.stat().st_mode & 0o777 == 0o600
+        with open(cache_path, "rb") as f:
+            key, _ = pickle.load(f)
+        assert "s3cret" not in repr(key)
+
+    def test_shared_cache_file_is_ignored(self, isolated_env, monkeypatch):
+        """Test that a cache others can write to is not unpickled."""
+        settings_module._load_settings()
+        cache_path = settings_module._settings_cache_path()
+        os.chmod(cache_path, 0o666)
+
+        def fail_load(f):
+            raise AssertionError("shared cache was unpickled")
+
+        monkeypatch.setattr(pickle, "load", fail_load)
+        assert settings_module._load_settings().port == 8000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
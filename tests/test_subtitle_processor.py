@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Unit tests for subtitle processing utilities."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.utils.subtitle import SubtitleProcessor
+
+
+def make_segments():
+    """Build a small set of segments covering filter, merge and split cases."""
+    return [
+        {'start': 0.0, 'end': 0.05, 'text': 'uh'},
+        {'start': 0.1, 'end': 1.0, 'text': 'Hello there.'},
+        {'start': 1.2, 'end': 2.0, 'text': 'How are you?'},
+        {'start': 2.5, 'end': 3.0, 'text': '   '},
+        {'start': 5.0, 'end': 20.0, 'text': 'This is a long sentence. It keeps going. And going on.'},
+        {'start': 20.5, 'end': 21.0, 'text': 'Bye.'},
+    ]
+
+
+class TestSubtitleProcessorPostprocess:
+    """Test cases for SubtitleProcessor.postprocess."""
+
+    def test_no_options_returns_segments(self):
+        """Test that postprocess without options keeps every segment."""
+        result = SubtitleProcessor.postprocess(make_segments())
+        assert [s['text'] for s in result] == [s['text'] for s in make_segments()]
+        assert [s['sequence'] for s in result] == list(range(1, 7))
+
+    @pytest.mark.parametrize("filter_, merge, split", [
+        (True, False, False),
+        (False, True, False),
+        (False, False, True),
+        (True, True, False),
+        (True, False, True),
+        (False, True, True),
+        (True, True, True),
+    ])
+    def test_matches_chained_processing(self, filter_, merge, split):
+        """Test that the fused pass matches filter -> merge -> split."""
+        expected = make_segments()
+        if filter_:
+            expected = SubtitleProcessor.filter_segments(expected, min_duration=0.5, min_chars=1)
+        if merge:
+            expected = SubtitleProcessor.merge_segments(expected, max_duration=10.0)
+        if split:
+            expected = SubtitleProcessor.split_long_segments(expected, max_duration=10.0, max_chars=40)
+
+        result = SubtitleProcessor.postprocess(
+            make_segments(),
+            filter=filter_,
+            merge=merge,
+            split=split,
+            min_duration=0.5,
+            max_duration=10.0,
+            max_chars=40
+        )
+
+        assert result == expected
+
+    def test_empty_segments(self):
+        """Test postprocess with no segments."""
+        assert SubtitleProcessor.postprocess([], filter=True, merge=True, split=True) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Unit tests for the transcription service."""
+
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.config.settings import Settings
+from whisper_subtitle.core.engines.base import BaseEngine, TranscriptionResult
+from whisper_subtitle.core.engines.registry import EngineRegistry
+from whisper_subtitle.core.transcription import TranscriptionService
+
+
+class LoadTrackingEngine(BaseEngine):
+    """Engine that records which models are loaded."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.loaded = []
+
+    async def load_model(self, model):
+        self.loaded.append(model)
+
+    def unload_model(self, model):
+        self.loaded.remove(model)
+
+    async def transcribe(self, file_path, **kwargs):
+        raise NotImplementedError
+
+    @classmethod
+    def is_available(cls, config=None):
+        return True
+
+    def get_models(self):
+        return []
+
+    def get_languages(self):
+        return []
+
+
+class SlowLoadingEngine(LoadTrackingEngine):
+    """Engine whose model takes a moment to load."""
+
+    async def load_model(self, model):
+        await asyncio.sleep(0.01)
+        await super().load_model(model)
+
+
+class CountingEngine(LoadTrackingEngine):
+    """Engine that counts transcriptions and writes a fixed output."""
+
+    calls = 0
+
+    async def transcribe(self, file_path, output_path=None, **kwargs):
+        type(self).calls += 1
+        await asyncio.sleep(0.01)
+        output_path.write_text("1\nsubtitle\n", encoding="utf-8")
+        return TranscriptionResult(success=True, output_path=output_path, text="subtitle")
+
+
+@pytest.fixture
+def service():
+    """Create a service backed by a private registry."""
+    service = TranscriptionService(Settings(max_loaded_models=2))
+    service.engine_registry = EngineRegistry()
+    service.engine_registry.register("tracking", LoadTrackingEngine)
+    return service
+
+
+class TestReadyEngines:
+    """Test cases for the loaded engine/model cache."""
+
+    def test_model_is_loaded_once(self, service):
+        """Test that repeated requests reuse the loaded model."""
+        async def run():
+            await service.preload("tracking", "base")
+            return await service.preload("tracking", "base")
+
+        engine = asyncio.run(run())
+
+        assert engine.loaded == ["base"]
+
+    def test_least_recently_used_model_is_unloaded(self, service):
+        """Test that the cache is bounded by max_loaded_models."""
+        async def run():
+            for model in ("base", "small", "base", "medium"):
+                engine = await service.preload("tracking", model)
+            return engine
+
+        engine = asyncio.run(run())
+
+        assert engine.loaded == ["base", "medium"]
+        assert list(service._ready) == [("tracking", "base"), ("tracking", "medium")]
+
+    def test_service_is_reusable_across_event_loops(self, service):
+        """Test that concurrent loads work in a second asyncio.run call."""
+        service.engine_registry.register("slow", SlowLoadingEngine)
+
+        async def run(models):
+            return await asyncio.gather(*(service.preload("slow", model) for model in models))
+
+        asyncio.run(run(["base", "small"]))
+        engines = asyncio.run(run(["medium", "large"]))
+
+        assert sorted(engines[0].loaded) == ["large", "medium"]
+
+
+class TestInflightRequests:
+    """Test cases for coalescing identical concurrent requests."""
+
+    def test_identical_requests_share_one_run(self, tmp_path):
+        """Test that a duplicate request waits for and reuses the first."""
+        service = TranscriptionService(Settings(result_cache_persist=False))
+        service.engine_registry = EngineRegistry()
+        service.engine_registry.register("counting", CountingEngine)
+        CountingEngine.calls = 0
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"audio")
+
+        async def run():
+            return await asyncio.gather(
+                service.transcribe_file(audio, "counting", "base", output_path=tmp_path / "first.srt"),
+                service.transcribe_file(audio, "counting", "base", output_path=tmp_path / "second.srt"),
+            )
+
+        results = asyncio.run(run())
+
+        # Hashing runs in the executor, so either request may start first
+        hits = [result for result in results if (result.metadata or {}).get("cache_hit")]
+        assert CountingEngine.calls == 1
+        assert len(hits) == 1
+        for name in ("first.srt", "second.srt"):
+            assert (tmp_path / name).read_text(encoding="utf-8") == "1\nsubtitle\n"
+        assert service._inflight == {}
+
+
+class TestTranscribeBatch:
+    """Test cases for TranscriptionService.transcribe_batch."""
+
+    def test_yields_every_file_including_failures(self, tmp_path):
+        """Test that failures come back as results rather than being dropped."""
+        service = TranscriptionService(Settings(result_cache_enabled=False))
+        service.engine_registry = EngineRegistry()
+        service.engine_registry.register("counting", CountingEngine)
+        (tmp_path / "a.wav").write_bytes(b"a")
+        (tmp_path / "b.wav").write_bytes(b"b")
+        files = [tmp_path / "a.wav", tmp_path / "missing.wav", tmp_path / "b.wav"]
+
+        async def collect():
+            return [
+                r async for r in service.transcribe_batch(
+                    files, "counting", "base", output_dir=tmp_path / "out"
+                )
+            ]
+
+        results = asyncio.run(collect())
+
+        assert len(results) == 3
+        failures = [r for r in results if not r.success]
+        assert [r.metadata["file_path"] for r in failures] == [str(tmp_path / "missing.wav")]
+        assert sorted(r.output_path.name for r in results if r.success) == ["a.srt", "b.srt"]
+
+
+class TestCompatibilityWrappers:
+    """Test cases for the methods kept from the former core.transcriber service."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Create a service that writes generated outputs under tmp_path."""
+        service = TranscriptionService(Settings(result_cache_enabled=False, output_dir=tmp_path / "out"))
+        service.engine_registry = EngineRegistry()
+        service.engine_registry.register("counting", CountingEngine)
+        return service
+
+    def test_batch_transcribe_keeps_input_order(self, service, tmp_path):
+        """Test that results line up with the inputs, failures included."""
+        (tmp_path / "a.wav").write_bytes(b"a")
+        (tmp_path / "b.wav").write_bytes(b"b")
+        files = [tmp_path / "a.wav", tmp_path / "missing.wav", tmp_path / "b.wav"]
+
+        results = asyncio.run(service.batch_transcribe(files, engine_name="counting", model_name="base"))
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].output_path.name.startswith("a_")
+        assert results[1].metadata["file_path"] == str(tmp_path / "missing.wav")
+        assert results[2].output_path.name.startswith("b_")
+
+    def test_json_output_is_built_from_the_result(self, service, tmp_path):
+        """Test that json output is written and the intermediate file removed."""
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"audio")
+
+        result = asyncio.run(service.transcribe_video(
+            audio, engine_name="counting", model_name="base", output_format="json",
+            output_path=tmp_path / "a.json"
+        ))
+
+        assert result.output_path == tmp_path / "a.json"
+        assert json.loads(result.output_path.read_text(encoding="utf-8"))["text"] == "subtitle"
+        assert list((tmp_path / "out").iterdir()) == []
+
+    def test_unregistered_engine_fails_clearly(self, service, tmp_path):
+        """Test that an engine the registry lacks is reported, not ignored."""
+        audio = tmp_path / "a.wav"
+        audio.write_bytes(b"audio")
+
+        with pytest.raises(ValueError, match="Engine not available: whispercpp"):
+            asyncio.run(service.transcribe_audio(audio, engine_name="whispercpp"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
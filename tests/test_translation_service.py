@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Unit tests for translation service."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+import json
 import sys
 from pathlib import Path
 
@@ -12,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from whisper_subtitle.services.translation import (
     TranslationService,
     TranslationConfig,
+    TranslationCache,
     SubtitleEntry
 )
 
@@ -234,6 +237,255 @@ This is a test.
         assert "00:00:01,000 --> 00:00:03,000" in result
         assert "00:00:04,000 --> 00:00:06,000" in result
     
+    @patch('whisper_subtitle.services.translation.mt_models')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_translate_texts_uses_batch_endpoint(self, mock_available, mock_mt_models):
+        """Test that texts are sent to the batch endpoint in chunks."""
+        mock_mt_models.GetBatchTranslateRequest.side_effect = lambda **kwargs: kwargs
+        
+        def batch_translate(request, runtime):
+            source = json.loads(request["source_text"])
+            response = Mock()
+            response.body.code = 200
+            response.body.translated_list = [
+                {"index": index, "translated": text.upper(), "code": "200"}
+                for index, text in source.items()
+            ]
+            return response
+        
+        service = TranslationService()
+        service._runtime = Mock()
+        service.client = Mock()
+        service.client.get_batch_translate_with_options = Mock(side_effect=batch_translate)
+        
+        texts = [f"line {i}" for i in range(120)] + [""]
+        results = await service.translate_texts(texts, "en", "es")
+        
+        assert results == [text.upper() for text in texts]
+        assert service.client.get_batch_translate_with_options.call_count == 3
+
+    @patch('whisper_subtitle.services.translation.cld3')
+    @patch('whisper_subtitle.services.translation.mt_models')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_translate_texts_detects_auto_source_locally(self, mock_available, mock_mt_models, mock_cld3):
+        """Test that a locally detected source language is sent explicitly."""
+        mock_cld3.get_language.return_value = Mock(language="fr", is_reliable=True)
+        mock_mt_models.GetBatchTranslateRequest.side_effect = lambda **kwargs: kwargs
+
+        def batch_translate(request, runtime):
+            response = Mock()
+            response.body.code = 200
+            response.body.translated_list = [{"index": "0", "translated": "Hello", "code": "200"}]
+            return response
+
+        service = TranslationService()
+        service._runtime = Mock()
+        service.client = Mock()
+        service.client.get_batch_translate_with_options = Mock(side_effect=batch_translate)
+
+        results = await service.translate_texts(["Bonjour"], "auto", "en")
+
+        assert results == ["Hello"]
+        request = service.client.get_batch_translate_with_options.call_args[0][0]
+        assert request["source_language"] == "fr"
+
+    @patch('whisper_subtitle.services.translation.cld3')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_translate_texts_skips_text_already_in_target(self, mock_available, mock_cld3):
+        """Test that texts detected as the target language are not sent."""
+        mock_cld3.get_language.return_value = Mock(language="en", is_reliable=True)
+
+        service = TranslationService()
+        service.client = Mock()
+
+        results = await service.translate_texts(["Hello there"], "auto", "en")
+
+        assert results == ["Hello there"]
+        service.client.get_batch_translate_with_options.assert_not_called()
+
+    @patch('whisper_subtitle.services.translation.TranslationService.translate_texts')
+    async def test_translate_subtitle_file_deduplicates_cues(self, mock_translate_texts):
+        """Test that repeated cues are translated only once."""
+        mock_translate_texts.side_effect = lambda texts, source, target, strict=False: [f"es:{t}" for t in texts]
+        
+        service = TranslationService()
+        srt_content = """1
+00:00:01,000 --> 00:00:02,000
+[Music]
+
+2
+00:00:03,000 --> 00:00:04,000
+Hello
+
+3
+00:00:05,000 --> 00:00:06,000
+[Music]
+"""
+        
+        result = await service.translate_subtitle_file(srt_content, "en", "es")
+        
+        mock_translate_texts.assert_called_once_with(["[Music]", "Hello"], "en", "es", strict=False)
+        assert result.count("es:[Music]") == 2
+        assert "es:Hello" in result
+    
+    @patch('whisper_subtitle.services.translation.TranslationService.translate_texts')
+    async def test_translate_subtitle_file_path_streams_windows(self, mock_translate_texts, tmp_path):
+        """Test that a subtitle file is translated window by window."""
+        mock_translate_texts.side_effect = lambda texts, source, target, strict=False: [f"es:{t}" for t in texts]
+        
+        input_path = tmp_path / "input.srt"
+        output_path = tmp_path / "output.srt"
+        input_path.write_text(
+            "".join(f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\nLine {i}\n\n" for i in range(1, 6)),
+            encoding="utf-8"
+        )
+        
+        service = TranslationService()
+        service.STREAM_WINDOW = 2
+        
+        success = await service.translate_subtitle_file_path(
+            str(input_path), str(output_path), "en", "es", buffer_size=4096
+        )
+        
+        assert success
+        assert mock_translate_texts.call_count == 3
+        expected = "".join(
+            f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\nes:Line {i}\n\n" for i in range(1, 6)
+        )
+        assert output_path.read_text(encoding="utf-8") == expected
+        assert not (tmp_path / "output.srt.tmp").exists()
+
+    @patch('whisper_subtitle.services.translation.TranslationService.translate_texts')
+    async def test_translate_subtitle_file_path_failure_keeps_output(self, mock_translate_texts, tmp_path):
+        """Test that a failed translation leaves the previous output untouched."""
+        mock_translate_texts.side_effect = Exception("API Error")
+
+        input_path = tmp_path / "input.srt"
+        output_path = tmp_path / "output.srt"
+        input_path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n", encoding="utf-8")
+        output_path.write_text("previous", encoding="utf-8")
+
+        service = TranslationService()
+        success = await service.translate_subtitle_file_path(str(input_path), str(output_path), "en", "es")
+
+        assert not success
+        assert output_path.read_text(encoding="utf-8") == "previous"
+        assert not (tmp_path / "output.srt.tmp").exists()
+
+    @patch('whisper_subtitle.services.translation.mt_models')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_translate_subtitle_file_path_fallback_keeps_output(self, mock_available, mock_mt_models, tmp_path):
+        """Test that text falling back to the original is not written as a translation."""
+        mock_mt_models.GetBatchTranslateRequest.side_effect = lambda **kwargs: kwargs
+        mock_mt_models.TranslateGeneralRequest.side_effect = lambda **kwargs: kwargs
+
+        input_path = tmp_path / "input.srt"
+        output_path = tmp_path / "output.srt"
+        input_path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n", encoding="utf-8")
+        output_path.write_text("previous", encoding="utf-8")
+
+        service = TranslationService()
+        service._runtime = Mock()
+        service.client = Mock()
+        service.client.get_batch_translate_with_options = Mock(side_effect=Exception("API Error"))
+        service.client.translate_general_with_options = Mock(side_effect=Exception("API Error"))
+
+        success = await service.translate_subtitle_file_path(
+            str(input_path), str(output_path), "en", "es", strict=True
+        )
+
+        assert not success
+        assert output_path.read_text(encoding="utf-8") == "previous"
+        assert not (tmp_path / "output.srt.tmp").exists()
+
+    @patch('whisper_subtitle.services.translation.mt_models')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_translate_subtitle_file_path_keeps_untranslated_cues_by_default(self, mock_available, mock_mt_models, tmp_path):
+        """Test that without strict mode a failed cue is written untranslated."""
+        mock_mt_models.GetBatchTranslateRequest.side_effect = lambda **kwargs: kwargs
+        mock_mt_models.TranslateGeneralRequest.side_effect = lambda **kwargs: kwargs
+
+        input_path = tmp_path / "input.srt"
+        output_path = tmp_path / "output.srt"
+        input_path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n", encoding="utf-8")
+
+        service = TranslationService()
+        service._runtime = Mock()
+        service.client = Mock()
+        service.client.get_batch_translate_with_options = Mock(side_effect=Exception("API Error"))
+        service.client.translate_general_with_options = Mock(side_effect=Exception("API Error"))
+
+        success = await service.translate_subtitle_file_path(str(input_path), str(output_path), "en", "es")
+
+        assert success
+        assert "Hello" in output_path.read_text(encoding="utf-8")
+
+    @patch('whisper_subtitle.services.translation.mt_models')
+    @patch('whisper_subtitle.services.translation.TranslationService.is_available', return_value=True)
+    async def test_strict_translate_texts_cancels_other_chunks(self, mock_available, mock_mt_models):
+        """Test that a failed chunk stops the chunks still running."""
+        cancelled = []
+
+        async def translate_chunk(texts, source_lang, target_lang, strict=False):
+            if texts[0] == "line 0":
+                raise RuntimeError("API Error")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(texts[0])
+                raise
+
+        service = TranslationService()
+        service._translate_chunk = translate_chunk
+
+        texts = [f"line {i}" for i in range(service.BATCH_TRANSLATE_LIMIT * 2)]
+        with pytest.raises(RuntimeError):
+            await service.translate_texts(texts, "en", "es", strict=True)
+        await asyncio.sleep(0)
+
+        assert cancelled == [f"line {service.BATCH_TRANSLATE_LIMIT}"]
+
+    @patch('whisper_subtitle.services.translation.TranslationService.translate_texts')
+    async def test_translate_subtitle_file_path_same_language_copies(self, mock_translate_texts, tmp_path):
+        """Test that translating into the source language copies the file."""
+        input_path = tmp_path / "input.srt"
+        output_path = tmp_path / "output.srt"
+        input_path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n\n", encoding="utf-8")
+
+        service = TranslationService()
+        success = await service.translate_subtitle_file_path(str(input_path), str(output_path), "en", "en")
+
+        assert success
+        mock_translate_texts.assert_not_called()
+        assert output_path.read_bytes() == input_path.read_bytes()
+
+    async def test_async_context_manages_request_pool(self):
+        """Test that the async context opens and closes the request pool."""
+        service = TranslationService(max_connections=4)
+        
+        async with service as entered:
+            assert entered is service
+            assert service._executor is not None
+            assert service._executor._max_workers == 4
+        
+        assert service._executor is None
+
+    async def test_async_context_can_be_reentered(self, tmp_path):
+        """Test that leaving the context keeps the cache for the next entry."""
+        cache = TranslationCache(tmp_path / "cache.sqlite3")
+        service = TranslationService(max_connections=2, cache=cache)
+
+        async with service:
+            pass
+
+        assert service.cache is cache
+
+        async with service:
+            assert service._executor is not None
+
+        service.close()
+        assert service.cache is None
+
     async def test_translate_empty_srt_file(self):
         """Test translating empty SRT file."""
         service = TranslationService()
@@ -283,6 +535,44 @@ class TestSubtitleEntry:
         assert entry1 != entry3
 
 
+class TestTranslationCache:
+    """Test cases for TranslationCache."""
+    
+    def test_set_and_get(self, tmp_path):
+        """Test storing and retrieving a translation."""
+        cache = TranslationCache(tmp_path / "mt.sqlite3")
+        key = cache.make_key("en", "es", "Hello, world!")
+        
+        assert cache.get(key) is None
+        cache.set(key, "Hola, mundo!")
+        assert cache.get(key) == "Hola, mundo!"
+        cache.close()
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that translations survive reopening the cache."""
+        path = tmp_path / "mt.sqlite3"
+        cache = TranslationCache(path)
+        key = cache.make_key("en", "es", "Hello, world!")
+        cache.set(key, "Hola, mundo!")
+        cache.close()
+        
+        reopened = TranslationCache(path)
+        assert reopened.get(key) == "Hola, mundo!"
+        reopened.close()
+    
+    def test_expired_entry_is_ignored(self, tmp_path):
+        """Test that expired translations are not returned."""
+        cache = TranslationCache(tmp_path / "mt.sqlite3", expire=-1)
+        key = cache.make_key("en", "es", "Hello, world!")
+        cache.set(key, "Hola, mundo!")
+        assert cache.get(key) is None
+        cache.close()
+    
+    def test_key_depends_on_languages(self):
+        """Test that the key includes the language pair."""
+        assert TranslationCache.make_key("en", "es", "Hi") != TranslationCache.make_key("en", "fr", "Hi")
+
+
 class TestTranslationConfig:
     """Test cases for TranslationConfig."""
     
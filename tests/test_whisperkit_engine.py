@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Unit tests for the WhisperKit engine."""
+
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from whisper_subtitle.core.engines.whisperkit import WhisperKitEngine
+
+
+class TestVersionProbe:
+    """Test cases for the cached CLI version."""
+
+    def test_failed_probe_is_cached(self, tmp_path):
+        """Test that a missing CLI is only probed once."""
+        engine = WhisperKitEngine({"cli_path": str(tmp_path / "whisperkit-cli")})
+
+        assert asyncio.run(engine._get_version()) == "unknown"
+        assert engine._cached_version == "unknown"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])